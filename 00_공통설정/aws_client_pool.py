@@ -0,0 +1,131 @@
+import hashlib
+import threading
+from typing import Dict
+
+import boto3
+from botocore.config import Config
+
+# 클라이언트별 HTTP 연결 풀 크기 (동시 수집 스레드 수 이상)
+DEFAULT_MAX_POOL_CONNECTIONS = 20
+
+
+class AWSClientPool:
+    def __init__(self, max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS):
+        """
+        계정별 boto3 세션과 (계정, 리전, 서비스)별 클라이언트를 재사용하는 레지스트리
+
+        클라이언트 생성 시 엔드포인트/서비스 모델을 읽고 새 연결 풀을 만드는 비용을
+        한 번만 치르며, keep-alive HTTP 연결을 여러 호출과 점검 주기에 걸쳐 재사용합니다.
+        boto3 클라이언트는 스레드 간 공유가 안전하지만 세션은 그렇지 않으므로
+        세션/클라이언트 생성은 잠금 안에서만 수행합니다.
+
+        Args:
+            max_pool_connections: 클라이언트별 최대 HTTP 연결 수
+        """
+        self.base_config = Config(
+            max_pool_connections=max_pool_connections,
+            tcp_keepalive=True
+        )
+        self._sessions = {}
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _account_key(access_key_id: str = None, secret_access_key: str = None) -> str:
+        """자격 증명별 키 (시크릿 키는 해시로만 보관)"""
+        if not access_key_id:
+            return '__default__'
+        secret_hash = hashlib.sha256((secret_access_key or '').encode('utf-8')).hexdigest()[:16]
+        return f"{access_key_id}:{secret_hash}"
+
+    def get_session(self, access_key_id: str = None, secret_access_key: str = None) -> boto3.session.Session:
+        """
+        자격 증명별 boto3 세션 반환 (없으면 생성)
+
+        Args:
+            access_key_id: AWS 액세스 키 ID (None이면 기본 자격 증명)
+            secret_access_key: AWS 시크릿 액세스 키
+
+        Returns:
+            boto3 세션
+        """
+        key = self._account_key(access_key_id, secret_access_key)
+        with self._lock:
+            return self._get_session_locked(key, access_key_id, secret_access_key)
+
+    def _get_session_locked(self, key: str, access_key_id: str, secret_access_key: str) -> boto3.session.Session:
+        """세션 조회/생성 (잠금 상태에서 호출)"""
+        session = self._sessions.get(key)
+        if session is None:
+            if access_key_id:
+                session = boto3.session.Session(
+                    aws_access_key_id=access_key_id,
+                    aws_secret_access_key=secret_access_key
+                )
+            else:
+                session = boto3.session.Session()
+            self._sessions[key] = session
+        return session
+
+    def get_client(self, service_name: str, region_name: str, access_key_id: str = None,
+                   secret_access_key: str = None, config: Config = None):
+        """
+        (계정, 리전, 서비스)별 boto3 클라이언트 반환 (없으면 생성)
+
+        Args:
+            service_name: AWS 서비스 이름 (예: 'health')
+            region_name: 리전
+            access_key_id: AWS 액세스 키 ID (None이면 기본 자격 증명)
+            secret_access_key: AWS 시크릿 액세스 키
+            config: 추가 botocore 설정 (연결 풀 설정과 병합)
+
+        Returns:
+            boto3 클라이언트
+        """
+        account_key = self._account_key(access_key_id, secret_access_key)
+        key = (account_key, region_name, service_name)
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                session = self._get_session_locked(account_key, access_key_id, secret_access_key)
+                client_config = self.base_config.merge(config) if config else self.base_config
+                client = session.client(service_name, region_name=region_name, config=client_config)
+                self._clients[key] = client
+            return client
+
+    def stats(self) -> Dict:
+        """
+        풀 상태
+
+        Returns:
+            세션 수와 클라이언트 수
+        """
+        with self._lock:
+            return {'sessions': len(self._sessions), 'clients': len(self._clients)}
+
+    def clear(self):
+        """모든 세션과 클라이언트 제거 (자격 증명 변경 시)"""
+        with self._lock:
+            self._sessions.clear()
+            self._clients.clear()
+
+
+# 프로세스 전체에서 공유하는 클라이언트 풀
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> AWSClientPool:
+    """
+    프로세스 전체에서 공유하는 클라이언트 풀 반환
+
+    Returns:
+        공유 AWSClientPool 객체
+    """
+    global _shared_pool
+
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = AWSClientPool()
+        return _shared_pool
@@ -1,54 +1,183 @@
-import boto3
 import json
+from botocore.config import Config
 import os
+import threading
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Optional
-import pandas as pd
+from typing import List, Dict, Optional, Iterator
+from health_event import HealthEvent, ACCOUNT_EVENT_FIELDS
+from health_snapshot import HealthSnapshot
+from health_event_store import HealthEventStore, get_event_store
+from rate_limiter import get_shared_rate_limiter
+from event_detail_cache import get_detail_cache
+from aws_client_pool import get_client_pool
+
+# describe_event_details 한 번에 조회 가능한 최대 ARN 수
+EVENT_DETAILS_BATCH_SIZE = 10
+
+# describe_entity_aggregates 한 번에 조회 가능한 최대 ARN 수
+ENTITY_AGGREGATES_BATCH_SIZE = 50
+
+# describe_events 한 페이지당 최대 이벤트 수
+EVENTS_PAGE_SIZE = 100
+
+# describe_entity_aggregates_for_organization 한 번에 조회 가능한 최대 ARN/계정 수
+ORG_ENTITY_AGGREGATES_BATCH_SIZE = 25
+
+# 기본 조회 이벤트 카테고리
+DEFAULT_EVENT_CATEGORIES = ['issue', 'accountNotification', 'scheduledChange']
+
+# 증분 조회 시 워터마크보다 조금 앞선 시점부터 조회하여 지연 반영된 이벤트 누락 방지
+INCREMENTAL_OVERLAP = timedelta(minutes=5)
+
+# 증분 조회 누적 오차를 없애기 위한 전체 재조회 주기
+INCREMENTAL_FULL_REFRESH_INTERVAL = timedelta(hours=6)
+
+# 스로틀링과 연결 오류/5xx 재시도는 공유 속도 제한기가 담당하도록 botocore 자체 재시도 비활성화
+# (botocore 재시도와 겹치면 스로틀링 시 재시도 횟수가 곱으로 늘어남)
+HEALTH_CLIENT_CONFIG = Config(retries={'mode': 'standard', 'total_max_attempts': 1})
 
 class AWSHealthService:
-    def __init__(self, config_file: str = None, account_name: str = None):
+    # 계정별 증분 조회 상태 (이벤트 캐시, lastUpdatedTime 워터마크) - 모든 인스턴스가 공유
+    _incremental_states = {}
+    _incremental_locks = {}
+    _incremental_registry_lock = threading.Lock()
+    
+    def __init__(self, config_file: str = None, account_name: str = None,
+                 event_store: HealthEventStore = None):
         """
         AWS Health 서비스 클라이언트 초기화
         
+        생성 시에는 설정 파일만 읽고, AWS 클라이언트는 처음 API를 호출할 때 만들어집니다.
+        
         Args:
             config_file: AWS 계정 설정 파일 경로
             account_name: 사용할 계정 이름 (None이면 기본 계정 사용)
+            event_store: 이벤트 로컬 저장소 (None이면 설정 파일의 health_settings.event_store_path 사용)
         """
         # 설정 파일 경로 자동 결정
         if config_file is None:
-            # 현재 파일의 디렉토리에서 aws_config.json 찾기
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            config_file = os.path.join(current_dir, 'aws_config.json')
+            config_file = self.default_config_file()
         
         self.config = self.load_aws_config(config_file)
         self.current_account = self.get_account_config(account_name)
         
+        # 마지막 상세 정보 조회에서 실패한 이벤트 ARN과 오류 내용
+        self.failed_detail_arns = {}
+        
+        # 프로세스 내 모든 인스턴스가 공유하는 Health API 속도 제한기
+        health_settings = self.config.get('health_settings', {})
+        self.rate_limiter = get_shared_rate_limiter(health_settings.get('api_max_rate'))
+        
+        # (ARN, lastUpdatedTime) 기준 이벤트 상세 정보 캐시 - 프로세스 내 공유
+        detail_cache_path = health_settings.get('detail_cache_path')
+        if detail_cache_path:
+            detail_cache_path = os.path.join(os.path.dirname(os.path.abspath(config_file)), detail_cache_path)
+        self.detail_cache = get_detail_cache(
+            persist_path=detail_cache_path,
+            max_entries=health_settings.get('detail_cache_max_entries'),
+            max_bytes=int(health_settings.get('detail_cache_max_mb', 0) * 1024 * 1024)
+        )
+        
+        # 이벤트 로컬 저장소 (설정 파일 기준 상대 경로)
+        self.event_store = event_store
+        if self.event_store is None and health_settings.get('event_store_path'):
+            store_path = os.path.join(os.path.dirname(os.path.abspath(config_file)),
+                                      health_settings['event_store_path'])
+            try:
+                self.event_store = get_event_store(store_path)
+            except Exception as e:
+                print(f"⚠️ 이벤트 저장소 열기 실패: {e}")
+        
+        # AWS 클라이언트 (첫 API 호출 시 생성)
+        self._clients = {}
+        self._client_errors = {}
+    
+    @staticmethod
+    def default_config_file() -> str:
+        """
+        기본 설정 파일 경로 (이 파일과 같은 폴더의 aws_config.json)
+        
+        Returns:
+            설정 파일 경로
+        """
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        return os.path.join(current_dir, 'aws_config.json')
+    
+    @staticmethod
+    def list_accounts(config_file: str = None) -> List[str]:
+        """
+        AWS 클라이언트를 만들지 않고 설정 파일만 읽어 계정 목록 반환
+        
+        Args:
+            config_file: AWS 계정 설정 파일 경로 (None이면 기본 경로)
+            
+        Returns:
+            계정 이름 리스트
+        """
+        config_file = config_file or AWSHealthService.default_config_file()
+        
+        try:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except Exception:
+            return []
+        
+        return [account['name'] for account in config.get('aws_accounts', [])]
+    
+    @property
+    def health_client(self):
+        """Health API 클라이언트 (첫 사용 시 생성, 실패 시 None)"""
+        return self._get_client('health')
+    
+    @property
+    def organizations_client(self):
+        """Organizations API 클라이언트 (첫 사용 시 생성, 실패 시 None)"""
+        return self._get_client('organizations')
+    
+    def _get_client(self, service_name: str):
+        """
+        공유 클라이언트 풀에서 AWS 클라이언트를 가져오기 (처음 한 번만)
+        
+        Args:
+            service_name: AWS 서비스 이름
+            
+        Returns:
+            boto3 클라이언트 (생성 실패 시 None)
+        """
+        if service_name in self._clients:
+            return self._clients[service_name]
+        if service_name in self._client_errors:
+            return None
+        
+        config = HEALTH_CLIENT_CONFIG if service_name == 'health' else None
+        
         try:
+            # 프로세스 전체에서 공유하는 세션/클라이언트 풀에서 가져와 연결을 재사용
+            client_pool = get_client_pool()
             if self.current_account:
                 # 설정 파일의 자격 증명 사용
-                self.health_client = boto3.client(
-                    'health',
+                client = client_pool.get_client(
+                    service_name,
                     region_name=self.current_account['region'],
-                    aws_access_key_id=self.current_account['access_key_id'],
-                    aws_secret_access_key=self.current_account['secret_access_key']
+                    access_key_id=self.current_account['access_key_id'],
+                    secret_access_key=self.current_account['secret_access_key'],
+                    config=config
                 )
-                self.organizations_client = boto3.client(
-                    'organizations',
-                    region_name=self.current_account['region'],
-                    aws_access_key_id=self.current_account['access_key_id'],
-                    aws_secret_access_key=self.current_account['secret_access_key']
-                )
-                print(f"✅ AWS 계정 연결됨: {self.current_account['name']} ({self.current_account['description']})")
+                if service_name == 'health':
+                    print(f"✅ AWS 계정 연결됨: {self.current_account['name']} ({self.current_account['description']})")
             else:
                 # 기본 자격 증명 사용 (aws configure 또는 환경변수)
-                self.health_client = boto3.client('health', region_name='us-east-1')
-                self.organizations_client = boto3.client('organizations', region_name='us-east-1')
-                print("⚠️ 기본 AWS 자격 증명 사용 중")
+                client = client_pool.get_client(service_name, 'us-east-1', config=config)
+                if service_name == 'health':
+                    print("⚠️ 기본 AWS 자격 증명 사용 중")
                 
         except Exception as e:
             print(f"❌ AWS 클라이언트 초기화 실패: {e}")
-            self.health_client = None
-            self.organizations_client = None
+            self._client_errors[service_name] = str(e)
+            return None
+        
+        self._clients[service_name] = client
+        return client
     
     def load_aws_config(self, config_file: str) -> Dict:
         """
@@ -112,12 +241,119 @@ class AWSHealthService:
         
         return [account['name'] for account in self.config['aws_accounts']]
     
-    def get_service_health_events(self, days_back: int = 7) -> tuple[List[Dict], str]:
+    def _call_health_api(self, operation: str, **kwargs) -> Dict:
+        """
+        공유 속도 제한기를 거쳐 Health API 호출
+        
+        스로틀링 오류는 속도를 낮춘 뒤 지터가 적용된 백오프로 재시도합니다.
+        
+        Args:
+            operation: Health 클라이언트 메서드 이름 (예: 'describe_events')
+            **kwargs: API 요청 인자
+            
+        Returns:
+            API 응답 딕셔너리
+        """
+        return self.rate_limiter.call(getattr(self.health_client, operation), **kwargs)
+    
+    def iter_events(self, start_time: datetime = None, end_time: datetime = None,
+                    filters: Dict = None) -> Iterator[HealthEvent]:
+        """
+        AWS Health 이벤트를 페이지 단위로 조회하여 하나씩 반환하는 제너레이터
+        
+        nextToken을 따라 모든 페이지를 조회하며, 각 페이지의 상세 정보와
+        엔티티 수를 배치로 보강한 뒤 정규화된 이벤트를 반환합니다.
+        메모리 사용량은 페이지 크기로 제한되며, 호출자는 중간에 순회를 멈출 수 있습니다.
+        
+        Args:
+            start_time: 조회 시작 시간 (None이면 시작 시간 조건 없음)
+            end_time: 조회 종료 시간 (None이면 현재 시간)
+            filters: describe_events filter에 추가할 조건
+            
+        Yields:
+            정규화된 이벤트 (HealthEvent)
+        """
+        event_filter = dict(filters or {})
+        event_filter.setdefault('eventTypeCategories', DEFAULT_EVENT_CATEGORIES)
+        
+        if start_time is not None:
+            event_filter['startTimes'] = [{
+                'from': start_time,
+                'to': end_time or datetime.now(timezone.utc)
+            }]
+        
+        self.failed_detail_arns = {}
+        
+        for raw_events in self._iter_event_pages(event_filter):
+            yield from self._enrich_events(raw_events)
+    
+    def _iter_event_pages(self, event_filter: Dict) -> Iterator[List[Dict]]:
+        """
+        describe_events 응답을 페이지 단위로 반환 (상세 정보 보강 없음)
+        
+        Args:
+            event_filter: describe_events filter
+            
+        Yields:
+            페이지별 원본 이벤트 리스트
+        """
+        request = {'filter': event_filter, 'maxResults': EVENTS_PAGE_SIZE}
+        
+        while True:
+            response = self._call_health_api('describe_events', **request)
+            yield response.get('events', [])
+            
+            next_token = response.get('nextToken')
+            if not next_token:
+                break
+            request['nextToken'] = next_token
+    
+    def _enrich_events(self, raw_events: List[Dict]) -> List[HealthEvent]:
+        """
+        원본 이벤트에 상세 정보와 엔티티 수를 배치로 보강하여 정규화
+        
+        Args:
+            raw_events: describe_events 응답의 이벤트 리스트
+            
+        Returns:
+            정규화된 이벤트 리스트
+        """
+        event_arns = [event['arn'] for event in raw_events]
+        
+        # 캐시에 없는 이벤트의 상세 정보만 조회
+        event_details = {}
+        for event in raw_events:
+            detail = self.detail_cache.get(event['arn'], event.get('lastUpdatedTime'))
+            if detail is not None:
+                event_details[event['arn']] = detail
+        
+        fetched_details, failed_arns = self._get_event_details_batch(
+            [arn for arn in event_arns if arn not in event_details]
+        )
+        for event in raw_events:
+            if event['arn'] in fetched_details:
+                self.detail_cache.put(event['arn'], event.get('lastUpdatedTime'), fetched_details[event['arn']])
+        event_details.update(fetched_details)
+        
+        entity_counts = self._count_affected_entities_batch(event_arns)
+        self.failed_detail_arns.update(failed_arns)
+        
+        return [
+            HealthEvent.from_api(
+                event,
+                event_details.get(event['arn'], {}),
+                entity_counts.get(event['arn'], 0)
+            )
+            for event in raw_events
+        ]
+    
+    def get_service_health_events(self, days_back: int = 7, incremental: bool = True) -> tuple[List[HealthEvent], str]:
         """
         AWS 서비스 상태 이벤트 조회
         
         Args:
             days_back: 조회할 이전 일수
+            incremental: 이전 조회 결과를 재사용하고 변경된 이벤트만 조회할지 여부
             
         Returns:
             (이벤트 리스트, 상태 메시지) 튜플
@@ -130,54 +366,236 @@ class AWSHealthService:
             end_time = datetime.now(timezone.utc)
             start_time = end_time - timedelta(days=days_back)
             
-            # Health 이벤트 조회
-            response = self.health_client.describe_events(
-                filter={
-                    'startTimes': [
-                        {
-                            'from': start_time,
-                            'to': end_time
-                        }
-                    ],
-                    'eventTypeCategories': ['issue', 'accountNotification', 'scheduledChange']
-                }
-            )
-            
-            events = []
-            for event in response.get('events', []):
-                event_detail = self._get_event_details(event['arn'])
-                
-                events.append({
-                    'arn': event['arn'],
-                    'service': event.get('service', 'Unknown'),
-                    'event_type_category': event.get('eventTypeCategory', 'Unknown'),
-                    'event_type_code': event.get('eventTypeCode', 'Unknown'),
-                    'region': event.get('region', 'Global'),
-                    'status': event.get('statusCode', 'Unknown'),
-                    'start_time': event.get('startTime', ''),
-                    'end_time': event.get('endTime', ''),
-                    'last_updated_time': event.get('lastUpdatedTime', ''),
-                    'description': event_detail.get('description', ''),
-                    'affected_entities_count': self._count_affected_entities(event['arn'])
-                })
+            if incremental:
+                events = self._refresh_events_incremental(days_back, start_time, end_time)
+            else:
+                events = list(self.iter_events(start_time, end_time))
             
+            self.detail_cache.save_if_dirty()
             return events, "SUCCESS"
             
         except Exception as e:
-            error_msg = str(e)
             print(f"Health 이벤트 조회 실패: {e}")
+            return [], self._classify_error(e)
+    
+    def _incremental_key(self) -> str:
+        """증분 조회 상태를 구분하는 계정 키"""
+        return self.current_account['name'] if self.current_account else '__default__'
+    
+    def _refresh_events_incremental(self, days_back: int, start_time: datetime, end_time: datetime) -> List[HealthEvent]:
+        """
+        lastUpdatedTime 워터마크 기반 증분 조회
+        
+        첫 조회는 전체 기간을 조회하고, 이후에는 워터마크 이후 갱신된 이벤트만
+        조회하여 캐시에 병합합니다. 변경이 없으면 describe_events 한 번으로 끝납니다.
+        상세 정보 조회에 실패한 이벤트는 상태에 기록해 두고 다음 증분 조회에서 다시 조회합니다.
+        
+        Args:
+            days_back: 조회할 이전 일수
+            start_time: 조회 시작 시간
+            end_time: 조회 종료 시간
+            
+        Returns:
+            조회 기간에 해당하는 이벤트 리스트 (최근 갱신 순)
+        """
+        key = self._incremental_key()
+        with AWSHealthService._incremental_registry_lock:
+            lock = AWSHealthService._incremental_locks.setdefault(key, threading.Lock())
+        
+        with lock:
+            state = AWSHealthService._incremental_states.get(key)
+            if state is None:
+                # 프로세스 재시작 후에는 로컬 저장소의 이벤트와 워터마크에서 이어서 조회
+                state = self._load_incremental_state_from_store(key, end_time)
             
-            # 구체적인 오류 분류
-            if "Unable to locate credentials" in error_msg:
-                return [], "ERROR - AWS 자격 증명 없음"
-            elif "SubscriptionRequiredException" in error_msg:
-                return [], "ERROR - Business/Enterprise 지원 플랜 필요"
-            elif "AccessDenied" in error_msg:
-                return [], "ERROR - Health API 접근 권한 없음"
-            elif "InvalidUserID.NotFound" in error_msg:
-                return [], "ERROR - 존재하지 않는 계정"
+            if (state is None or state['days_back'] < days_back or
+                    end_time - state['full_loaded_at'] > INCREMENTAL_FULL_REFRESH_INTERVAL):
+                # 전체 조회
+                events = {event.arn: event for event in self.iter_events(start_time, end_time)}
+                state = {
+                    'events': events,
+                    'days_back': days_back,
+                    'full_loaded_at': end_time,
+                    'watermark': end_time,
+                    'failed_detail_arns': set(self.failed_detail_arns)
+                }
+                changed = list(events.values())
             else:
-                return [], f"ERROR - API 호출 실패: {error_msg}"
+                # 워터마크 이후 갱신된 이벤트만 조회
+                self.failed_detail_arns = {}
+                window_start = end_time - timedelta(days=state['days_back'])
+                event_filter = {
+                    'eventTypeCategories': DEFAULT_EVENT_CATEGORIES,
+                    'lastUpdatedTimes': [{'from': state['watermark'] - INCREMENTAL_OVERLAP, 'to': end_time}]
+                }
+                
+                changed_events = []
+                for raw_events in self._iter_event_pages(event_filter):
+                    for event in raw_events:
+                        cached = state['events'].get(event['arn'])
+                        if cached and cached.last_updated_time == event.get('lastUpdatedTime', ''):
+                            continue
+                        if isinstance(event.get('startTime'), datetime) and event['startTime'] < window_start:
+                            continue
+                        changed_events.append(event)
+                
+                changed = self._enrich_events(changed_events)
+                for event in changed:
+                    state['events'][event.arn] = event
+                
+                if changed_events:
+                    print(f"🔄 증분 조회: {len(changed_events)}개 이벤트 갱신")
+                
+                # 조회 기간을 벗어난 이벤트 제거
+                state['events'] = {
+                    arn: event for arn, event in state['events'].items()
+                    if not isinstance(event.start_time, datetime) or event.start_time >= window_start
+                }
+                
+                # 이전 조회에서 상세 정보 조회에 실패한 이벤트 (이번에 갱신된 이벤트는 위에서 다시 조회함)
+                changed_arns = {event.arn for event in changed}
+                changed += self._retry_failed_event_details(
+                    state, [arn for arn in state['failed_detail_arns'] if arn not in changed_arns]
+                )
+                state['failed_detail_arns'] = set(self.failed_detail_arns)
+            
+            # 워터마크 갱신
+            state['watermark'] = max(
+                [event.last_updated_time for event in state['events'].values()
+                 if isinstance(event.last_updated_time, datetime)] + [state['watermark']]
+            )
+            AWSHealthService._incremental_states[key] = state
+            cached_events = list(state['events'].values())
+            
+            # 변경분만 로컬 저장소에 기록
+            self._save_incremental_state_to_store(key, state, changed)
+        
+        events = [
+            event for event in cached_events
+            if not isinstance(event.start_time, datetime) or start_time <= event.start_time <= end_time
+        ]
+        events.sort(
+            key=lambda event: event.last_updated_time if isinstance(event.last_updated_time, datetime)
+            else datetime.min.replace(tzinfo=timezone.utc),
+            reverse=True
+        )
+        return events
+    
+    def _retry_failed_event_details(self, state: Dict, event_arns: List[str]) -> List[HealthEvent]:
+        """
+        상세 정보 조회에 실패했던 이벤트의 상세 정보를 다시 조회하여 설명 채우기
+        
+        Args:
+            state: 증분 조회 상태 (성공한 이벤트는 state['events']에서 교체)
+            event_arns: 다시 조회할 이벤트 ARN 리스트 (조회 기간을 벗어난 이벤트는 제외)
+            
+        Returns:
+            설명을 채운 이벤트 리스트
+        """
+        event_arns = [arn for arn in event_arns if arn in state['events']]
+        if not event_arns:
+            return []
+        
+        event_details = {}
+        for arn in event_arns:
+            detail = self.detail_cache.get(arn, state['events'][arn].last_updated_time)
+            if detail is not None:
+                event_details[arn] = detail
+        
+        fetched_details, failed_arns = self._get_event_details_batch(
+            [arn for arn in event_arns if arn not in event_details]
+        )
+        for arn, detail in fetched_details.items():
+            self.detail_cache.put(arn, state['events'][arn].last_updated_time, detail)
+        event_details.update(fetched_details)
+        self.failed_detail_arns.update(failed_arns)
+        
+        retried = []
+        for arn, detail in event_details.items():
+            event = state['events'][arn].replace(description=detail.get('description', ''))
+            state['events'][arn] = event
+            retried.append(event)
+        
+        if retried:
+            print(f"🔄 상세 정보 재조회: {len(retried)}개 이벤트")
+        return retried
+    
+    def _load_incremental_state_from_store(self, key: str, end_time: datetime) -> Optional[Dict]:
+        """
+        로컬 저장소에서 증분 조회 상태 복원
+        
+        Args:
+            key: 증분 조회 계정 키
+            end_time: 현재 조회 종료 시간
+            
+        Returns:
+            증분 조회 상태 딕셔너리 (저장소가 없거나 상태가 없으면 None)
+        """
+        if not self.event_store:
+            return None
+        
+        try:
+            sync_state = self.event_store.get_sync_state(key)
+            if not sync_state:
+                return None
+            
+            window_start = end_time - timedelta(days=sync_state['days_back'])
+            stored_events = self.event_store.query_events(account=key, since=window_start)
+        except Exception as e:
+            print(f"⚠️ 이벤트 저장소 조회 실패: {e}")
+            return None
+        
+        events = {}
+        for row in stored_events:
+            event = HealthEvent.from_dict(row)
+            events[event.arn] = event
+        
+        # 실패 목록은 저장하지 않으므로 설명이 비어 있는 이벤트를 다음 증분 조회에서 다시 조회
+        failed_detail_arns = {arn for arn, event in events.items() if not event.description}
+        
+        return {**sync_state, 'events': events, 'failed_detail_arns': failed_detail_arns}
+    
+    def _save_incremental_state_to_store(self, key: str, state: Dict, changed_events: List[HealthEvent]):
+        """
+        변경된 이벤트와 워터마크를 로컬 저장소에 기록
+        
+        Args:
+            key: 증분 조회 계정 키
+            state: 증분 조회 상태
+            changed_events: 새로 조회되었거나 변경된 이벤트 리스트
+        """
+        if not self.event_store:
+            return
+        
+        try:
+            self.event_store.upsert_events(key, changed_events)
+            self.event_store.set_sync_state(key, state['watermark'], state['days_back'], state['full_loaded_at'])
+        except Exception as e:
+            print(f"⚠️ 이벤트 저장소 기록 실패: {e}")
+    
+    def _classify_error(self, error: Exception) -> str:
+        """
+        API 오류를 상태 메시지로 분류
+        
+        Args:
+            error: 발생한 예외
+            
+        Returns:
+            상태 메시지
+        """
+        error_msg = str(error)
+        
+        # 구체적인 오류 분류
+        if "Unable to locate credentials" in error_msg:
+            return "ERROR - AWS 자격 증명 없음"
+        elif "SubscriptionRequiredException" in error_msg:
+            return "ERROR - Business/Enterprise 지원 플랜 필요"
+        elif "AccessDenied" in error_msg:
+            return "ERROR - Health API 접근 권한 없음"
+        elif "InvalidUserID.NotFound" in error_msg:
+            return "ERROR - 존재하지 않는 계정"
+        else:
+            return f"ERROR - API 호출 실패: {error_msg}"
     
     def _get_event_details(self, event_arn: str) -> Dict:
         """
@@ -189,19 +607,66 @@ class AWSHealthService:
         Returns:
             이벤트 상세 정보
         """
-        try:
-            response = self.health_client.describe_event_details(
-                eventArns=[event_arn]
-            )
+        event_details, _ = self._get_event_details_batch([event_arn])
+        return event_details.get(event_arn, {})
+    
+    def _get_event_details_batch(self, event_arns: List[str]) -> tuple[Dict[str, Dict], Dict[str, str]]:
+        """
+        여러 이벤트의 상세 정보를 배치 단위로 조회
+        
+        describe_event_details가 허용하는 최대 개수(10개)씩 ARN을 묶어 호출하고
+        successfulSet/failedSet 결과를 각 이벤트 ARN에 다시 매핑합니다.
+        
+        Args:
+            event_arns: 이벤트 ARN 리스트
             
-            if response.get('successfulSet'):
-                return response['successfulSet'][0].get('eventDescription', {})
-            else:
-                return {}
-                
-        except Exception as e:
-            print(f"이벤트 상세 정보 조회 실패: {e}")
-            return {}
+        Returns:
+            (ARN별 이벤트 설명 딕셔너리, 실패한 ARN별 오류 메시지 딕셔너리) 튜플
+        """
+        event_details = {}
+        failed_arns = {}
+        
+        # 중복 ARN 제거 (순서 유지)
+        unique_arns = list(dict.fromkeys(event_arns))
+        
+        for i in range(0, len(unique_arns), EVENT_DETAILS_BATCH_SIZE):
+            batch = unique_arns[i:i + EVENT_DETAILS_BATCH_SIZE]
+            
+            try:
+                response = self._call_health_api(
+                    'describe_event_details',
+                    eventArns=batch
+                )
+            except Exception as e:
+                print(f"이벤트 상세 정보 조회 실패 ({len(batch)}개): {e}")
+                for arn in batch:
+                    failed_arns[arn] = str(e)
+                continue
+            
+            for item in response.get('successfulSet', []):
+                arn = item.get('event', {}).get('arn')
+                if arn:
+                    event_details[arn] = {
+                        'description': item.get('eventDescription', {}).get('latestDescription', ''),
+                        'metadata': item.get('eventMetadata', {})
+                    }
+            
+            for item in response.get('failedSet', []):
+                arn = item.get('eventArn')
+                if arn:
+                    failed_arns[arn] = f"{item.get('errorName', 'Unknown')}: {item.get('errorMessage', '')}"
+            
+            # 응답에 포함되지 않은 ARN도 실패로 기록
+            for arn in batch:
+                if arn not in event_details and arn not in failed_arns:
+                    failed_arns[arn] = "응답에 상세 정보 없음"
+        
+        if failed_arns:
+            print(f"⚠️ 이벤트 상세 정보 조회 실패 {len(failed_arns)}개:")
+            for arn, error in failed_arns.items():
+                print(f"   - {arn}: {error}")
+        
+        return event_details, failed_arns
     
     def _count_affected_entities(self, event_arn: str) -> int:
         """
@@ -213,122 +678,134 @@ class AWSHealthService:
         Returns:
             영향받은 엔티티 수
         """
-        try:
-            response = self.health_client.describe_affected_entities(
-                filter={
-                    'eventArns': [event_arn]
-                }
-            )
+        return self._count_affected_entities_batch([event_arn]).get(event_arn, 0)
+    
+    def _count_affected_entities_batch(self, event_arns: List[str]) -> Dict[str, int]:
+        """
+        여러 이벤트의 영향받은 엔티티 수를 집계 API로 일괄 조회
+        
+        describe_entity_aggregates는 엔티티 목록을 내려받지 않고 개수만 반환하므로
+        엔티티가 많아져도 호출 비용이 일정합니다.
+        
+        Args:
+            event_arns: 이벤트 ARN 리스트
             
-            return len(response.get('entities', []))
+        Returns:
+            ARN별 영향받은 엔티티 수 딕셔너리
+        """
+        entity_counts = {}
+        unique_arns = list(dict.fromkeys(event_arns))
+        
+        for i in range(0, len(unique_arns), ENTITY_AGGREGATES_BATCH_SIZE):
+            batch = unique_arns[i:i + ENTITY_AGGREGATES_BATCH_SIZE]
             
-        except Exception as e:
-            print(f"영향받은 엔티티 수 조회 실패: {e}")
-            return 0
+            try:
+                response = self._call_health_api(
+                    'describe_entity_aggregates',
+                    eventArns=batch
+                )
+            except Exception as e:
+                print(f"영향받은 엔티티 수 조회 실패 ({len(batch)}개): {e}")
+                continue
+            
+            for aggregate in response.get('entityAggregates', []):
+                entity_counts[aggregate['eventArn']] = aggregate.get('count', 0)
+        
+        return entity_counts
     
-    def get_health_summary(self) -> Dict:
+    def get_affected_entities(self, event_arn: str) -> List[Dict]:
         """
-        AWS Health 전체 요약 정보 조회
+        특정 이벤트의 영향받은 엔티티 전체 목록 조회 (모든 페이지)
+        
+        엔티티 수만 필요한 경우에는 _count_affected_entities_batch를 사용하세요.
         
+        Args:
+            event_arn: 이벤트 ARN
+            
         Returns:
-            Health 요약 정보
+            영향받은 엔티티 리스트
         """
-        events, status = self.get_service_health_events()
-        
-        # API 호출이 실패한 경우
-        if status != "SUCCESS":
-            return {
-                'total_events': 0,
-                'active_events': 0,
-                'resolved_events': 0,
-                'services_affected': 0,
-                'regions_affected': 0,
-                'critical_events': 0,
-                'error_status': status,
-                'last_updated': datetime.now(timezone.utc).isoformat()
-            }
+        if not self.health_client:
+            return []
         
-        # 성공했지만 이벤트가 없는 경우 (실제 정상 상태)
-        if not events:
-            return {
-                'total_events': 0,
-                'active_events': 0,
-                'resolved_events': 0,
-                'services_affected': 0,
-                'regions_affected': 0,
-                'critical_events': 0,
-                'error_status': None,
-                'last_updated': datetime.now(timezone.utc).isoformat()
-            }
+        entities = []
+        request = {'filter': {'eventArns': [event_arn]}}
         
-        df = pd.DataFrame(events)
+        try:
+            while True:
+                response = self._call_health_api('describe_affected_entities', **request)
+                entities.extend(response.get('entities', []))
+                
+                next_token = response.get('nextToken')
+                if not next_token:
+                    break
+                request['nextToken'] = next_token
+                
+        except Exception as e:
+            print(f"영향받은 엔티티 목록 조회 실패: {e}")
         
-        # 활성 이벤트 (종료 시간이 없는 이벤트)
-        active_events = df[df['end_time'].isnull() | (df['end_time'] == '')].shape[0]
-        resolved_events = df[~(df['end_time'].isnull() | (df['end_time'] == ''))].shape[0]
+        return entities
+    
+    def get_snapshot(self, days_back: int = 7, incremental: bool = True) -> HealthSnapshot:
+        """
+        한 번의 이벤트 조회로 Health 스냅샷 생성
         
-        # 영향받은 서비스 및 리전 수
-        services_affected = df['service'].nunique()
-        regions_affected = df[df['region'] != 'Global']['region'].nunique()
+        요약, 서비스별/리전별 집계, 계정 알림이 모두 필요한 경우
+        개별 메서드 대신 이 스냅샷을 사용하면 API 호출이 한 번으로 끝납니다.
         
-        # 중요 이벤트 (issue 카테고리)
-        critical_events = df[df['event_type_category'] == 'issue'].shape[0]
+        Args:
+            days_back: 조회할 이전 일수
+            incremental: 이전 조회 결과를 재사용하고 변경된 이벤트만 조회할지 여부
+            
+        Returns:
+            HealthSnapshot 객체
+        """
+        events, status = self.get_service_health_events(days_back, incremental)
+        return HealthSnapshot(events, status, days_back=days_back, account=self.current_account)
+    
+    def get_health_summary(self, days_back: int = 7) -> Dict:
+        """
+        AWS Health 전체 요약 정보 조회
         
-        return {
-            'total_events': len(events),
-            'active_events': active_events,
-            'resolved_events': resolved_events,
-            'services_affected': services_affected,
-            'regions_affected': regions_affected,
-            'critical_events': critical_events,
-            'error_status': None,
-            'last_updated': datetime.now(timezone.utc).isoformat()
-        }
+        Args:
+            days_back: 조회할 이전 일수
+            
+        Returns:
+            Health 요약 정보
+        """
+        return self.get_snapshot(days_back).summary
     
-    def get_events_by_service(self) -> Dict:
+    def get_events_by_service(self, days_back: int = 7) -> Dict:
         """
         서비스별 이벤트 집계
         
+        Args:
+            days_back: 조회할 이전 일수
+            
         Returns:
             서비스별 이벤트 집계 정보
         """
-        events, status = self.get_service_health_events()
-        
-        if status != "SUCCESS" or not events:
-            return {}
-        
-        df = pd.DataFrame(events)
-        service_counts = df.groupby('service').agg({
-            'arn': 'count',
-            'event_type_category': lambda x: (x == 'issue').sum()
-        }).rename(columns={'arn': 'total_events', 'event_type_category': 'critical_events'})
-        
-        return service_counts.to_dict('index')
+        return self.get_snapshot(days_back).by_service
     
-    def get_events_by_region(self) -> Dict:
+    def get_events_by_region(self, days_back: int = 7) -> Dict:
         """
         리전별 이벤트 집계
         
+        Args:
+            days_back: 조회할 이전 일수
+            
         Returns:
             리전별 이벤트 집계 정보
         """
-        events, status = self.get_service_health_events()
-        
-        if status != "SUCCESS" or not events:
-            return {}
-        
-        df = pd.DataFrame(events)
-        region_counts = df.groupby('region').agg({
-            'arn': 'count',
-            'event_type_category': lambda x: (x == 'issue').sum()
-        }).rename(columns={'arn': 'total_events', 'event_type_category': 'critical_events'})
-        
-        return region_counts.to_dict('index')
+        return self.get_snapshot(days_back).by_region
     
-    def check_account_specific_events(self) -> List[Dict]:
+    def check_account_specific_events(self, days_back: int = 7) -> List[Dict]:
         """
         계정별 특정 이벤트 조회
         
+        Args:
+            days_back: 조회할 이전 일수
+            
         Returns:
             계정별 이벤트 리스트
         """
@@ -336,28 +813,293 @@ class AWSHealthService:
             return []
             
         try:
-            response = self.health_client.describe_events(
-                filter={
-                    'eventTypeCategories': ['accountNotification']
-                }
-            )
+            end_time = datetime.now(timezone.utc)
+            start_time = end_time - timedelta(days=days_back)
             
             account_events = []
-            for event in response.get('events', []):
-                event_detail = self._get_event_details(event['arn'])
-                
-                account_events.append({
-                    'arn': event['arn'],
-                    'service': event.get('service', 'Account'),
-                    'event_type_code': event.get('eventTypeCode', 'Unknown'),
-                    'status': event.get('statusCode', 'Unknown'),
-                    'start_time': event.get('startTime', ''),
-                    'description': event_detail.get('description', ''),
-                    'region': event.get('region', 'Global')
-                })
+            for event in self.iter_events(start_time, end_time,
+                                          filters={'eventTypeCategories': ['accountNotification']}):
+                account_events.append(event.to_dict(ACCOUNT_EVENT_FIELDS))
             
             return account_events
             
         except Exception as e:
             print(f"계정별 이벤트 조회 실패: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    def get_organization_accounts(self) -> Dict[str, str]:
+        """
+        AWS Organizations의 활성 계정 목록 조회 (관리 계정에서 실행)
+        
+        Returns:
+            {계정 ID: 계정 이름} 딕셔너리 (조회 실패 시 빈 딕셔너리)
+        """
+        if not self.organizations_client:
+            return {}
+        
+        accounts = {}
+        request = {}
+        
+        try:
+            while True:
+                response = self.organizations_client.list_accounts(**request)
+                for account in response.get('Accounts', []):
+                    if account.get('Status', 'ACTIVE') == 'ACTIVE':
+                        accounts[account['Id']] = account.get('Name', account['Id'])
+                
+                next_token = response.get('NextToken')
+                if not next_token:
+                    break
+                request['NextToken'] = next_token
+                
+        except Exception as e:
+            print(f"Organizations 계정 목록 조회 실패: {e}")
+            return {}
+        
+        return accounts
+    
+    def iter_organization_events(self, start_time: datetime = None, end_time: datetime = None,
+                                 filters: Dict = None) -> Iterator[tuple[HealthEvent, Optional[Dict[str, int]]]]:
+        """
+        조직 전체의 AWS Health 이벤트를 페이지 단위로 조회하는 제너레이터
+        
+        Health 조직 보기 API(describe_events_for_organization 등)를 사용하므로
+        관리 계정(또는 위임된 관리자 계정)의 자격 증명이 필요합니다.
+        
+        Args:
+            start_time: 조회 시작 시간 (None이면 시작 시간 조건 없음)
+            end_time: 조회 종료 시간 (None이면 현재 시간)
+            filters: describe_events_for_organization filter에 추가할 조건
+            
+        Yields:
+            (정규화된 이벤트, {영향받은 계정 ID: 엔티티 수}) 튜플.
+            모든 계정에 해당하는 공개(PUBLIC) 이벤트는 계정 딕셔너리 대신 None을 반환합니다.
+        """
+        event_filter = dict(filters or {})
+        event_filter.setdefault('eventTypeCategories', DEFAULT_EVENT_CATEGORIES)
+        
+        if start_time is not None:
+            event_filter['startTime'] = {
+                'from': start_time,
+                'to': end_time or datetime.now(timezone.utc)
+            }
+        
+        request = {'filter': event_filter, 'maxResults': EVENTS_PAGE_SIZE}
+        self.failed_detail_arns = {}
+        
+        while True:
+            response = self._call_health_api('describe_events_for_organization', **request)
+            raw_events = response.get('events', [])
+            
+            # 이벤트별 영향받은 계정 (공개 이벤트는 None)
+            affected_accounts = {
+                event['arn']: self._get_organization_affected_accounts(event)
+                for event in raw_events
+            }
+            
+            # 캐시에 없는 이벤트의 상세 정보만 조회
+            event_details = {}
+            for event in raw_events:
+                detail = self.detail_cache.get(event['arn'], event.get('lastUpdatedTime'))
+                if detail is not None:
+                    event_details[event['arn']] = detail
+            
+            fetched_details, failed_arns = self._get_organization_event_details_batch([
+                (arn, accounts[0] if accounts else None)
+                for arn, accounts in affected_accounts.items()
+                if arn not in event_details
+            ])
+            for event in raw_events:
+                if event['arn'] in fetched_details:
+                    self.detail_cache.put(event['arn'], event.get('lastUpdatedTime'), fetched_details[event['arn']])
+            event_details.update(fetched_details)
+            
+            entity_counts = self._count_organization_entities_batch(affected_accounts)
+            self.failed_detail_arns.update(failed_arns)
+            
+            for event in raw_events:
+                arn = event['arn']
+                accounts = affected_accounts[arn]
+                account_counts = None
+                if accounts is not None:
+                    account_counts = {
+                        account_id: entity_counts.get((arn, account_id), 0)
+                        for account_id in accounts
+                    }
+                
+                yield (
+                    HealthEvent.from_api(
+                        event,
+                        event_details.get(arn, {}),
+                        sum(account_counts.values()) if account_counts else 0
+                    ),
+                    account_counts
+                )
+            
+            next_token = response.get('nextToken')
+            if not next_token:
+                break
+            request['nextToken'] = next_token
+    
+    def get_organization_events_by_account(self, days_back: int = 7,
+                                           account_ids: List[str] = None) -> tuple[Dict[str, List[HealthEvent]], str]:
+        """
+        조직 전체 이벤트를 한 번에 조회하여 계정별로 분류
+        
+        Args:
+            days_back: 조회할 이전 일수
+            account_ids: 결과에 포함할 계정 ID 리스트 (공개 이벤트를 배분할 대상)
+            
+        Returns:
+            ({계정 ID: 이벤트 리스트}, 상태 메시지) 튜플
+        """
+        if not self.health_client:
+            return {}, "ERROR - AWS 클라이언트 초기화 실패"
+        
+        events_by_account = {account_id: [] for account_id in (account_ids or [])}
+        
+        try:
+            end_time = datetime.now(timezone.utc)
+            start_time = end_time - timedelta(days=days_back)
+            
+            public_events = []
+            for event, account_counts in self.iter_organization_events(start_time, end_time):
+                if account_counts is None:
+                    public_events.append(event)
+                    continue
+                
+                for account_id, entity_count in account_counts.items():
+                    events_by_account.setdefault(account_id, []).append(
+                        event.replace(affected_entities_count=entity_count)
+                    )
+            
+            # 공개 이벤트는 모든 계정에 동일하게 적용 (엔티티 수가 0이므로 같은 객체를 공유)
+            for account_id in events_by_account:
+                events_by_account[account_id].extend(public_events)
+            
+            self.detail_cache.save_if_dirty()
+            return events_by_account, "SUCCESS"
+            
+        except Exception as e:
+            print(f"조직 Health 이벤트 조회 실패: {e}")
+            return {}, self._classify_error(e)
+    
+    def _get_organization_affected_accounts(self, event: Dict) -> Optional[List[str]]:
+        """
+        조직 이벤트의 영향받은 계정 목록 조회 (모든 페이지)
+        
+        Args:
+            event: describe_events_for_organization 응답의 이벤트 항목
+            
+        Returns:
+            영향받은 계정 ID 리스트 (공개 이벤트는 None)
+        """
+        if event.get('eventScopeCode') == 'PUBLIC':
+            return None
+        
+        accounts = []
+        request = {'eventArn': event['arn']}
+        
+        try:
+            while True:
+                response = self._call_health_api('describe_affected_accounts_for_organization', **request)
+                if response.get('eventScopeCode') == 'PUBLIC':
+                    return None
+                accounts.extend(response.get('affectedAccounts', []))
+                
+                next_token = response.get('nextToken')
+                if not next_token:
+                    break
+                request['nextToken'] = next_token
+                
+        except Exception as e:
+            print(f"영향받은 계정 조회 실패 ({event['arn']}): {e}")
+        
+        return accounts
+    
+    def _get_organization_event_details_batch(self, event_accounts: List[tuple[str, Optional[str]]]) -> tuple[Dict[str, Dict], Dict[str, str]]:
+        """
+        조직 이벤트의 상세 정보를 배치 단위로 조회
+        
+        이벤트 설명은 계정에 관계없이 동일하므로 이벤트마다 한 계정 기준으로만 조회합니다.
+        
+        Args:
+            event_accounts: (이벤트 ARN, 조회 기준 계정 ID 또는 None) 리스트
+            
+        Returns:
+            (ARN별 이벤트 설명 딕셔너리, 실패한 ARN별 오류 메시지 딕셔너리) 튜플
+        """
+        event_details = {}
+        failed_arns = {}
+        
+        for i in range(0, len(event_accounts), EVENT_DETAILS_BATCH_SIZE):
+            batch = event_accounts[i:i + EVENT_DETAILS_BATCH_SIZE]
+            detail_filters = [
+                {'eventArn': arn, **({'awsAccountId': account_id} if account_id else {})}
+                for arn, account_id in batch
+            ]
+            
+            try:
+                response = self._call_health_api(
+                    'describe_event_details_for_organization',
+                    organizationEventDetailFilters=detail_filters
+                )
+            except Exception as e:
+                print(f"조직 이벤트 상세 정보 조회 실패 ({len(batch)}개): {e}")
+                for arn, _ in batch:
+                    failed_arns[arn] = str(e)
+                continue
+            
+            for item in response.get('successfulSet', []):
+                arn = item.get('event', {}).get('arn')
+                if arn:
+                    event_details[arn] = {
+                        'description': item.get('eventDescription', {}).get('latestDescription', ''),
+                        'metadata': item.get('eventMetadata', {})
+                    }
+            
+            for item in response.get('failedSet', []):
+                arn = item.get('eventArn')
+                if arn:
+                    failed_arns[arn] = f"{item.get('errorName', 'Unknown')}: {item.get('errorMessage', '')}"
+        
+        if failed_arns:
+            print(f"⚠️ 조직 이벤트 상세 정보 조회 실패 {len(failed_arns)}개")
+        
+        return event_details, failed_arns
+    
+    def _count_organization_entities_batch(self, affected_accounts: Dict[str, Optional[List[str]]]) -> Dict[tuple[str, str], int]:
+        """
+        조직 이벤트의 계정별 영향받은 엔티티 수를 집계 API로 일괄 조회
+        
+        Args:
+            affected_accounts: {이벤트 ARN: 영향받은 계정 ID 리스트 또는 None}
+            
+        Returns:
+            {(이벤트 ARN, 계정 ID): 엔티티 수} 딕셔너리
+        """
+        entity_counts = {}
+        event_arns = [arn for arn, accounts in affected_accounts.items() if accounts]
+        
+        for i in range(0, len(event_arns), ORG_ENTITY_AGGREGATES_BATCH_SIZE):
+            arn_batch = event_arns[i:i + ORG_ENTITY_AGGREGATES_BATCH_SIZE]
+            account_ids = list(dict.fromkeys(
+                account_id for arn in arn_batch for account_id in affected_accounts[arn]
+            ))
+            
+            for j in range(0, len(account_ids), ORG_ENTITY_AGGREGATES_BATCH_SIZE):
+                try:
+                    response = self._call_health_api(
+                        'describe_entity_aggregates_for_organization',
+                        eventArns=arn_batch,
+                        awsAccountIds=account_ids[j:j + ORG_ENTITY_AGGREGATES_BATCH_SIZE]
+                    )
+                except Exception as e:
+                    print(f"조직 엔티티 수 조회 실패 ({len(arn_batch)}개): {e}")
+                    continue
+                
+                for aggregate in response.get('organizationEntityAggregates', []):
+                    for account in aggregate.get('accounts', []):
+                        entity_counts[(aggregate['eventArn'], account['accountId'])] = account.get('count', 0)
+        
+        return entity_counts
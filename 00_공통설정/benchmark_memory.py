@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+이벤트 표현 방식별 메모리 사용량 측정
+
+멀티 계정 점검이 계정마다 보관하는 이벤트 목록과 계정 알림 목록을
+기존 딕셔너리 방식과 HealthEvent(__slots__ + 문자열 인터닝) 방식으로 만들어
+tracemalloc으로 유지 메모리를 비교합니다. AWS 호출 없이 가상의 API 응답을 사용합니다.
+
+사용법:
+    python benchmark_memory.py [계정 수] [계정당 이벤트 수]
+"""
+import gc
+import random
+import sys
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from health_event import HealthEvent, ACCOUNT_EVENT_FIELDS
+
+SERVICES = ['EC2', 'RDS', 'S3', 'LAMBDA', 'ELASTICLOADBALANCING', 'CLOUDFRONT', 'DYNAMODB', 'EKS']
+REGIONS = ['us-east-1', 'us-west-2', 'eu-west-1', 'ap-northeast-2', 'ap-southeast-1', 'global']
+CATEGORIES = ['issue', 'accountNotification', 'scheduledChange']
+STATUSES = ['open', 'closed', 'upcoming']
+DESCRIPTION_LENGTH = 400
+
+
+def _copy(value: str) -> str:
+    """API 응답 파싱처럼 같은 내용의 새 문자열 객체 생성"""
+    return ''.join(list(value))
+
+
+def make_raw_events(account_index: int, count: int):
+    """
+    describe_events/describe_event_details 응답 형태의 가상 이벤트 생성
+
+    Args:
+        account_index: 계정 번호
+        count: 이벤트 수
+
+    Returns:
+        (원본 이벤트, 상세 정보) 튜플 리스트
+    """
+    rng = random.Random(account_index)
+    now = datetime.now(timezone.utc)
+    raw_events = []
+
+    for i in range(count):
+        service = rng.choice(SERVICES)
+        category = rng.choice(CATEGORIES)
+        start_time = now - timedelta(minutes=rng.randint(0, 30 * 24 * 60))
+        event = {
+            'arn': f"arn:aws:health:us-east-1::event/{service}/AWS_{service}_OPERATIONAL_ISSUE/{account_index}-{i}",
+            'service': _copy(service),
+            'eventTypeCode': _copy(f"AWS_{service}_{category.upper()}"),
+            'eventTypeCategory': _copy(category),
+            'region': _copy(rng.choice(REGIONS)),
+            'statusCode': _copy(rng.choice(STATUSES)),
+            'startTime': start_time,
+            'endTime': start_time + timedelta(hours=2) if rng.random() < 0.5 else '',
+            'lastUpdatedTime': start_time + timedelta(hours=1)
+        }
+        detail = {'description': f"[{account_index}-{i}] " + 'x' * DESCRIPTION_LENGTH}
+        raw_events.append((event, detail))
+
+    return raw_events
+
+
+def build_dicts(raw_events):
+    """기존 방식: 이벤트마다 11개 키 딕셔너리 + 계정 알림용 7개 키 딕셔너리"""
+    events = [HealthEvent.from_api(event, detail, 0).to_dict() for event, detail in raw_events]
+    # 인터닝 효과를 제외하기 위해 문자열은 API 응답 객체를 그대로 사용
+    for data, (event, _) in zip(events, raw_events):
+        data['service'] = event['service']
+        data['event_type_category'] = event['eventTypeCategory']
+        data['event_type_code'] = event['eventTypeCode']
+        data['region'] = event['region']
+        data['status'] = event['statusCode']
+    account_events = [
+        {field: data[field] for field in ACCOUNT_EVENT_FIELDS}
+        for data in events if data['event_type_category'] == 'accountNotification'
+    ]
+    return events, account_events
+
+
+def build_records(raw_events):
+    """HealthEvent 방식: __slots__ 레코드, 계정 알림은 같은 레코드 참조"""
+    events = [HealthEvent.from_api(event, detail, 0) for event, detail in raw_events]
+    account_events = [event for event in events if event.event_type_category == 'accountNotification']
+    return events, account_events
+
+
+def measure(builder, accounts: int, events_per_account: int) -> int:
+    """
+    모든 계정의 이벤트를 만든 뒤 유지되는 메모리 측정
+
+    Args:
+        builder: 원본 이벤트를 보관 형태로 바꾸는 함수
+        accounts: 계정 수
+        events_per_account: 계정당 이벤트 수
+
+    Returns:
+        유지 메모리 (바이트)
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    retained = {}
+    for account_index in range(accounts):
+        raw_events = make_raw_events(account_index, events_per_account)
+        retained[account_index] = builder(raw_events)
+        del raw_events
+
+    gc.collect()
+    current = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    del retained
+    return current
+
+
+def main():
+    accounts = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    events_per_account = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    total = accounts * events_per_account
+
+    print(f"🧠 이벤트 보관 메모리 측정 ({accounts}개 계정 × {events_per_account}개 이벤트 = {total}개)")
+    print("=" * 70)
+
+    dict_bytes = measure(build_dicts, accounts, events_per_account)
+    record_bytes = measure(build_records, accounts, events_per_account)
+
+    for name, size in (('딕셔너리', dict_bytes), ('HealthEvent', record_bytes)):
+        print(f"{name:<14} {size / 1024 / 1024:>8.2f} MB  (이벤트당 {size / total:>7.0f} B)")
+
+    print("-" * 70)
+    print(f"절감: {(dict_bytes - record_bytes) / 1024 / 1024:.2f} MB ({1 - record_bytes / dict_bytes:.1%})")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+헤드리스 실행(스케줄러, 멀티 계정 점검) 시작 시간 측정
+
+각 모듈을 새 파이썬 프로세스에서 import하는 데 걸리는 시간을 여러 번 측정하고,
+pandas/plotly가 함께 로드되는지 확인합니다.
+
+사용법:
+    python benchmark_startup.py [반복 횟수]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BASE_DIR)
+
+# (이름, import할 모듈, 추가 sys.path)
+TARGETS = [
+    ('pandas (비교 기준)', 'pandas', BASE_DIR),
+    ('aws_health_service', 'aws_health_service', BASE_DIR),
+    ('health_snapshot', 'health_snapshot', BASE_DIR),
+    ('aws_multi_account_monitor', 'aws_multi_account_monitor',
+     os.path.join(ROOT_DIR, '02_멀티계정_통합모니터링')),
+    ('health_scheduler', 'health_scheduler', os.path.join(ROOT_DIR, '03_자동스케줄러_알림')),
+]
+
+MEASURE_CODE = """
+import sys, time
+sys.path.insert(0, {path!r})
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [name for name in ('pandas', 'plotly', 'numpy') if name in sys.modules]
+print(f"{{elapsed:.6f}} {{','.join(heavy)}}")
+"""
+
+
+def measure_import(module: str, path: str, repeat: int):
+    """
+    새 프로세스에서 모듈 import 시간 측정
+
+    Args:
+        module: import할 모듈 이름
+        path: sys.path에 추가할 경로
+        repeat: 반복 횟수
+
+    Returns:
+        (측정 시간 리스트, 함께 로드된 무거운 패키지 목록), 실패 시 (None, 오류 메시지)
+    """
+    code = MEASURE_CODE.format(path=path, module=module)
+    timings = []
+    heavy = ''
+
+    for _ in range(repeat):
+        # 실제 실행과 같도록 모듈 폴더를 작업 디렉토리로 사용
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=path, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            return None, result.stderr.strip().splitlines()[-1] if result.stderr else 'unknown error'
+        elapsed, _, heavy = result.stdout.strip().splitlines()[-1].partition(' ')
+        timings.append(float(elapsed))
+
+    return timings, heavy
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print(f"⏱️ 모듈 import 시간 측정 (새 프로세스, {repeat}회 반복)")
+    print("=" * 70)
+    print(f"{'모듈':<30} {'중앙값':>10} {'최소':>10}  함께 로드된 패키지")
+    print("-" * 70)
+
+    for name, module, path in TARGETS:
+        timings, heavy = measure_import(module, path, repeat)
+        if timings is None:
+            print(f"{name:<30} ❌ 실패: {heavy}")
+            continue
+        median_ms = statistics.median(timings) * 1000
+        min_ms = min(timings) * 1000
+        print(f"{name:<30} {median_ms:>8.1f}ms {min_ms:>8.1f}ms  {heavy or '-'}")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -58,6 +58,7 @@ def check_health_api_access():
             print("   - health:DescribeEvents")
             print("   - health:DescribeEventDetails")
             print("   - health:DescribeAffectedEntities")
+            print("   - health:DescribeEntityAggregates")
             
         else:
             print(f"❌ Health API 접근 실패: {error_code}")
@@ -0,0 +1,213 @@
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional
+
+# 항목당 고정 오버헤드 추정치 (키, 딕셔너리 구조 등)
+ENTRY_OVERHEAD_BYTES = 200
+
+
+def _cache_key(event_arn: str, last_updated_time) -> tuple[str, str]:
+    """(ARN, lastUpdatedTime) 캐시 키 생성"""
+    if isinstance(last_updated_time, datetime):
+        last_updated_time = last_updated_time.isoformat()
+    return event_arn, str(last_updated_time or '')
+
+
+def _entry_size(detail: Dict) -> int:
+    """상세 정보 항목의 메모리 크기 추정 (바이트)"""
+    return ENTRY_OVERHEAD_BYTES + len(json.dumps(detail, ensure_ascii=False, default=str).encode('utf-8'))
+
+
+class EventDetailCache:
+    def __init__(self, max_entries: int = 5000, max_bytes: int = 20 * 1024 * 1024,
+                 persist_path: str = None):
+        """
+        (이벤트 ARN, lastUpdatedTime) 기준 이벤트 상세 정보 LRU 캐시
+
+        이벤트의 lastUpdatedTime이 바뀌면 새 키가 되어 자동으로 다시 조회되고,
+        같은 ARN의 이전 항목은 제거됩니다. 항목 수와 전체 크기 상한을 넘으면
+        가장 오래 사용하지 않은 항목부터 제거합니다.
+
+        Args:
+            max_entries: 최대 항목 수
+            max_bytes: 최대 전체 크기 (바이트)
+            persist_path: 캐시를 저장할 JSON 파일 경로 (None이면 메모리에만 유지)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.persist_path = persist_path
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.total_bytes = 0
+
+        self._entries = OrderedDict()  # (arn, last_updated) -> (detail, size)
+        self._keys_by_arn = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        if persist_path:
+            self.load()
+
+    def get(self, event_arn: str, last_updated_time) -> Optional[Dict]:
+        """
+        캐시된 상세 정보 조회
+
+        Args:
+            event_arn: 이벤트 ARN
+            last_updated_time: 이벤트의 lastUpdatedTime
+
+        Returns:
+            상세 정보 딕셔너리 (없으면 None)
+        """
+        key = _cache_key(event_arn, last_updated_time)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, event_arn: str, last_updated_time, detail: Dict):
+        """
+        상세 정보 저장
+
+        Args:
+            event_arn: 이벤트 ARN
+            last_updated_time: 이벤트의 lastUpdatedTime
+            detail: 상세 정보 딕셔너리
+        """
+        key = _cache_key(event_arn, last_updated_time)
+        size = _entry_size(detail)
+
+        with self._lock:
+            # 같은 ARN의 이전 버전 제거
+            previous_key = self._keys_by_arn.get(event_arn)
+            if previous_key is not None:
+                self._remove(previous_key)
+
+            self._entries[key] = (detail, size)
+            self._keys_by_arn[event_arn] = key
+            self.total_bytes += size
+            self._dirty = True
+
+            while self._entries and (len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def _remove(self, key: tuple[str, str]):
+        """항목 제거 (잠금 상태에서 호출)"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.total_bytes -= entry[1]
+        if self._keys_by_arn.get(key[0]) == key:
+            del self._keys_by_arn[key[0]]
+
+    def stats(self) -> Dict:
+        """
+        캐시 통계
+
+        Returns:
+            적중/미스 수, 적중률, 항목 수, 크기 등
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.total_bytes
+            }
+
+    def load(self):
+        """디스크에 저장된 캐시 불러오기"""
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return
+
+        try:
+            with open(self.persist_path, 'r', encoding='utf-8') as f:
+                items = json.load(f)
+        except Exception as e:
+            print(f"⚠️ 상세 정보 캐시 로드 실패: {e}")
+            return
+
+        # 오래 사용하지 않은 항목부터 저장되어 있으므로 순서대로 넣으면 LRU 순서 유지
+        for item in items:
+            self.put(item['arn'], item['last_updated_time'], item['detail'])
+
+        with self._lock:
+            self._dirty = False
+
+    def save_if_dirty(self):
+        """
+        변경된 내용이 있으면 디스크에 저장 (임시 파일 작성 후 교체)
+        """
+        if not self.persist_path:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+            items = [
+                {'arn': arn, 'last_updated_time': last_updated, 'detail': detail}
+                for (arn, last_updated), (detail, _) in self._entries.items()
+            ]
+            self._dirty = False
+
+        # 여러 프로세스나 스레드가 동시에 저장해도 서로의 임시 파일을 덮어쓰지 않도록 임시 파일 이름을 따로 만듦
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', delete=False,
+                                             dir=os.path.dirname(os.path.abspath(self.persist_path)),
+                                             prefix=f"{os.path.basename(self.persist_path)}.",
+                                             suffix='.tmp') as f:
+                temp_path = f.name
+                json.dump(items, f, ensure_ascii=False, default=str)
+            os.replace(temp_path, self.persist_path)
+        except Exception as e:
+            print(f"⚠️ 상세 정보 캐시 저장 실패: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+
+# 프로세스 전체에서 공유하는 상세 정보 캐시
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_detail_cache(persist_path: str = None, max_entries: int = None, max_bytes: int = None) -> EventDetailCache:
+    """
+    프로세스 전체에서 공유하는 상세 정보 캐시 반환
+
+    처음 호출할 때의 설정으로 캐시가 만들어집니다.
+
+    Args:
+        persist_path: 캐시를 저장할 JSON 파일 경로
+        max_entries: 최대 항목 수
+        max_bytes: 최대 전체 크기 (바이트)
+
+    Returns:
+        공유 EventDetailCache 객체
+    """
+    global _shared_cache
+
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            options = {}
+            if max_entries:
+                options['max_entries'] = max_entries
+            if max_bytes:
+                options['max_bytes'] = max_bytes
+            _shared_cache = EventDetailCache(persist_path=persist_path, **options)
+        return _shared_cache
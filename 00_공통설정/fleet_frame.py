@@ -0,0 +1,110 @@
+from collections import Counter
+from itertools import compress
+from typing import Dict, List
+
+# 프레임에 보관하는 이벤트 열
+FRAME_COLUMNS = ('account', 'service', 'region', 'category', 'active')
+
+
+class FleetFrame:
+    def __init__(self, accounts: List[str] = None):
+        """
+        모든 계정의 이벤트를 열(column) 단위로 모은 집계용 프레임
+
+        점검 주기마다 한 번, 모든 계정의 이벤트를 한 번만 순회하여 만들고,
+        통합 보고서의 서비스×계정/리전×계정 매트릭스와 전체 이벤트 수를
+        Counter 기반 그룹 집계로 계산합니다. 계정별 DataFrame을 따로 만들지 않으므로
+        수만 개 이벤트에서도 선형 시간으로 동작합니다.
+
+        Args:
+            accounts: 프레임에 포함할 계정 이름 (보고서 순서, 이벤트가 없는 계정 포함)
+        """
+        self.accounts = list(accounts or [])
+        self.columns = {column: [] for column in FRAME_COLUMNS}
+
+    @classmethod
+    def from_accounts(cls, all_accounts_data: Dict[str, Dict]) -> 'FleetFrame':
+        """
+        계정별 Health 데이터로 프레임 생성 (조회에 성공한 계정만 포함)
+
+        Args:
+            all_accounts_data: 계정 이름별 Health 데이터 (get_all_accounts_health 결과)
+
+        Returns:
+            FleetFrame 객체
+        """
+        frame = cls([name for name, data in all_accounts_data.items() if data['status'] != 'error'])
+
+        account_column = frame.columns['account']
+        service_column = frame.columns['service']
+        region_column = frame.columns['region']
+        category_column = frame.columns['category']
+        active_column = frame.columns['active']
+
+        for account_name in frame.accounts:
+            events = all_accounts_data[account_name]['events']
+            account_column.extend([account_name] * len(events))
+            for event in events:
+                service_column.append(event.service)
+                region_column.append(event.region)
+                category_column.append(event.event_type_category)
+                active_column.append(event.is_active)
+
+        return frame
+
+    def __len__(self) -> int:
+        return len(self.columns['account'])
+
+    def mask(self, column: str, value) -> List[bool]:
+        """
+        열 값이 주어진 값과 같은지 나타내는 마스크
+
+        Args:
+            column: 열 이름
+            value: 비교할 값
+
+        Returns:
+            행별 bool 리스트
+        """
+        return [item == value for item in self.columns[column]]
+
+    def group_count(self, *columns: str, mask: List[bool] = None) -> Counter:
+        """
+        지정한 열 조합별 행 수 집계
+
+        Args:
+            *columns: 그룹 기준 열 (하나면 값, 여러 개면 튜플이 키)
+            mask: 집계할 행을 고르는 마스크 (None이면 전체)
+
+        Returns:
+            그룹 키별 행 수 Counter
+        """
+        if len(columns) == 1:
+            keys = self.columns[columns[0]]
+        else:
+            keys = zip(*(self.columns[column] for column in columns))
+
+        if mask is not None:
+            keys = compress(keys, mask)
+
+        return Counter(keys)
+
+    def matrix(self, row_column: str) -> Dict[str, Dict[str, int]]:
+        """
+        행 열 값 × 계정 이벤트 수 매트릭스
+
+        Args:
+            row_column: 행으로 사용할 열 ('service' 또는 'region')
+
+        Returns:
+            {행 값: {계정 이름: 이벤트 수}} 딕셔너리 (이벤트 수가 많은 행부터, 0인 칸 제외)
+        """
+        cells = self.group_count(row_column, 'account')
+        row_totals = self.group_count(row_column)
+
+        rows = sorted(row_totals, key=lambda row: (-row_totals[row], row))
+
+        return {
+            row: {account: cells[(row, account)] for account in self.accounts if cells[(row, account)]}
+            for row in rows
+        }
@@ -0,0 +1,166 @@
+import json
+import sys
+from datetime import datetime
+from typing import Dict
+
+# 이벤트 필드 (로컬 저장소 컬럼, 보고서 JSON 키와 동일)
+EVENT_FIELDS = (
+    'arn', 'service', 'event_type_category', 'event_type_code', 'region', 'status',
+    'start_time', 'end_time', 'last_updated_time', 'description', 'affected_entities_count'
+)
+
+# 여러 이벤트에서 같은 값이 반복되는 문자열 필드 (인터닝하여 한 객체를 공유)
+INTERNED_FIELDS = ('service', 'event_type_category', 'event_type_code', 'region', 'status')
+
+# 계정 알림 목록에 포함되는 필드
+ACCOUNT_EVENT_FIELDS = ('arn', 'service', 'event_type_code', 'status', 'start_time', 'description', 'region')
+
+
+def _intern(value):
+    """문자열이면 인터닝된 객체 반환"""
+    return sys.intern(value) if type(value) is str else value
+
+
+class HealthEvent:
+    __slots__ = EVENT_FIELDS
+
+    def __init__(self, arn: str, service: str = 'Unknown', event_type_category: str = 'Unknown',
+                 event_type_code: str = 'Unknown', region: str = 'Global', status: str = 'Unknown',
+                 start_time='', end_time='', last_updated_time='', description: str = '',
+                 affected_entities_count: int = 0):
+        """
+        정규화된 AWS Health 이벤트 레코드
+
+        이벤트마다 딕셔너리를 두는 대신 __slots__ 객체로 보관하며, 서비스/리전/카테고리/
+        이벤트 코드/상태 문자열은 인터닝하여 모든 이벤트와 계정이 같은 객체를 공유합니다.
+        대시보드 DataFrame, JSON 보고서, 로컬 저장소 등 경계에서만 to_dict()/to_json()으로 변환합니다.
+
+        Args:
+            arn: 이벤트 ARN
+            service: 서비스 이름
+            event_type_category: 이벤트 카테고리 (issue, accountNotification, scheduledChange)
+            event_type_code: 이벤트 유형 코드
+            region: 리전 (리전과 무관하면 'Global')
+            status: 상태 코드 (open, closed, upcoming)
+            start_time: 시작 시간 (없으면 '')
+            end_time: 종료 시간 (없으면 '')
+            last_updated_time: 마지막 갱신 시간 (없으면 '')
+            description: 이벤트 설명
+            affected_entities_count: 영향받은 엔티티 수
+        """
+        self.arn = arn
+        self.service = _intern(service)
+        self.event_type_category = _intern(event_type_category)
+        self.event_type_code = _intern(event_type_code)
+        self.region = _intern(region)
+        self.status = _intern(status)
+        self.start_time = start_time
+        self.end_time = end_time
+        self.last_updated_time = last_updated_time
+        self.description = description
+        self.affected_entities_count = affected_entities_count
+
+    @classmethod
+    def from_api(cls, event: Dict, event_detail: Dict, entity_count: int) -> 'HealthEvent':
+        """
+        describe_events 응답 항목으로 이벤트 생성
+
+        Args:
+            event: describe_events 응답의 이벤트 항목
+            event_detail: 이벤트 상세 정보
+            entity_count: 영향받은 엔티티 수
+
+        Returns:
+            HealthEvent 객체
+        """
+        return cls(
+            arn=event['arn'],
+            service=event.get('service', 'Unknown'),
+            event_type_category=event.get('eventTypeCategory', 'Unknown'),
+            event_type_code=event.get('eventTypeCode', 'Unknown'),
+            region=event.get('region', 'Global'),
+            status=event.get('statusCode', 'Unknown'),
+            start_time=event.get('startTime', ''),
+            end_time=event.get('endTime', ''),
+            last_updated_time=event.get('lastUpdatedTime', ''),
+            description=event_detail.get('description', ''),
+            affected_entities_count=entity_count
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'HealthEvent':
+        """
+        이벤트 딕셔너리로 이벤트 생성 (이벤트 필드가 아닌 키는 무시)
+
+        Args:
+            data: 이벤트 딕셔너리 (예: 로컬 저장소 조회 결과)
+
+        Returns:
+            HealthEvent 객체
+        """
+        return cls(**{field: data[field] for field in EVENT_FIELDS if field in data})
+
+    def replace(self, **changes) -> 'HealthEvent':
+        """
+        일부 필드만 바꾼 새 이벤트 생성
+
+        Args:
+            **changes: 바꿀 필드와 값
+
+        Returns:
+            새 HealthEvent 객체
+        """
+        values = {field: getattr(self, field) for field in EVENT_FIELDS}
+        values.update(changes)
+        return HealthEvent(**values)
+
+    @property
+    def is_active(self) -> bool:
+        """종료 시간이 없는 활성 이벤트 여부"""
+        return not self.end_time
+
+    def to_dict(self, fields: tuple = EVENT_FIELDS) -> Dict:
+        """
+        딕셔너리로 변환
+
+        Args:
+            fields: 포함할 필드 (기본은 전체 필드)
+
+        Returns:
+            이벤트 딕셔너리
+        """
+        return {field: getattr(self, field) for field in fields}
+
+    def to_json(self) -> str:
+        """
+        JSON 문자열로 변환 (날짜/시간은 ISO 형식)
+
+        Returns:
+            JSON 문자열
+        """
+        return json.dumps(self.to_dict(), ensure_ascii=False, default=_json_default)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, HealthEvent):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in EVENT_FIELDS)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"HealthEvent(arn={self.arn!r}, service={self.service!r}, "
+                f"region={self.region!r}, status={self.status!r})")
+
+    def __getstate__(self):
+        return tuple(getattr(self, field) for field in EVENT_FIELDS)
+
+    def __setstate__(self, state):
+        for field, value in zip(EVENT_FIELDS, state):
+            setattr(self, field, _intern(value) if field in INTERNED_FIELDS else value)
+
+
+def _json_default(value):
+    """json.dumps에서 datetime을 ISO 문자열로 변환"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
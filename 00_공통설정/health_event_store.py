@@ -0,0 +1,269 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import List, Dict, Optional
+
+from health_event import HealthEvent, EVENT_FIELDS
+
+# 이벤트 컬럼 (HealthEvent 필드와 동일)
+EVENT_COLUMNS = list(EVENT_FIELDS)
+
+# 날짜/시간으로 저장되는 컬럼
+DATETIME_COLUMNS = {'start_time', 'end_time', 'last_updated_time'}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    account TEXT NOT NULL,
+    arn TEXT NOT NULL,
+    service TEXT,
+    event_type_category TEXT,
+    event_type_code TEXT,
+    region TEXT,
+    status TEXT,
+    start_time TEXT,
+    end_time TEXT,
+    last_updated_time TEXT,
+    description TEXT,
+    affected_entities_count INTEGER DEFAULT 0,
+    PRIMARY KEY (account, arn)
+);
+CREATE INDEX IF NOT EXISTS idx_events_service ON events (account, service);
+CREATE INDEX IF NOT EXISTS idx_events_region ON events (account, region);
+CREATE INDEX IF NOT EXISTS idx_events_category ON events (account, event_type_category);
+CREATE INDEX IF NOT EXISTS idx_events_status ON events (account, status);
+CREATE INDEX IF NOT EXISTS idx_events_last_updated ON events (account, last_updated_time);
+CREATE INDEX IF NOT EXISTS idx_events_start_time ON events (account, start_time);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    account TEXT PRIMARY KEY,
+    watermark TEXT,
+    days_back INTEGER,
+    full_loaded_at TEXT
+);
+"""
+
+
+def _to_db_value(value):
+    """datetime은 문자열 비교로 정렬되도록 UTC 고정 형식의 ISO 문자열로 변환"""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.isoformat(timespec='microseconds')
+    return value
+
+
+def _from_db_value(column: str, value):
+    """ISO 문자열로 저장된 날짜/시간 컬럼을 datetime으로 복원"""
+    if column in DATETIME_COLUMNS:
+        if not value:
+            return ''
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    return value
+
+
+class HealthEventStore:
+    def __init__(self, db_path: str):
+        """
+        보강된 Health 이벤트를 저장하는 SQLite 로컬 저장소
+
+        (계정, ARN)을 키로 이벤트를 저장하며 서비스/리전/카테고리/상태/갱신 시간에
+        인덱스가 있어 대시보드나 보고서가 AWS 호출 없이 이력을 조회할 수 있습니다.
+        WAL 모드를 사용하므로 수집기가 쓰는 동안에도 다른 프로세스가 읽을 수 있습니다.
+
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+
+    def upsert_events(self, account: str, events: List[HealthEvent]) -> int:
+        """
+        이벤트 저장 (이미 있으면 갱신)
+
+        Args:
+            account: 계정 이름
+            events: HealthEvent 리스트
+
+        Returns:
+            저장한 이벤트 수
+        """
+        if not events:
+            return 0
+
+        columns = ['account'] + EVENT_COLUMNS
+        placeholders = ', '.join('?' for _ in columns)
+        updates = ', '.join(f"{column} = excluded.{column}" for column in EVENT_COLUMNS[1:])
+        rows = [
+            [account] + [_to_db_value(getattr(event, column)) for column in EVENT_COLUMNS]
+            for event in events
+        ]
+
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT INTO events ({', '.join(columns)}) VALUES ({placeholders}) "
+                f"ON CONFLICT (account, arn) DO UPDATE SET {updates}",
+                rows
+            )
+            self._conn.commit()
+
+        return len(rows)
+
+    def query_events(self, account: str = None, service: str = None, region: str = None,
+                     category: str = None, status: str = None, since: datetime = None,
+                     until: datetime = None, updated_since: datetime = None,
+                     limit: int = None) -> List[Dict]:
+        """
+        조건에 맞는 이벤트 조회
+
+        Args:
+            account: 계정 이름
+            service: 서비스 이름
+            region: 리전
+            category: 이벤트 카테고리 (issue, accountNotification, scheduledChange)
+            status: 상태 코드 (open, closed, upcoming)
+            since: 시작 시간 하한
+            until: 시작 시간 상한
+            updated_since: 마지막 갱신 시간 하한
+            limit: 최대 조회 개수
+
+        Returns:
+            이벤트 리스트 (최근 갱신 순, 각 항목에 'account' 포함)
+        """
+        conditions = []
+        params = []
+
+        for column, value in (('account', account), ('service', service), ('region', region),
+                              ('event_type_category', category), ('status', status)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+
+        for column, operator, value in (('start_time', '>=', since), ('start_time', '<=', until),
+                                        ('last_updated_time', '>=', updated_since)):
+            if value is not None:
+                conditions.append(f"{column} {operator} ?")
+                params.append(_to_db_value(value))
+
+        query = "SELECT * FROM events"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY last_updated_time DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        return [
+            {column: _from_db_value(column, row[column]) for column in ['account'] + EVENT_COLUMNS}
+            for row in rows
+        ]
+
+    def get_sync_state(self, account: str) -> Optional[Dict]:
+        """
+        계정의 증분 조회 상태 조회
+
+        Args:
+            account: 계정 이름
+
+        Returns:
+            {'watermark', 'days_back', 'full_loaded_at'} 딕셔너리 (없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT watermark, days_back, full_loaded_at FROM sync_state WHERE account = ?",
+                (account,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            'watermark': datetime.fromisoformat(row['watermark']),
+            'days_back': row['days_back'],
+            'full_loaded_at': datetime.fromisoformat(row['full_loaded_at'])
+        }
+
+    def set_sync_state(self, account: str, watermark: datetime, days_back: int, full_loaded_at: datetime):
+        """
+        계정의 증분 조회 상태 저장
+
+        Args:
+            account: 계정 이름
+            watermark: 마지막으로 반영한 lastUpdatedTime
+            days_back: 저장소가 채워진 조회 기간 (일)
+            full_loaded_at: 마지막 전체 조회 시간
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO sync_state (account, watermark, days_back, full_loaded_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (account) DO UPDATE SET watermark = excluded.watermark, "
+                "days_back = excluded.days_back, full_loaded_at = excluded.full_loaded_at",
+                (account, _to_db_value(watermark), days_back, _to_db_value(full_loaded_at))
+            )
+            self._conn.commit()
+
+    def delete_events_before(self, before: datetime, account: str = None) -> int:
+        """
+        오래된 이벤트 삭제
+
+        Args:
+            before: 이 시간보다 먼저 시작된 이벤트 삭제
+            account: 계정 이름 (None이면 전체 계정)
+
+        Returns:
+            삭제한 이벤트 수
+        """
+        query = "DELETE FROM events WHERE start_time != '' AND start_time < ?"
+        params = [_to_db_value(before)]
+        if account is not None:
+            query += " AND account = ?"
+            params.append(account)
+
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self):
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+# 프로세스 내 경로별로 공유하는 저장소 인스턴스
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_event_store(db_path: str) -> HealthEventStore:
+    """
+    경로별로 하나의 저장소 인스턴스를 공유하여 반환
+
+    Args:
+        db_path: SQLite 데이터베이스 파일 경로
+
+    Returns:
+        HealthEventStore 객체
+    """
+    db_path = os.path.abspath(db_path)
+    with _stores_lock:
+        if db_path not in _stores:
+            _stores[db_path] = HealthEventStore(db_path)
+        return _stores[db_path]
@@ -0,0 +1,400 @@
+import html
+import json
+from abc import ABC, abstractmethod
+from string import Template
+from typing import Dict, List, Tuple
+
+# 상태별 표시 이모지
+STATUS_EMOJI = {'HEALTHY': '✅', 'WARNING': '⚠️', 'CRITICAL': '🚨', 'ERROR': '❌'}
+
+# 상태별 HTML 스타일 클래스
+STATUS_STYLE = {'HEALTHY': 'success', 'WARNING': 'warning', 'CRITICAL': 'critical', 'ERROR': 'critical'}
+
+# Slack 메시지에 나열하는 최대 항목 수 (보고서 전체 기준)
+SLACK_MAX_ITEMS = 20
+
+# 콘솔 구분선 길이
+CONSOLE_WIDTH = 80
+
+
+def slack_escape(text) -> str:
+    """
+    Slack 메시지에서 특수 문자로 해석되는 &, <, > 이스케이프
+
+    Args:
+        text: 원본 값
+
+    Returns:
+        이스케이프된 문자열
+    """
+    return str(text).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+class ReportItem:
+    __slots__ = ('title', 'subtitle', 'fields', 'detail', 'style')
+
+    def __init__(self, title: str, subtitle: str = '', fields: List[Tuple[str, object]] = None,
+                 detail: str = '', style: str = 'info'):
+        """
+        보고서 섹션의 항목 (이벤트 하나, 조회 실패 계정 하나 등)
+
+        Args:
+            title: 항목 제목
+            subtitle: 제목 옆에 표시할 보조 정보 (리전 등)
+            fields: (라벨, 값) 리스트 (라벨이 빈 문자열이면 값만 표시)
+            detail: 긴 설명 (이메일과 콘솔에만 표시)
+            style: 스타일 ('critical', 'warning', 'success', 'info')
+        """
+        self.title = title
+        self.subtitle = subtitle
+        self.fields = fields or []
+        self.detail = detail
+        self.style = style
+
+
+class ReportSection:
+    __slots__ = ('title', 'items', 'columns', 'rows', 'bullets', 'note', 'style')
+
+    def __init__(self, title: str, items: List[ReportItem] = None, columns: List[Tuple[str, int]] = None,
+                 rows: List[Tuple[List, str]] = None, bullets: List[str] = None, note: str = '',
+                 style: str = 'info'):
+        """
+        보고서 섹션 (항목 목록, 표, 글머리 목록 중 필요한 것만 지정)
+
+        Args:
+            title: 섹션 제목
+            items: 항목 리스트
+            columns: 표 열 (머리글, 콘솔 너비) 리스트
+            rows: 표 행 (셀 리스트, 행 아래 표시할 메모) 리스트
+            bullets: 글머리 목록
+            note: 섹션 안내 문구
+            style: 안내 문구 스타일
+        """
+        self.title = title
+        self.items = items or []
+        self.columns = columns or []
+        self.rows = rows or []
+        self.bullets = bullets or []
+        self.note = note
+        self.style = style
+
+
+class HealthReport:
+    def __init__(self, kind: str, subject: str, headline: str, status: str, generated_at: str,
+                 metrics: List[Tuple[str, object]] = None, sections: List[ReportSection] = None,
+                 footer: List[str] = None, data: Dict = None):
+        """
+        점검 주기마다 한 번 계산하는 보고서 모델
+
+        이벤트 데이터를 한 번만 순회하여 표시할 항목을 만들어 두고, 이메일/Slack/JSON/콘솔
+        형식은 등록된 렌더러가 미리 컴파일한 템플릿으로 이 모델만 읽어 생성합니다.
+        형식별 결과는 한 번만 렌더링하여 보관하므로 채널이나 수신자가 늘어도 추가 비용이 없습니다.
+
+        Args:
+            kind: 보고서 종류 ('daily', 'urgent', 'error', 'consolidated' 등)
+            subject: 이메일 제목
+            headline: 보고서 머리글 (이모지 포함)
+            status: 전체 상태 ('HEALTHY', 'WARNING', 'CRITICAL', 'ERROR')
+            generated_at: 점검 시간 문자열
+            metrics: 요약 지표 (라벨, 값) 리스트
+            sections: 섹션 리스트
+            footer: 꼬리말 문장 리스트
+            data: JSON 형식으로 내보낼 원본 데이터
+        """
+        self.kind = kind
+        self.subject = subject
+        self.headline = headline
+        self.status = status
+        self.generated_at = generated_at
+        self.metrics = metrics or []
+        self.sections = sections or []
+        self.footer = footer or []
+        self.data = data if data is not None else {}
+        self._rendered = {}
+
+    @property
+    def status_label(self) -> str:
+        """이모지를 붙인 상태 문자열"""
+        return f"{STATUS_EMOJI.get(self.status, '❓')} {self.status}"
+
+    def render(self, renderer: str = 'html') -> str:
+        """
+        등록된 렌더러로 보고서 생성 (형식별로 한 번만 렌더링)
+
+        Args:
+            renderer: 렌더러 이름 ('html', 'slack', 'json', 'console')
+
+        Returns:
+            렌더링된 문자열
+        """
+        if renderer not in self._rendered:
+            self._rendered[renderer] = get_renderer(renderer).render(self)
+        return self._rendered[renderer]
+
+
+class ReportRenderer(ABC):
+    """보고서 렌더러 기본 클래스 (name과 render를 구현하여 register_renderer로 등록)"""
+    name = None
+
+    @abstractmethod
+    def render(self, report: HealthReport) -> str:
+        """
+        보고서를 이 렌더러의 형식으로 변환
+
+        Args:
+            report: 보고서
+
+        Returns:
+            렌더링된 문자열
+        """
+
+
+_renderers = {}
+
+
+def register_renderer(renderer: ReportRenderer) -> ReportRenderer:
+    """
+    렌더러 등록 (같은 이름이면 교체)
+
+    Args:
+        renderer: 렌더러 객체
+
+    Returns:
+        등록한 렌더러
+    """
+    _renderers[renderer.name] = renderer
+    return renderer
+
+
+def get_renderer(name: str) -> ReportRenderer:
+    """
+    이름으로 렌더러 조회
+
+    Args:
+        name: 렌더러 이름
+
+    Returns:
+        렌더러 객체
+    """
+    try:
+        return _renderers[name]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 보고서 형식: {name}") from None
+
+
+class HtmlRenderer(ReportRenderer):
+    """이메일 본문용 HTML 렌더러"""
+    name = 'html'
+
+    PAGE = Template("""<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; }
+        .header { background-color: #f8f9fa; padding: 20px; border-radius: 8px; }
+        .metric { display: inline-block; margin: 10px; padding: 15px;
+                 background-color: #e9ecef; border-radius: 8px; }
+        .critical { background-color: #f8d7da; border-left: 4px solid #dc3545; }
+        .warning { background-color: #fff3cd; border-left: 4px solid #ffc107; }
+        .success { background-color: #d1edff; border-left: 4px solid #0084ff; }
+        .event { margin: 10px 0; padding: 10px; border-radius: 4px; }
+        table { border-collapse: collapse; }
+        th, td { padding: 4px 10px; border-bottom: 1px solid #dee2e6; text-align: left; }
+    </style>
+</head>
+<body>
+    <div class="header $status_style">
+        <h1>$headline</h1>
+        <p><strong>점검 시간:</strong> $generated_at</p>
+        <p><strong>전체 상태:</strong> $status</p>
+    </div>
+$metrics$sections
+    <hr>
+$footer
+</body>
+</html>
+""")
+    METRICS = Template("    <div>\n$metrics    </div>\n")
+    METRIC = Template("        <div class=\"metric\"><strong>$label:</strong> $value</div>\n")
+    SECTION = Template("    <h2>$title</h2>\n$body")
+    NOTE = Template("    <div class=\"event $style\">$note</div>\n")
+    ITEM = Template("    <div class=\"event $style\"><strong>$title</strong>$subtitle$fields$detail</div>\n")
+    FIELD = Template("<br><strong>$label:</strong> $value")
+    VALUE = Template("<br>$value")
+    TABLE = Template("    <table>\n        <tr>$headers</tr>\n$rows    </table>\n")
+    ROW = Template("        <tr>$cells</tr>\n")
+    BULLETS = Template("    <ul>\n$bullets    </ul>\n")
+    FOOTER = Template("    <p><small>$line</small></p>\n")
+
+    def render(self, report: HealthReport) -> str:
+        escape = html.escape
+        metrics = ''
+        if report.metrics:
+            metrics = self.METRICS.substitute(metrics=''.join(
+                self.METRIC.substitute(label=escape(label), value=escape(str(value)))
+                for label, value in report.metrics
+            ))
+
+        sections = ''.join(self._render_section(section) for section in report.sections)
+        footer = ''.join(self.FOOTER.substitute(line=escape(line)) for line in report.footer)
+
+        return self.PAGE.substitute(
+            status_style=STATUS_STYLE.get(report.status, ''),
+            headline=escape(report.headline),
+            generated_at=escape(report.generated_at),
+            status=escape(report.status_label),
+            metrics=metrics,
+            sections=sections,
+            footer=footer
+        )
+
+    def _render_section(self, section: ReportSection) -> str:
+        escape = html.escape
+        body = ''
+        if section.note:
+            body += self.NOTE.substitute(style=section.style, note=escape(section.note))
+
+        for item in section.items:
+            fields = ''.join(
+                self.FIELD.substitute(label=escape(label), value=escape(str(value))) if label
+                else self.VALUE.substitute(value=escape(str(value)))
+                for label, value in item.fields
+            )
+            body += self.ITEM.substitute(
+                style=item.style,
+                title=escape(item.title),
+                subtitle=f" - {escape(item.subtitle)}" if item.subtitle else '',
+                fields=fields,
+                detail=self.VALUE.substitute(value=escape(item.detail)) if item.detail else ''
+            )
+
+        if section.columns:
+            headers = ''.join(f"<th>{escape(header)}</th>" for header, _ in section.columns)
+            rows = ''.join(
+                self.ROW.substitute(cells=''.join(f"<td>{escape(str(cell))}</td>" for cell in cells)
+                                    + (f"<td>{escape(note)}</td>" if note else ''))
+                for cells, note in section.rows
+            )
+            body += self.TABLE.substitute(headers=headers, rows=rows)
+
+        if section.bullets:
+            body += self.BULLETS.substitute(
+                bullets=''.join(f"        <li>{escape(bullet)}</li>\n" for bullet in section.bullets)
+            )
+
+        return self.SECTION.substitute(title=escape(section.title), body=body)
+
+
+class SlackRenderer(ReportRenderer):
+    """Slack Incoming Webhook용 mrkdwn 렌더러 (항목은 보고서 전체에서 최대 SLACK_MAX_ITEMS개)"""
+    name = 'slack'
+
+    HEADLINE = Template("$headline ($generated_at)")
+    SECTION = Template("*$title*")
+    ITEM = Template("• *$title*$subtitle$fields")
+    MORE = Template("…외 $count개 항목은 이메일 또는 AWS 콘솔에서 확인하세요.")
+
+    def render(self, report: HealthReport) -> str:
+        escape = slack_escape
+        lines = [self.HEADLINE.substitute(headline=escape(report.headline), generated_at=escape(report.generated_at))]
+        if report.metrics:
+            lines.append(' · '.join(f"{escape(label)} {escape(value)}" for label, value in report.metrics))
+
+        listed = 0
+        omitted = 0
+        for section in report.sections:
+            entries = []
+            if section.note:
+                entries.append(escape(section.note))
+            for item in section.items:
+                if listed >= SLACK_MAX_ITEMS:
+                    omitted += 1
+                    continue
+                fields = ' · '.join(f"{escape(label)} {escape(value)}" if label else escape(value)
+                                    for label, value in item.fields)
+                entries.append(self.ITEM.substitute(
+                    title=escape(item.title),
+                    subtitle=f" ({escape(item.subtitle)})" if item.subtitle else '',
+                    fields=f" - {fields}" if fields else ''
+                ))
+                listed += 1
+            for cells, note in section.rows:
+                if listed >= SLACK_MAX_ITEMS:
+                    omitted += 1
+                    continue
+                row = ' · '.join(escape(cell) for cell in cells)
+                entries.append(f"• {row}" + (f" - {escape(note)}" if note else ''))
+                listed += 1
+            entries.extend(f"• {escape(bullet)}" for bullet in section.bullets)
+
+            if entries:
+                lines.append(self.SECTION.substitute(title=escape(section.title)))
+                lines.extend(entries)
+
+        if omitted:
+            lines.append(self.MORE.substitute(count=omitted))
+        return '\n'.join(lines)
+
+
+class ConsoleRenderer(ReportRenderer):
+    """터미널 출력용 텍스트 렌더러"""
+    name = 'console'
+
+    HEADER = Template("$rule\n$headline\n$rule")
+    METRIC = Template("   $label: $value")
+    STATUS = Template("🎯 전체 상태: $status")
+    ITEM = Template("   • $title$subtitle")
+    FIELD = Template("       $label: $value")
+    VALUE = Template("       $value")
+
+    def render(self, report: HealthReport) -> str:
+        rule = '=' * CONSOLE_WIDTH
+        divider = '-' * CONSOLE_WIDTH
+        lines = ['', self.HEADER.substitute(rule=rule, headline=report.headline)]
+
+        if report.metrics:
+            lines.append("📊 전체 요약:")
+            lines.extend(self.METRIC.substitute(label=label, value=value) for label, value in report.metrics)
+            lines.append('')
+        lines.append(self.STATUS.substitute(status=report.status_label))
+        lines.append('')
+
+        for section in report.sections:
+            lines.append(f"{section.title}:")
+            if section.note:
+                lines.append(f"   {section.note}")
+            for item in section.items:
+                lines.append(self.ITEM.substitute(title=item.title,
+                                                  subtitle=f" - {item.subtitle}" if item.subtitle else ''))
+                lines.extend(self.FIELD.substitute(label=label, value=value) if label
+                             else self.VALUE.substitute(value=value)
+                             for label, value in item.fields)
+                if item.detail:
+                    lines.append(self.VALUE.substitute(value=item.detail))
+            if section.columns:
+                lines.append(divider)
+                lines.append(' '.join(f"{header:<{width}}" for header, width in section.columns))
+                lines.append(divider)
+                for cells, note in section.rows:
+                    lines.append(' '.join(f"{str(cell):<{width}}" for cell, (_, width) in zip(cells, section.columns)))
+                    if note:
+                        lines.append(f"    {note}")
+            lines.extend(f"   - {bullet}" for bullet in section.bullets)
+            lines.append(divider)
+
+        lines.extend(report.footer)
+        lines.append(f"점검 시간: {report.generated_at}")
+        lines.append(rule)
+        return '\n'.join(lines)
+
+
+class JsonRenderer(ReportRenderer):
+    """파일 저장/연동용 JSON 렌더러 (보고서의 원본 데이터를 그대로 직렬화)"""
+    name = 'json'
+
+    def render(self, report: HealthReport) -> str:
+        return json.dumps(report.data, indent=2, ensure_ascii=False, default=str)
+
+
+for _renderer in (HtmlRenderer(), SlackRenderer(), ConsoleRenderer(), JsonRenderer()):
+    register_renderer(_renderer)
@@ -0,0 +1,139 @@
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import List, Dict
+
+from health_event import HealthEvent, ACCOUNT_EVENT_FIELDS
+
+
+class HealthSnapshot:
+    def __init__(self, events: List[HealthEvent], status: str, days_back: int = 7,
+                 account: Dict = None, fetched_at: datetime = None):
+        """
+        한 번의 조회 결과로 만든 AWS Health 스냅샷
+
+        요약, 서비스별/리전별 집계, 계정 알림 목록은 처음 접근할 때 한 번만
+        계산되며 추가 API 호출 없이 같은 이벤트 목록에서 만들어집니다.
+
+        Args:
+            events: 정규화된 이벤트(HealthEvent) 리스트
+            status: 조회 상태 메시지 ("SUCCESS" 또는 "ERROR - ...")
+            days_back: 조회한 이전 일수
+            account: 조회한 계정 설정 정보
+            fetched_at: 조회 시간 (None이면 현재 시간)
+        """
+        self.events = events if status == "SUCCESS" else []
+        self.status = status
+        self.days_back = days_back
+        self.account = account
+        self.fetched_at = fetched_at or datetime.now(timezone.utc)
+
+    @property
+    def error_status(self) -> str:
+        """조회 실패 시 상태 메시지, 성공 시 None"""
+        return None if self.status == "SUCCESS" else self.status
+
+    @cached_property
+    def summary(self) -> Dict:
+        """
+        AWS Health 전체 요약 정보
+
+        Returns:
+            Health 요약 정보
+        """
+        summary = {
+            'total_events': 0,
+            'active_events': 0,
+            'resolved_events': 0,
+            'services_affected': 0,
+            'regions_affected': 0,
+            'critical_events': 0,
+            'error_status': self.error_status,
+            'last_updated': self.fetched_at.isoformat()
+        }
+
+        # API 호출이 실패했거나 이벤트가 없는 경우 (실제 정상 상태)
+        if not self.events:
+            return summary
+
+        # 활성 이벤트 (종료 시간이 없는 이벤트)
+        active_events = sum(1 for event in self.events if event.is_active)
+
+        summary.update({
+            'total_events': len(self.events),
+            'active_events': active_events,
+            'resolved_events': len(self.events) - active_events,
+            # 영향받은 서비스 및 리전 수
+            'services_affected': len({event.service for event in self.events if event.service is not None}),
+            'regions_affected': len({
+                event.region for event in self.events
+                if event.region is not None and event.region != 'Global'
+            }),
+            # 중요 이벤트 (issue 카테고리)
+            'critical_events': sum(1 for event in self.events if event.event_type_category == 'issue')
+        })
+        return summary
+
+    @cached_property
+    def by_service(self) -> Dict:
+        """서비스별 이벤트 집계"""
+        return self._aggregate_by('service')
+
+    @cached_property
+    def by_region(self) -> Dict:
+        """리전별 이벤트 집계"""
+        return self._aggregate_by('region')
+
+    @cached_property
+    def account_events(self) -> List[HealthEvent]:
+        """
+        계정 알림(accountNotification) 이벤트 목록
+
+        Returns:
+            계정별 이벤트 리스트
+        """
+        return [event for event in self.events if event.event_type_category == 'accountNotification']
+
+    def _aggregate_by(self, column: str) -> Dict:
+        """
+        지정한 컬럼 기준 이벤트 집계
+
+        Args:
+            column: 집계 기준 컬럼 ('service' 또는 'region')
+
+        Returns:
+            {값: {'total_events': n, 'critical_events': m}} 딕셔너리
+        """
+        if not self.events:
+            return {}
+
+        counts = {}
+        for event in self.events:
+            key = getattr(event, column)
+            if key is None:
+                continue
+            entry = counts.get(key)
+            if entry is None:
+                entry = counts[key] = {'total_events': 0, 'critical_events': 0}
+            entry['total_events'] += 1
+            if event.event_type_category == 'issue':
+                entry['critical_events'] += 1
+
+        # 값 기준 정렬 (기존 groupby 결과와 같은 순서)
+        return {key: counts[key] for key in sorted(counts)}
+
+    def to_dict(self) -> Dict:
+        """
+        기존 대시보드/보고서에서 사용하는 딕셔너리 형태로 변환
+
+        이벤트는 이 시점에만 딕셔너리로 변환됩니다.
+
+        Returns:
+            summary, events, services, regions, account_events 딕셔너리
+        """
+        return {
+            'summary': self.summary,
+            'events': [event.to_dict() for event in self.events],
+            'services': self.by_service,
+            'regions': self.by_region,
+            'account_events': [event.to_dict(ACCOUNT_EVENT_FIELDS) for event in self.account_events]
+        }
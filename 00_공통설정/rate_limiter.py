@@ -0,0 +1,224 @@
+import logging
+import random
+import threading
+import time
+from typing import Callable
+
+from botocore.exceptions import ConnectionError as BotoConnectionError, HTTPClientError
+
+# Health API 스로틀링 오류 코드
+THROTTLING_ERROR_CODES = {
+    'ThrottlingException',
+    'Throttling',
+    'TooManyRequestsException',
+    'RequestLimitExceeded',
+    'Rate exceeded'
+}
+
+# 재시도하면 성공할 수 있는 일시적인 서버 오류 코드
+TRANSIENT_ERROR_CODES = {
+    'InternalFailure',
+    'InternalError',
+    'InternalServerError',
+    'ServiceUnavailable',
+    'ServiceUnavailableException',
+    'RequestTimeout',
+    'RequestTimeoutException'
+}
+
+
+def is_throttling_error(error: Exception) -> bool:
+    """
+    예외가 API 스로틀링 오류인지 확인
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        스로틀링 오류 여부
+    """
+    response = getattr(error, 'response', None)
+    if isinstance(response, dict):
+        code = response.get('Error', {}).get('Code', '')
+        if code in THROTTLING_ERROR_CODES:
+            return True
+
+    return any(code in str(error) for code in THROTTLING_ERROR_CODES)
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    예외가 재시도하면 성공할 수 있는 일시적인 오류인지 확인 (스로틀링 제외)
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        연결 끊김/타임아웃, 5xx 응답, 일시적인 서버 오류 코드이면 True
+    """
+    # EndpointConnectionError, ConnectTimeoutError, ConnectionClosedError, ReadTimeoutError 등
+    if isinstance(error, (BotoConnectionError, HTTPClientError)):
+        return True
+
+    response = getattr(error, 'response', None)
+    if isinstance(response, dict):
+        if response.get('Error', {}).get('Code', '') in TRANSIENT_ERROR_CODES:
+            return True
+        return response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0) >= 500
+
+    return False
+
+
+class AdaptiveRateLimiter:
+    def __init__(self, max_rate: float = 10.0, min_rate: float = 0.5, burst: int = 10,
+                 decrease_factor: float = 0.5, recovery_per_second: float = 0.5,
+                 max_retries: int = 5, base_backoff: float = 0.5, max_backoff: float = 20.0,
+                 max_transient_retries: int = 2):
+        """
+        스로틀링에 반응하는 토큰 버킷 방식의 API 호출 속도 제한기
+
+        스로틀링 오류를 받으면 허용 속도를 즉시 줄이고(곱셈 감소),
+        이후 정상 응답이 이어지면 시간에 비례해 천천히 원래 속도로 회복합니다(덧셈 증가).
+
+        Args:
+            max_rate: 초당 최대 호출 수
+            min_rate: 스로틀링 시 내려갈 수 있는 최저 초당 호출 수
+            burst: 버킷에 모아둘 수 있는 최대 토큰 수
+            decrease_factor: 스로틀링 시 속도에 곱할 비율
+            recovery_per_second: 정상 응답 시 초당 회복되는 속도
+            max_retries: 스로틀링 오류 시 최대 재시도 횟수
+            base_backoff: 재시도 대기 시간 기준 (초)
+            max_backoff: 재시도 대기 시간 상한 (초)
+            max_transient_retries: 연결 오류/5xx 등 일시적인 오류 시 최대 재시도 횟수
+        """
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.burst = burst
+        self.decrease_factor = decrease_factor
+        self.recovery_per_second = recovery_per_second
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.max_transient_retries = max_transient_retries
+
+        self.rate = max_rate
+        self.tokens = float(burst)
+        self.throttle_count = 0
+
+        self._last_refill = time.monotonic()
+        self._last_adjust = self._last_refill
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 보충 (잠금 상태에서 호출)"""
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+
+    def acquire(self):
+        """
+        호출 토큰 하나를 얻을 때까지 대기
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) / self.rate
+
+            time.sleep(wait_time)
+
+    def on_throttle(self):
+        """
+        스로틀링 오류 발생 시 허용 속도 감소
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self.tokens = 0
+            self._last_adjust = now
+            self.throttle_count += 1
+            rate = self.rate
+
+        logging.warning(f"Health API 스로틀링 감지 - 호출 속도를 초당 {rate:.2f}회로 낮춥니다.")
+
+    def on_success(self):
+        """
+        정상 응답 시 허용 속도를 천천히 회복
+        """
+        with self._lock:
+            if self.rate >= self.max_rate:
+                return
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = min(self.max_rate, self.rate + (now - self._last_adjust) * self.recovery_per_second)
+            self._last_adjust = now
+
+    def call(self, func: Callable, *args, **kwargs):
+        """
+        속도 제한과 스로틀링/일시적인 오류 재시도를 적용하여 함수 호출
+
+        botocore 자체 재시도는 꺼져 있으므로 스로틀링은 속도를 낮춘 뒤, 연결 오류와 5xx 응답은
+        속도는 그대로 두고 재시도합니다. 재시도 대기 시간은 지수 백오프에 전체 지터(full jitter)를 적용합니다.
+
+        Args:
+            func: 호출할 함수 (예: boto3 클라이언트 메서드)
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            함수 반환값
+        """
+        transient_retries = 0
+        for attempt in range(self.max_retries + 1):
+            self.acquire()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if is_throttling_error(e):
+                    if attempt >= self.max_retries:
+                        raise
+                    self.on_throttle()
+                elif is_transient_error(e):
+                    if transient_retries >= self.max_transient_retries or attempt >= self.max_retries:
+                        raise
+                    transient_retries += 1
+                    logging.warning(f"Health API 일시적인 오류 - 재시도합니다 ({transient_retries}/"
+                                    f"{self.max_transient_retries}): {e}")
+                else:
+                    raise
+                backoff = min(self.max_backoff, self.base_backoff * (2 ** attempt))
+                time.sleep(random.uniform(0, backoff))
+                continue
+
+            self.on_success()
+            return result
+
+
+# 프로세스 전체에서 공유하는 Health API 속도 제한기
+_shared_limiter = None
+_shared_limiter_lock = threading.Lock()
+
+
+def get_shared_rate_limiter(max_rate: float = None) -> AdaptiveRateLimiter:
+    """
+    프로세스 전체에서 공유하는 속도 제한기 반환
+
+    Args:
+        max_rate: 초당 최대 호출 수 (지정하면 공유 제한기의 상한을 변경)
+
+    Returns:
+        공유 AdaptiveRateLimiter 객체
+    """
+    global _shared_limiter
+
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = AdaptiveRateLimiter()
+        if max_rate and max_rate != _shared_limiter.max_rate:
+            with _shared_limiter._lock:
+                _shared_limiter.max_rate = max_rate
+                _shared_limiter.rate = min(_shared_limiter.rate, max_rate)
+        return _shared_limiter
@@ -0,0 +1,319 @@
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from health_event import HealthEvent
+from health_snapshot import HealthSnapshot
+
+# 스냅샷 파일 형식 버전 (구조가 바뀌면 올려서 이전 파일을 무시)
+SNAPSHOT_FORMAT = 2
+
+# ISO 문자열로 저장하는 이벤트의 날짜/시간 필드
+EVENT_TIME_FIELDS = ('start_time', 'end_time', 'last_updated_time')
+
+# 스냅샷에 저장하는 계정 설정 필드 (액세스 키 등 자격 증명은 저장하지 않음)
+PUBLIC_ACCOUNT_FIELDS = ('name', 'description', 'account_id', 'region')
+
+# 기본 스냅샷 파일 이름 (설정 파일과 같은 폴더)
+DEFAULT_SNAPSHOT_FILE = 'health_snapshot.json'
+
+
+def _json_default(value):
+    """json.dump에서 datetime을 ISO 문자열로 변환"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _parse_time(value):
+    """ISO 문자열로 저장된 날짜/시간을 datetime으로 복원 (빈 값이나 해석할 수 없는 값은 그대로)"""
+    if not value or not isinstance(value, str):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return value
+
+
+def _event_from_json(data: Dict) -> HealthEvent:
+    """
+    스냅샷 파일의 이벤트 딕셔너리로 HealthEvent 생성
+
+    Args:
+        data: HealthEvent.to_dict 결과를 JSON으로 읽은 딕셔너리
+
+    Returns:
+        HealthEvent 객체
+    """
+    data = dict(data)
+    for field in EVENT_TIME_FIELDS:
+        if field in data:
+            data[field] = _parse_time(data[field])
+    return HealthEvent.from_dict(data)
+
+
+class SnapshotStore:
+    def __init__(self, path: str):
+        """
+        수집기가 발행한 최신 Health 스냅샷을 파일로 주고받는 저장소
+
+        스냅샷은 이벤트를 to_dict()로 변환한 JSON 파일로 저장하고 읽을 때 HealthEvent로 복원하므로
+        클래스 구조가 바뀌어도 파일 형식만 맞으면 읽을 수 있습니다. 수집기는 임시 파일에 쓴 뒤
+        교체(os.replace)하여 원자적으로 발행하므로 읽는 쪽은 항상 완전한 스냅샷만 봅니다.
+        읽기는 파일의 수정 시각과 크기가 바뀌었을 때만 다시 로드하며(읽을 수 없는 파일도 같은 기준으로 기억),
+        같은 프로세스의 모든 대시보드 세션이 한 객체를 공유합니다.
+
+        Args:
+            path: 스냅샷 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._cached_key = None
+        self._cached = None
+
+    def publish(self, all_accounts_data: Dict[str, Dict], days_back: int) -> int:
+        """
+        계정별 Health 데이터를 새 스냅샷으로 발행
+
+        Args:
+            all_accounts_data: 계정 이름별 Health 데이터 (get_all_accounts_health 결과)
+            days_back: 수집한 조회 기간 (일)
+
+        Returns:
+            발행한 스냅샷 버전
+        """
+        accounts = {}
+        for account_name, data in all_accounts_data.items():
+            account_info = data.get('account_info') or {}
+            accounts[account_name] = {
+                'account_info': {field: account_info[field] for field in PUBLIC_ACCOUNT_FIELDS if field in account_info},
+                'status': data['status'],
+                'error': data.get('error'),
+                'events': [event.to_dict() for event in data.get('events', [])],
+                'check_time': data.get('check_time'),
+                # 조회에 실패해 마지막 정상 데이터를 유지한 계정
+                'stale': data.get('stale', False),
+                'stale_error': data.get('stale_error')
+            }
+
+        snapshot = {
+            'format': SNAPSHOT_FORMAT,
+            'version': time.time_ns(),
+            'collected_at': datetime.now(timezone.utc).isoformat(),
+            'days_back': days_back,
+            'accounts': accounts
+        }
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False, default=_json_default)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        return snapshot['version']
+
+    def _file_key(self):
+        """파일 변경 여부 비교용 키 (수정 시각, 크기), 파일이 없으면 None"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self) -> Optional[Dict]:
+        """
+        최신 스냅샷 읽기 (파일이 바뀌지 않았으면 이전에 읽은 객체 반환)
+
+        반환한 객체는 여러 세션이 공유하므로 수정하지 않아야 합니다.
+
+        Returns:
+            {'version', 'collected_at', 'days_back', 'accounts'} 딕셔너리 (없거나 읽을 수 없으면 None)
+        """
+        key = self._file_key()
+        if key is None:
+            return None
+
+        with self._lock:
+            if key == self._cached_key:
+                return self._cached
+
+            # 읽지 못한 파일도 같은 파일이면 다시 읽지 않도록 키를 기억
+            self._cached_key = key
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    raw = json.load(f)
+            except Exception as e:
+                logging.warning(f"스냅샷 읽기 실패: {e}")
+                return self._cached
+
+            if raw.get('format') != SNAPSHOT_FORMAT:
+                logging.warning(f"지원하지 않는 스냅샷 형식: {raw.get('format')}")
+                self._cached = None
+                return None
+
+            try:
+                snapshot = self._restore(raw)
+            except Exception as e:
+                logging.warning(f"스냅샷 변환 실패: {e}")
+                return self._cached
+
+            self._cached = snapshot
+            return snapshot
+
+    @staticmethod
+    def _restore(raw: Dict) -> Dict:
+        """
+        JSON으로 읽은 스냅샷의 수집 시각과 이벤트를 datetime/HealthEvent로 복원
+
+        Args:
+            raw: 스냅샷 파일 내용
+
+        Returns:
+            {'version', 'collected_at', 'days_back', 'accounts'} 딕셔너리
+        """
+        accounts = {}
+        for account_name, account_data in raw['accounts'].items():
+            accounts[account_name] = {
+                **account_data,
+                'events': [_event_from_json(event) for event in account_data.get('events', [])]
+            }
+
+        return {
+            'format': raw['format'],
+            'version': raw['version'],
+            'collected_at': datetime.fromisoformat(raw['collected_at']),
+            'days_back': raw['days_back'],
+            'accounts': accounts
+        }
+
+
+def account_snapshot(account_data: Dict, days_back: int, collected_at: datetime = None) -> HealthSnapshot:
+    """
+    발행된 계정 데이터에서 조회 기간에 해당하는 HealthSnapshot 생성 (AWS 호출 없음)
+
+    수집기는 가장 긴 조회 기간으로 한 번 수집하고, 대시보드는 선택한 기간으로 이벤트를 걸러 사용합니다.
+
+    Args:
+        account_data: 스냅샷의 계정 데이터
+        days_back: 조회 기간 (일)
+        collected_at: 수집 시각 (기간 계산 기준, None이면 현재 시간)
+
+    Returns:
+        HealthSnapshot 객체
+    """
+    if account_data['status'] == 'error':
+        return HealthSnapshot([], f"ERROR - {account_data.get('error')}", days_back=days_back,
+                              account=account_data['account_info'], fetched_at=collected_at)
+
+    cutoff = (collected_at or datetime.now(timezone.utc)) - timedelta(days=days_back)
+    events = [
+        event for event in account_data['events']
+        if not isinstance(event.start_time, datetime) or event.start_time >= cutoff
+    ]
+    return HealthSnapshot(events, "SUCCESS", days_back=days_back,
+                          account=account_data['account_info'], fetched_at=collected_at)
+
+
+def fleet_accounts_data(snapshot: Dict, days_back: int) -> Dict[str, Dict]:
+    """
+    발행된 스냅샷을 get_all_accounts_health와 같은 구조의 계정별 데이터로 변환
+
+    Args:
+        snapshot: SnapshotStore.load 결과
+        days_back: 조회 기간 (일)
+
+    Returns:
+        계정 이름별 Health 데이터 딕셔너리
+    """
+    all_accounts_data = {}
+    for account_name, account_data in snapshot['accounts'].items():
+        account_snap = account_snapshot(account_data, days_back, snapshot['collected_at'])
+        data = {
+            'account_info': account_data['account_info'],
+            'summary': account_snap.summary,
+            'events': account_snap.events,
+            'services': account_snap.by_service,
+            'regions': account_snap.by_region,
+            'account_events': account_snap.account_events,
+            'check_time': account_data['check_time'],
+            'status': account_data['status']
+        }
+        if account_data['status'] == 'error':
+            data['error'] = account_data.get('error')
+        if account_data.get('stale'):
+            data.update(stale=True, stale_error=account_data.get('stale_error'))
+        all_accounts_data[account_name] = data
+    return all_accounts_data
+
+
+def snapshot_age(snapshot: Dict) -> float:
+    """
+    스냅샷이 수집된 뒤 지난 시간
+
+    Args:
+        snapshot: SnapshotStore.load 결과
+
+    Returns:
+        경과 시간 (초)
+    """
+    return (datetime.now(timezone.utc) - snapshot['collected_at']).total_seconds()
+
+
+def load_collector_config(config_file: str = None) -> Dict:
+    """
+    aws_config.json의 collector 설정 읽기 (스냅샷 경로는 설정 파일 기준 절대 경로로 변환)
+
+    Args:
+        config_file: AWS 설정 파일 경로 (None이면 이 파일과 같은 폴더의 aws_config.json)
+
+    Returns:
+        {'snapshot_path', 'interval_seconds', 'days_back', 'stale_after_seconds'} 딕셔너리
+    """
+    config_file = config_file or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'aws_config.json')
+
+    try:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            collector_config = json.load(f).get('collector', {})
+    except Exception:
+        collector_config = {}
+
+    interval = collector_config.get('interval_seconds', 300)
+    return {
+        'snapshot_path': os.path.join(os.path.dirname(os.path.abspath(config_file)),
+                                      collector_config.get('snapshot_path', DEFAULT_SNAPSHOT_FILE)),
+        'interval_seconds': interval,
+        'days_back': collector_config.get('days_back', 30),
+        'stale_after_seconds': collector_config.get('stale_after_seconds', interval * 3)
+    }
+
+
+# 프로세스 내 경로별로 공유하는 저장소 인스턴스
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_snapshot_store(path: str = None) -> SnapshotStore:
+    """
+    경로별로 하나의 스냅샷 저장소 인스턴스를 공유하여 반환
+
+    Args:
+        path: 스냅샷 파일 경로 (None이면 collector 설정의 snapshot_path)
+
+    Returns:
+        SnapshotStore 객체
+    """
+    path = os.path.abspath(path or load_collector_config()['snapshot_path'])
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = SnapshotStore(path)
+        return _stores[path]
@@ -9,7 +9,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timezone, timedelta
 from aws_health_service import AWSHealthService
-import time
+from snapshot_store import get_snapshot_store, load_collector_config, account_snapshot, snapshot_age
 
 # 페이지 설정
 st.set_page_config(
@@ -127,9 +127,8 @@ st.markdown("""
 with st.sidebar:
     st.markdown("### ⚙️ 설정")
     
-    # 임시로 계정 목록 가져오기 (설정 파일 확인용)
-    temp_service = AWSHealthService()
-    available_accounts = temp_service.get_available_accounts()
+    # 설정 파일에서 계정 목록만 읽기 (AWS 클라이언트 생성 없음)
+    available_accounts = AWSHealthService.list_accounts()
     
     # AWS 계정 선택
     if available_accounts:
@@ -167,6 +166,7 @@ with st.sidebar:
     
     # 수동 새로고침
     if st.button("🔄 새로고침", use_container_width=True):
+        # 직접 조회 캐시만 비움 (수집기 스냅샷은 다시 실행할 때 최신 버전을 읽음)
         st.cache_data.clear()
         st.rerun()
     
@@ -174,249 +174,310 @@ with st.sidebar:
     st.markdown("### ⏰ 마지막 업데이트")
     st.text(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
+# 자동 새로고침 확인 주기 (초)
+AUTO_REFRESH_SECONDS = 30
+
+# 직접 조회 캐시 유효 시간 (초)
+DIRECT_CACHE_TTL = 300
+
 # AWS Health 서비스 초기화
-@st.cache_data(ttl=300)  # 5분 캐시
+@st.cache_data(ttl=DIRECT_CACHE_TTL)  # 5분 캐시
 def get_health_data(days_back, selected_account):
     health_service = AWSHealthService(account_name=selected_account)
+    snapshot = health_service.get_snapshot(days_back)
     return {
-        'summary': health_service.get_health_summary(),
-        'events': health_service.get_service_health_events(days_back),
-        'services': health_service.get_events_by_service(),
-        'regions': health_service.get_events_by_region(),
-        'account_events': health_service.check_account_specific_events(),
+        **snapshot.to_dict(),
         'available_accounts': health_service.get_available_accounts(),
         'current_account': health_service.current_account
     }
 
-# 데이터 로딩
-try:
-    with st.spinner("AWS Health 데이터를 불러오는 중..."):
-        health_data = get_health_data(days_back, selected_account)
+# 수집기가 발행한 스냅샷 (health_collector.py 실행 시)
+collector_config = load_collector_config()
+snapshot_store = get_snapshot_store(collector_config['snapshot_path'])
+
+@st.cache_resource(max_entries=32)
+def get_snapshot_health_data(version, days_back, selected_account, _published):
+    # 스냅샷 버전별로 한 번만 변환하여 모든 세션이 공유
+    account_data = _published['accounts'][selected_account]
+    snapshot = account_snapshot(account_data, days_back, _published['collected_at'])
+    return {
+        **snapshot.to_dict(),
+        'available_accounts': list(_published['accounts']),
+        'current_account': account_data['account_info'],
+        'stale_error': account_data.get('stale_error') if account_data.get('stale') else None,
+        'check_time': account_data['check_time']
+    }
+
+def usable_snapshot(days_back, selected_account):
+    """선택한 계정과 기간을 포함하는 발행된 스냅샷 (없으면 None)"""
+    published = snapshot_store.load()
+    if (published and selected_account in published['accounts']
+            and days_back <= published['days_back']):
+        return published
+    return None
+
+def load_health_data(days_back, selected_account):
+    """
+    발행된 스냅샷에서 Health 데이터 읽기 (스냅샷이 없거나 계정/기간을 포함하지 않으면 직접 조회)
+    
+    Returns:
+        (Health 데이터, 사용한 스냅샷 또는 None) 튜플
+    """
+    published = usable_snapshot(days_back, selected_account)
+    if published:
+        data = get_snapshot_health_data(published['version'], days_back, selected_account, published)
+        return data, published
+    return get_health_data(days_back, selected_account), None
+
+def render_health_data(days_back, selected_account, show_resolved, show_scheduled):
+    """
+    요약 지표, 이벤트 목록, 차트 등 데이터에 따라 바뀌는 영역 표시
+    
+    자동 새로고침을 켜면 타이머마다 이 영역만 다시 실행되며(사이드바와 헤더는 그대로),
+    스냅샷은 버전이 바뀌었을 때만, 직접 조회는 캐시가 만료되었을 때만 다시 읽습니다.
+    """
+    try:
+        with st.spinner("AWS Health 데이터를 불러오는 중..."):
+            health_data, published = load_health_data(days_back, selected_account)
+        
+            # 데이터 출처 표시
+            if published:
+                collected_at = published['collected_at'].astimezone().strftime('%Y-%m-%d %H:%M:%S')
+                if snapshot_age(published) > collector_config['stale_after_seconds']:
+                    st.warning(f"⚠️ 수집기 스냅샷이 오래되었습니다 (수집 시각: {collected_at}). health_collector.py 실행 상태를 확인하세요.")
+                else:
+                    st.caption(f"📦 수집기 스냅샷 기준: {collected_at}")
+                if health_data.get('stale_error'):
+                    st.warning(f"⚠️ 최근 조회에 실패하여 마지막 정상 데이터({health_data['check_time']})를 표시합니다: {health_data['stale_error']}")
+        
+            # 현재 계정 정보 표시
+            if health_data.get('current_account'):
+                account_info = health_data['current_account']
+                st.markdown(f"""
+                <div class="alert-info">
+                    <strong>🔗 연결된 AWS 계정</strong><br>
+                    계정명: {account_info['name']}<br>
+                    설명: {account_info['description']}<br>
+                    리전: {account_info['region']}
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown("""
+                <div class="alert-warning">
+                    <strong>⚠️ AWS 계정 설정 필요</strong><br>
+                    aws_config.json 파일을 생성하고 계정 정보를 입력하세요.
+                </div>
+                """, unsafe_allow_html=True)
         
-        # 현재 계정 정보 표시
-        if health_data.get('current_account'):
-            account_info = health_data['current_account']
+        # 요약 정보 표시
+        summary = health_data['summary']
+    
+        # 상단 메트릭 카드
+        col1, col2, col3, col4, col5, col6 = st.columns(6)
+    
+        with col1:
             st.markdown(f"""
-            <div class="alert-info">
-                <strong>🔗 연결된 AWS 계정</strong><br>
-                계정명: {account_info['name']}<br>
-                설명: {account_info['description']}<br>
-                리전: {account_info['region']}
+            <div class="metric-card">
+                <p class="metric-number">{summary['total_events']}</p>
+                <p class="metric-label">총 이벤트</p>
             </div>
             """, unsafe_allow_html=True)
-        else:
+    
+        with col2:
+            st.markdown(f"""
+            <div class="metric-card" style="background: linear-gradient(135deg, #dc3545 0%, #c82333 100%);">
+                <p class="metric-number">{summary['active_events']}</p>
+                <p class="metric-label">활성 이벤트</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+        with col3:
+            st.markdown(f"""
+            <div class="metric-card" style="background: linear-gradient(135deg, #28a745 0%, #20c997 100%);">
+                <p class="metric-number">{summary['resolved_events']}</p>
+                <p class="metric-label">해결된 이벤트</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+        with col4:
+            st.markdown(f"""
+            <div class="metric-card" style="background: linear-gradient(135deg, #ffc107 0%, #fd7e14 100%);">
+                <p class="metric-number">{summary['critical_events']}</p>
+                <p class="metric-label">중요 이슈</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+        with col5:
+            st.markdown(f"""
+            <div class="metric-card" style="background: linear-gradient(135deg, #6f42c1 0%, #e83e8c 100%);">
+                <p class="metric-number">{summary['services_affected']}</p>
+                <p class="metric-label">영향받은 서비스</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+        with col6:
+            st.markdown(f"""
+            <div class="metric-card" style="background: linear-gradient(135deg, #17a2b8 0%, #6610f2 100%);">
+                <p class="metric-number">{summary['regions_affected']}</p>
+                <p class="metric-label">영향받은 리전</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+        st.markdown("---")
+    
+        # 전체 상태 요약
+        if summary['active_events'] == 0 and summary['critical_events'] == 0:
             st.markdown("""
+            <div class="alert-info">
+                <strong>✅ 모든 시스템 정상</strong><br>
+                현재 활성 이슈나 중요한 문제가 없습니다.
+            </div>
+            """, unsafe_allow_html=True)
+        elif summary['critical_events'] > 0:
+            st.markdown(f"""
+            <div class="alert-critical">
+                <strong>🚨 중요 이슈 감지</strong><br>
+                {summary['critical_events']}개의 중요한 이슈가 진행 중입니다. 즉시 확인이 필요합니다.
+            </div>
+            """, unsafe_allow_html=True)
+        elif summary['active_events'] > 0:
+            st.markdown(f"""
             <div class="alert-warning">
-                <strong>⚠️ AWS 계정 설정 필요</strong><br>
-                aws_config.json 파일을 생성하고 계정 정보를 입력하세요.
+                <strong>⚠️ 활성 이벤트 있음</strong><br>
+                {summary['active_events']}개의 이벤트가 진행 중입니다.
             </div>
             """, unsafe_allow_html=True)
+    
+        # 이벤트 목록
+        events = health_data['events']
+        if events:
+            st.subheader("📋 최근 이벤트 목록")
         
-    # 요약 정보 표시
-    summary = health_data['summary']
-    
-    # 상단 메트릭 카드
-    col1, col2, col3, col4, col5, col6 = st.columns(6)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <p class="metric-number">{summary['total_events']}</p>
-            <p class="metric-label">총 이벤트</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class="metric-card" style="background: linear-gradient(135deg, #dc3545 0%, #c82333 100%);">
-            <p class="metric-number">{summary['active_events']}</p>
-            <p class="metric-label">활성 이벤트</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
-        <div class="metric-card" style="background: linear-gradient(135deg, #28a745 0%, #20c997 100%);">
-            <p class="metric-number">{summary['resolved_events']}</p>
-            <p class="metric-label">해결된 이벤트</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
-        <div class="metric-card" style="background: linear-gradient(135deg, #ffc107 0%, #fd7e14 100%);">
-            <p class="metric-number">{summary['critical_events']}</p>
-            <p class="metric-label">중요 이슈</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col5:
-        st.markdown(f"""
-        <div class="metric-card" style="background: linear-gradient(135deg, #6f42c1 0%, #e83e8c 100%);">
-            <p class="metric-number">{summary['services_affected']}</p>
-            <p class="metric-label">영향받은 서비스</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col6:
-        st.markdown(f"""
-        <div class="metric-card" style="background: linear-gradient(135deg, #17a2b8 0%, #6610f2 100%);">
-            <p class="metric-number">{summary['regions_affected']}</p>
-            <p class="metric-label">영향받은 리전</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    # 전체 상태 요약
-    if summary['active_events'] == 0 and summary['critical_events'] == 0:
-        st.markdown("""
-        <div class="alert-info">
-            <strong>✅ 모든 시스템 정상</strong><br>
-            현재 활성 이슈나 중요한 문제가 없습니다.
-        </div>
-        """, unsafe_allow_html=True)
-    elif summary['critical_events'] > 0:
-        st.markdown(f"""
-        <div class="alert-critical">
-            <strong>🚨 중요 이슈 감지</strong><br>
-            {summary['critical_events']}개의 중요한 이슈가 진행 중입니다. 즉시 확인이 필요합니다.
-        </div>
-        """, unsafe_allow_html=True)
-    elif summary['active_events'] > 0:
-        st.markdown(f"""
-        <div class="alert-warning">
-            <strong>⚠️ 활성 이벤트 있음</strong><br>
-            {summary['active_events']}개의 이벤트가 진행 중입니다.
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # 이벤트 목록
-    events = health_data['events']
-    if events:
-        st.subheader("📋 최근 이벤트 목록")
-        
-        # 이벤트 필터링
-        df_events = pd.DataFrame(events)
+            # 이벤트 필터링
+            df_events = pd.DataFrame(events)
         
-        if not show_resolved:
-            df_events = df_events[df_events['end_time'].isnull() | (df_events['end_time'] == '')]
+            if not show_resolved:
+                df_events = df_events[df_events['end_time'].isnull() | (df_events['end_time'] == '')]
         
-        if not show_scheduled:
-            df_events = df_events[df_events['event_type_category'] != 'scheduledChange']
+            if not show_scheduled:
+                df_events = df_events[df_events['event_type_category'] != 'scheduledChange']
         
-        # 이벤트 테이블 표시
-        if not df_events.empty:
-            # 상태별 색상 매핑
-            def get_status_color(status):
-                if status == 'open':
-                    return "🔴"
-                elif status == 'closed':
-                    return "🟢"
-                elif status == 'upcoming':
-                    return "🟡"
-                else:
-                    return "⚪"
+            # 이벤트 테이블 표시
+            if not df_events.empty:
+                # 상태별 색상 매핑
+                def get_status_color(status):
+                    if status == 'open':
+                        return "🔴"
+                    elif status == 'closed':
+                        return "🟢"
+                    elif status == 'upcoming':
+                        return "🟡"
+                    else:
+                        return "⚪"
             
-            # 카테고리별 아이콘 매핑
-            def get_category_icon(category):
-                if category == 'issue':
-                    return "🚨"
-                elif category == 'accountNotification':
-                    return "📢"
-                elif category == 'scheduledChange':
-                    return "🔄"
-                else:
-                    return "📝"
+                # 카테고리별 아이콘 매핑
+                def get_category_icon(category):
+                    if category == 'issue':
+                        return "🚨"
+                    elif category == 'accountNotification':
+                        return "📢"
+                    elif category == 'scheduledChange':
+                        return "🔄"
+                    else:
+                        return "📝"
             
-            # 표시용 데이터 준비
-            display_df = df_events.copy()
-            display_df['상태'] = display_df['status'].apply(get_status_color)
-            display_df['카테고리'] = display_df['event_type_category'].apply(get_category_icon)
-            display_df['서비스'] = display_df['service']
-            display_df['리전'] = display_df['region']
-            display_df['시작 시간'] = pd.to_datetime(display_df['start_time']).dt.strftime('%Y-%m-%d %H:%M')
-            display_df['설명'] = display_df['description'].str[:100] + "..."
+                # 표시용 데이터 준비
+                display_df = df_events.copy()
+                display_df['상태'] = display_df['status'].apply(get_status_color)
+                display_df['카테고리'] = display_df['event_type_category'].apply(get_category_icon)
+                display_df['서비스'] = display_df['service']
+                display_df['리전'] = display_df['region']
+                display_df['시작 시간'] = pd.to_datetime(display_df['start_time']).dt.strftime('%Y-%m-%d %H:%M')
+                display_df['설명'] = display_df['description'].str[:100] + "..."
             
-            st.dataframe(
-                display_df[['상태', '카테고리', '서비스', '리전', '시작 시간', '설명']],
-                use_container_width=True,
-                hide_index=True
-            )
-        else:
-            st.info("필터 조건에 맞는 이벤트가 없습니다.")
-    
-    # 차트 섹션
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("📊 서비스별 이벤트")
-        services_data = health_data['services']
-        if services_data:
-            services_df = pd.DataFrame.from_dict(services_data, orient='index')
-            services_df = services_df.reset_index().rename(columns={'index': 'service'})
+                st.dataframe(
+                    display_df[['상태', '카테고리', '서비스', '리전', '시작 시간', '설명']],
+                    use_container_width=True,
+                    hide_index=True
+                )
+            else:
+                st.info("필터 조건에 맞는 이벤트가 없습니다.")
+    
+        # 차트 섹션
+        col1, col2 = st.columns(2)
+    
+        with col1:
+            st.subheader("📊 서비스별 이벤트")
+            services_data = health_data['services']
+            if services_data:
+                services_df = pd.DataFrame.from_dict(services_data, orient='index')
+                services_df = services_df.reset_index().rename(columns={'index': 'service'})
             
-            fig_services = px.bar(
-                services_df,
-                x='service',
-                y='total_events',
-                title="서비스별 이벤트 수",
-                color='critical_events',
-                color_continuous_scale='Reds'
-            )
-            fig_services.update_layout(
-                xaxis_tickangle=-45,
-                height=400
-            )
-            st.plotly_chart(fig_services, use_container_width=True)
-        else:
-            st.info("서비스별 데이터가 없습니다.")
-    
-    with col2:
-        st.subheader("🌍 리전별 이벤트")
-        regions_data = health_data['regions']
-        if regions_data:
-            regions_df = pd.DataFrame.from_dict(regions_data, orient='index')
-            regions_df = regions_df.reset_index().rename(columns={'index': 'region'})
+                fig_services = px.bar(
+                    services_df,
+                    x='service',
+                    y='total_events',
+                    title="서비스별 이벤트 수",
+                    color='critical_events',
+                    color_continuous_scale='Reds'
+                )
+                fig_services.update_layout(
+                    xaxis_tickangle=-45,
+                    height=400
+                )
+                st.plotly_chart(fig_services, use_container_width=True)
+            else:
+                st.info("서비스별 데이터가 없습니다.")
+    
+        with col2:
+            st.subheader("🌍 리전별 이벤트")
+            regions_data = health_data['regions']
+            if regions_data:
+                regions_df = pd.DataFrame.from_dict(regions_data, orient='index')
+                regions_df = regions_df.reset_index().rename(columns={'index': 'region'})
             
-            fig_regions = px.pie(
-                regions_df,
-                values='total_events',
-                names='region',
-                title="리전별 이벤트 분포"
-            )
-            fig_regions.update_layout(height=400)
-            st.plotly_chart(fig_regions, use_container_width=True)
-        else:
-            st.info("리전별 데이터가 없습니다.")
-    
-    # 계정별 알림
-    account_events = health_data['account_events']
-    if account_events:
-        st.subheader("📬 계정별 알림")
-        account_df = pd.DataFrame(account_events)
+                fig_regions = px.pie(
+                    regions_df,
+                    values='total_events',
+                    names='region',
+                    title="리전별 이벤트 분포"
+                )
+                fig_regions.update_layout(height=400)
+                st.plotly_chart(fig_regions, use_container_width=True)
+            else:
+                st.info("리전별 데이터가 없습니다.")
+    
+        # 계정별 알림
+        account_events = health_data['account_events']
+        if account_events:
+            st.subheader("📬 계정별 알림")
+            account_df = pd.DataFrame(account_events)
         
-        for _, event in account_df.iterrows():
-            with st.expander(f"📢 {event['event_type_code']} - {event['status']}"):
-                st.write(f"**서비스:** {event['service']}")
-                st.write(f"**리전:** {event['region']}")
-                st.write(f"**시작 시간:** {event['start_time']}")
-                st.write(f"**설명:** {event['description']}")
-    
-    # 자동 새로고침
-    if auto_refresh:
-        time.sleep(30)
-        st.rerun()
+            for _, event in account_df.iterrows():
+                with st.expander(f"📢 {event['event_type_code']} - {event['status']}"):
+                    st.write(f"**서비스:** {event['service']}")
+                    st.write(f"**리전:** {event['region']}")
+                    st.write(f"**시작 시간:** {event['start_time']}")
+                    st.write(f"**설명:** {event['description']}")
+    
+        # 자동 새로고침 (타이머마다 이 부분만 다시 그림)
+        if auto_refresh:
+            st.caption(f"🔁 자동 새로고침 ({AUTO_REFRESH_SECONDS}초마다) - 마지막 확인: {datetime.now().strftime('%H:%M:%S')}")
+
+    except Exception as e:
+        st.error(f"AWS Health 데이터 로딩 중 오류가 발생했습니다: {str(e)}")
+        st.markdown("""
+        ### 🔧 문제 해결 방법:
+        1. **AWS 자격 증명 확인**: `aws configure` 명령으로 AWS 자격 증명이 올바르게 설정되었는지 확인
+        2. **권한 확인**: Health API 사용을 위해 `support:DescribeHealthEvents` 권한이 필요
+        3. **리전 확인**: Health API는 `us-east-1` 리전에서만 사용 가능
+        4. **Business/Enterprise 지원 플랜**: Health API는 Business 또는 Enterprise 지원 플랜에서만 사용 가능
+        """)
 
-except Exception as e:
-    st.error(f"AWS Health 데이터 로딩 중 오류가 발생했습니다: {str(e)}")
-    st.markdown("""
-    ### 🔧 문제 해결 방법:
-    1. **AWS 자격 증명 확인**: `aws configure` 명령으로 AWS 자격 증명이 올바르게 설정되었는지 확인
-    2. **권한 확인**: Health API 사용을 위해 `support:DescribeHealthEvents` 권한이 필요
-    3. **리전 확인**: Health API는 `us-east-1` 리전에서만 사용 가능
-    4. **Business/Enterprise 지원 플랜**: Health API는 Business 또는 Enterprise 지원 플랜에서만 사용 가능
-    """)
+# 데이터 영역 (자동 새로고침을 켜면 타이머마다 이 영역만 다시 그림, Streamlit 1.37 이상)
+st.fragment(run_every=AUTO_REFRESH_SECONDS if auto_refresh else None)(render_health_data)(
+    days_back, selected_account, show_resolved, show_scheduled
+)
 
 # 푸터
 st.markdown("---")
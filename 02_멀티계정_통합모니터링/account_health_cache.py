@@ -0,0 +1,278 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from typing import Dict, List, Set
+
+# 계정별 캐시 기본 유효 시간 (초)
+DEFAULT_TTL_SECONDS = 300
+
+# 조직 보기 전체 조회의 진행 중 작업 키 (계정 이름 대신 사용)
+ORGANIZATION_KEY = '*'
+
+
+def keep_last_good(previous: Dict, error: str) -> Dict:
+    """
+    조회에 실패한 계정의 마지막 정상 데이터를 오래된 데이터로 표시하여 반환
+
+    Args:
+        previous: 마지막으로 성공한 계정 데이터
+        error: 이번 조회의 오류 메시지
+
+    Returns:
+        stale/stale_error가 추가된 계정 데이터 (원본은 수정하지 않음)
+    """
+    return {**previous, 'stale': True, 'stale_error': error}
+
+
+class AccountHealthCache:
+    def __init__(self, monitor, default_ttl: float = None):
+        """
+        대시보드용 계정별 Health 데이터 캐시
+
+        계정마다 따로 유효 시간을 두어 만료된 계정만 다시 조회하며, 한 계정만 새로고침할 수도 있습니다.
+        만료된 계정은 백그라운드에서 계정별로 다시 조회하고 그동안 이전 데이터를 그대로 반환하므로
+        느린 계정이 화면 표시나 다른 세션을 막지 않습니다. 아직 데이터가 없는 계정만 조회 완료를 기다립니다.
+        조회에 실패한 계정은 마지막 정상 데이터를 오래된 데이터(stale)로 표시하여 유지합니다.
+        유효 시간은 계정 설정의 cache_ttl_seconds, 없으면 health_settings.account_cache_ttl_seconds를 따릅니다.
+
+        조직 보기를 사용하면 조직 API 한 번으로 모든 계정을 조회하므로 만료나 새로고침 시 전체를 다시 조회합니다.
+
+        Args:
+            monitor: AWSMultiAccountMonitor 객체
+            default_ttl: 기본 유효 시간 (초, None이면 설정 파일 값)
+        """
+        self.monitor = monitor
+        health_settings = monitor.config.get('health_settings', {})
+        self.default_ttl = default_ttl or health_settings.get('account_cache_ttl_seconds', DEFAULT_TTL_SECONDS)
+
+        # (계정 이름, 조회 기간) -> {'data', 'expires_at', 'fetched_at'}
+        self._entries = {}
+        # 조직 보기의 조회 기간별 계정 이름 순서 (조회 결과 기준)
+        self._account_names = {}
+        self._lock = threading.Lock()
+
+        # 진행 중인 백그라운드 조회 ((계정 이름 또는 ORGANIZATION_KEY, 조회 기간) -> Future)
+        # 같은 계정은 여러 세션이 요청해도 한 번만 조회
+        self._pending = {}
+        self._executor = ThreadPoolExecutor(max_workers=max(1, health_settings.get('max_workers', 8)),
+                                            thread_name_prefix='account-cache')
+
+        # 항목이 바뀔 때마다 증가 (통합 보고서 재계산 여부 판단용)
+        self.version = 0
+
+    def ttl_for(self, account: Dict) -> float:
+        """
+        계정에 적용되는 캐시 유효 시간
+
+        Args:
+            account: 계정 설정 정보
+
+        Returns:
+            유효 시간 (초)
+        """
+        return account.get('cache_ttl_seconds', self.default_ttl)
+
+    def get_all(self, days_back: int) -> Dict[str, Dict]:
+        """
+        모든 계정의 Health 데이터 반환
+
+        만료된 계정은 백그라운드 조회를 예약하고 이전 데이터를 바로 반환하며,
+        아직 한 번도 조회하지 않은 계정만 조회가 끝날 때까지 기다립니다.
+
+        Args:
+            days_back: 조회할 이전 일수
+
+        Returns:
+            계정 이름별 Health 데이터 딕셔너리
+        """
+        futures = self.refresh_expired(days_back)
+
+        with self._lock:
+            if self.monitor.use_organization_view():
+                missing = [] if days_back in self._account_names else list(futures.values())
+            else:
+                missing = [future for (name, _), future in futures.items() if (name, days_back) not in self._entries]
+        if missing:
+            wait(missing)
+
+        with self._lock:
+            return {
+                name: self._entries[(name, days_back)]['data']
+                for name in self._names(days_back)
+                if (name, days_back) in self._entries
+            }
+
+    def refresh_expired(self, days_back: int) -> Dict:
+        """
+        만료되었거나 아직 조회하지 않은 계정의 백그라운드 조회 예약 (기다리지 않음)
+
+        Args:
+            days_back: 조회할 이전 일수
+
+        Returns:
+            예약했거나 이미 진행 중인 조회의 (키, 조회 기간) -> Future 딕셔너리
+        """
+        return self._schedule(self._expired_accounts(days_back), days_back)
+
+    def refresh(self, account_name: str, days_back: int):
+        """
+        한 계정을 유효 시간과 관계없이 백그라운드에서 다시 조회 (기다리지 않음)
+
+        Args:
+            account_name: 계정 이름
+            days_back: 조회할 이전 일수
+        """
+        accounts = [account for account in self._configured_accounts() if account['name'] == account_name]
+        if self.monitor.use_organization_view() or not accounts:
+            self._schedule(None, days_back)
+        else:
+            self._schedule(accounts, days_back)
+
+    def refreshing(self, days_back: int) -> Set[str]:
+        """
+        백그라운드에서 다시 조회 중인 계정 이름
+
+        Args:
+            days_back: 조회 기간
+
+        Returns:
+            계정 이름 집합 (조직 보기 전체 조회 중이면 모든 계정)
+        """
+        with self._lock:
+            names = {name for name, pending_days in self._pending if pending_days == days_back}
+            if ORGANIZATION_KEY in names:
+                return set(self._names(days_back))
+            return names
+
+    def expire_all(self):
+        """모든 계정의 캐시를 만료시켜 다음 조회에서 다시 조회 (마지막 정상 데이터는 유지)"""
+        with self._lock:
+            for entry in self._entries.values():
+                entry['expires_at'] = 0
+
+    def newer_than(self, days_back: int, since: datetime) -> Dict[str, Dict]:
+        """
+        기준 시각 이후 조회되어 아직 유효한 계정 데이터
+
+        Args:
+            days_back: 조회 기간
+            since: 기준 시각 (UTC)
+
+        Returns:
+            계정 이름별 Health 데이터 딕셔너리
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                name: entry['data']
+                for (name, entry_days), entry in self._entries.items()
+                if entry_days == days_back and entry['fetched_at'] > since and entry['expires_at'] > now
+            }
+
+    def _configured_accounts(self) -> List[Dict]:
+        """설정 파일의 계정 목록"""
+        return self.monitor.config.get('aws_accounts', [])
+
+    def _names(self, days_back: int) -> List[str]:
+        """조회 기간의 계정 이름 순서 (잠금 상태에서 호출)"""
+        if self.monitor.use_organization_view():
+            return self._account_names.get(days_back, [])
+        return [account['name'] for account in self._configured_accounts()]
+
+    def _expired_accounts(self, days_back: int):
+        """
+        다시 조회해야 할 계정 목록
+
+        Returns:
+            만료된 계정 설정 리스트 (조직 보기에서 하나라도 만료되었으면 None: 전체 조회)
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self.monitor.use_organization_view():
+                names = self._account_names.get(days_back)
+                stale = not names or any(self._entries[(name, days_back)]['expires_at'] <= now for name in names)
+                return None if stale else []
+
+            return [
+                account for account in self._configured_accounts()
+                if (account['name'], days_back) not in self._entries
+                or self._entries[(account['name'], days_back)]['expires_at'] <= now
+            ]
+
+    def _schedule(self, accounts, days_back: int) -> Dict:
+        """
+        계정별 백그라운드 조회 예약 (이미 진행 중인 계정은 그 조회를 사용)
+
+        Args:
+            accounts: 조회할 계정 설정 리스트 (None이면 전체 조회)
+            days_back: 조회할 이전 일수
+
+        Returns:
+            (키, 조회 기간) -> Future 딕셔너리
+        """
+        if accounts is None:
+            requests = [(ORGANIZATION_KEY, None)]
+        else:
+            requests = [(account['name'], [account]) for account in accounts]
+
+        futures = {}
+        with self._lock:
+            for name, request in requests:
+                key = (name, days_back)
+                if key not in self._pending:
+                    self._pending[key] = self._executor.submit(self._fetch, key, request, days_back)
+                futures[key] = self._pending[key]
+        return futures
+
+    def _fetch(self, key, accounts, days_back: int):
+        """
+        계정을 조회하여 캐시에 저장 (백그라운드 스레드에서 실행, 조회 중에는 잠금을 잡지 않음)
+
+        Args:
+            key: 진행 중인 조회 키
+            accounts: 조회할 계정 설정 리스트 (None이면 전체 조회)
+            days_back: 조회할 이전 일수
+        """
+        try:
+            if accounts is None:
+                results = self.monitor.get_all_accounts_health(days_back)
+            else:
+                results = self.monitor.check_accounts(accounts, days_back)
+            self._store(results, days_back, organization=accounts is None)
+        except Exception as e:
+            logging.error(f"계정 캐시 조회 실패 ({key[0]}): {e}")
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def _store(self, results: Dict[str, Dict], days_back: int, organization: bool):
+        """
+        조회 결과를 캐시에 저장 (실패한 계정은 마지막 정상 데이터 유지)
+
+        Args:
+            results: 계정 이름별 Health 데이터
+            days_back: 조회 기간
+            organization: 전체 조회 결과이면 True (계정 이름 순서도 갱신)
+        """
+        ttl_by_name = {account['name']: self.ttl_for(account) for account in self._configured_accounts()}
+        now = time.monotonic()
+        fetched_at = datetime.now(timezone.utc)
+
+        with self._lock:
+            for name, data in results.items():
+                previous = self._entries.get((name, days_back))
+                if data['status'] == 'error' and previous and previous['data']['status'] != 'error':
+                    logging.warning(f"⚠️ {name}: 조회 실패 - 마지막 정상 데이터를 유지합니다 ({previous['data']['check_time']})")
+                    data = keep_last_good(previous['data'], data.get('error'))
+
+                self._entries[(name, days_back)] = {
+                    'data': data,
+                    'expires_at': now + ttl_by_name.get(name, self.default_ttl),
+                    'fetched_at': fetched_at
+                }
+
+            if organization:
+                self._account_names[days_back] = list(results)
+            self.version += 1
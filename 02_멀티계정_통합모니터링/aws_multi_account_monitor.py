@@ -4,9 +4,13 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '00_공통설정'))
 
 import json
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timezone
 from aws_health_service import AWSHealthService
+from health_snapshot import HealthSnapshot
+from fleet_frame import FleetFrame
+from health_report import HealthReport, ReportSection, STATUS_EMOJI
+from event_detail_cache import get_detail_cache
 import time
 import logging
 
@@ -37,6 +41,9 @@ class AWSMultiAccountMonitor:
         
         self.config_file = config_file
         self.load_config()
+        
+        # 마지막 점검의 계정별 소요 시간 (초)
+        self.last_account_timings = {}
     
     def load_config(self):
         """설정 파일 로드"""
@@ -48,111 +55,270 @@ class AWSMultiAccountMonitor:
             logging.error(f"설정 파일 로드 실패: {e}")
             self.config = {}
     
-    def get_all_accounts_health(self, days_back=7):
+    def get_all_accounts_health(self, days_back=7, use_organization=None):
         """
         모든 AWS 계정의 Health 상태 조회
         
         Args:
             days_back: 조회할 이전 일수
+            use_organization: 조직 보기 API 사용 여부 (None이면 설정 파일의 organization_view.enabled)
             
         Returns:
             계정별 Health 데이터 딕셔너리
         """
-        all_accounts_data = {}
+        if use_organization is None:
+            use_organization = self.use_organization_view()
+        
+        if use_organization:
+            all_accounts_data = self.get_organization_accounts_health(days_back)
+            if all_accounts_data:
+                return all_accounts_data
+            logging.warning("조직 보기 조회 실패 - 계정별 점검으로 전환합니다.")
+        
         accounts = self.config.get('aws_accounts', [])
         
         if not accounts:
             logging.warning("설정된 AWS 계정이 없습니다.")
             return {}
         
-        logging.info(f"=== {len(accounts)}개 AWS 계정 Health 점검 시작 ===")
+        return self.check_accounts(accounts, days_back)
+    
+    def use_organization_view(self):
+        """설정 파일의 조직 보기 사용 여부"""
+        return self.config.get('organization_view', {}).get('enabled', False)
+    
+    def check_accounts(self, accounts, days_back=7):
+        """
+        주어진 계정들을 병렬로 점검 (계정별 제한 시간 초과 시 오류로 처리)
         
-        for account in accounts:
-            account_name = account['name']
-            logging.info(f"📋 {account_name} 계정 점검 중...")
+        Args:
+            accounts: 점검할 계정 설정 정보 리스트
+            days_back: 조회할 이전 일수
             
-            try:
-                # 계정별 Health 서비스 초기화
-                health_service = AWSHealthService(account_name=account_name)
-                
-                # Health 데이터 수집
-                summary = health_service.get_health_summary()
-                events, event_status = health_service.get_service_health_events(days_back)
-                
-                # 오류 상태 확인
-                if summary.get('error_status'):
-                    # API 호출 실패
-                    account_data = {
-                        'account_info': account,
-                        'summary': summary,
-                        'events': [],
-                        'services': {},
-                        'regions': {},
-                        'account_events': [],
-                        'check_time': datetime.now().isoformat(),
-                        'status': 'error',
-                        'error': summary['error_status']
-                    }
-                    logging.error(f"❌ {account_name}: {summary['error_status']}")
-                    
-                else:
-                    # 정상 처리
-                    account_data = {
-                        'account_info': account,
-                        'summary': summary,
-                        'events': events,
-                        'services': health_service.get_events_by_service(),
-                        'regions': health_service.get_events_by_region(),
-                        'account_events': health_service.check_account_specific_events(),
-                        'check_time': datetime.now().isoformat(),
-                        'status': 'success'
-                    }
-                    
-                    # 요약 정보 로깅
-                    if summary['critical_events'] > 0:
-                        logging.warning(f"🚨 {account_name}: 중요 이슈 {summary['critical_events']}개 감지!")
-                    elif summary['active_events'] > 0:
-                        logging.info(f"⚠️ {account_name}: 활성 이벤트 {summary['active_events']}개")
-                    else:
-                        logging.info(f"✅ {account_name}: 정상 상태")
+        Returns:
+            계정별 Health 데이터 딕셔너리 (주어진 계정 순서 유지)
+        """
+        health_settings = self.config.get('health_settings', {})
+        max_workers = max(1, min(health_settings.get('max_workers', 8), len(accounts)))
+        account_timeout = health_settings.get('account_timeout_seconds', 120)
+        
+        logging.info(f"=== {len(accounts)}개 AWS 계정 Health 점검 시작 (동시 {max_workers}개) ===")
+        
+        self.last_account_timings = {}
+        start_times = {}
+        results = {}
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='health-check')
+        futures = {
+            executor.submit(self._check_account, account, days_back, start_times): account
+            for account in accounts
+        }
+        
+        try:
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
                 
-                all_accounts_data[account_name] = account_data
+                for future in done:
+                    results[futures[future]['name']] = future.result()
                 
-            except Exception as e:
-                logging.error(f"❌ {account_name} 점검 실패: {e}")
-                all_accounts_data[account_name] = {
-                    'account_info': account,
-                    'status': 'error',
-                    'error': str(e),
-                    'check_time': datetime.now().isoformat()
-                }
-            
-            # 계정 간 간격 (API 제한 방지)
-            time.sleep(1)
+                # 제한 시간을 넘긴 계정은 기다리지 않고 오류로 처리
+                now = time.monotonic()
+                for future in list(pending):
+                    account = futures[future]
+                    started = start_times.get(account['name'])
+                    if started is not None and now - started > account_timeout:
+                        pending.discard(future)
+                        logging.error(f"❌ {account['name']} 점검 시간 초과 ({account_timeout}초)")
+                        self.last_account_timings[account['name']] = now - started
+                        results[account['name']] = {
+                            'account_info': account,
+                            'status': 'error',
+                            'error': f"점검 시간 초과 ({account_timeout}초)",
+                            'check_time': datetime.now().isoformat()
+                        }
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        # 주어진 계정 순서 유지
+        all_accounts_data = {account['name']: results[account['name']] for account in accounts}
+        
+        slowest = max(self.last_account_timings.items(), key=lambda item: item[1], default=None)
+        if slowest:
+            logging.info(f"가장 오래 걸린 계정: {slowest[0]} ({slowest[1]:.2f}초)")
         
+        cache_stats = get_detail_cache().stats()
+        logging.info(f"이벤트 상세 정보 캐시: 적중 {cache_stats['hits']}회, 미스 {cache_stats['misses']}회 "
+                     f"(적중률 {cache_stats['hit_rate']:.0%}, {cache_stats['entries']}개 항목)")
         logging.info("=== 모든 계정 점검 완료 ===")
         return all_accounts_data
     
+    def _check_account(self, account, days_back, start_times):
+        """
+        단일 계정 Health 점검 (스레드 풀에서 실행)
+        
+        Args:
+            account: 계정 설정 정보
+            days_back: 조회할 이전 일수
+            start_times: 계정별 점검 시작 시각을 기록할 딕셔너리
+            
+        Returns:
+            계정별 Health 데이터 딕셔너리
+        """
+        account_name = account['name']
+        started = time.monotonic()
+        start_times[account_name] = started
+        logging.info(f"📋 {account_name} 계정 점검 중...")
+        
+        try:
+            # 계정별 Health 서비스 초기화
+            health_service = AWSHealthService(config_file=self.config_file, account_name=account_name)
+            
+            # Health 데이터 수집 (한 번 조회한 스냅샷에서 모든 집계 계산)
+            snapshot = health_service.get_snapshot(days_back)
+            account_data = self._build_account_data(account, snapshot)
+            
+        except Exception as e:
+            logging.error(f"❌ {account_name} 점검 실패: {e}")
+            account_data = {
+                'account_info': account,
+                'status': 'error',
+                'error': str(e),
+                'check_time': datetime.now().isoformat()
+            }
+        
+        elapsed = time.monotonic() - started
+        self.last_account_timings.setdefault(account_name, elapsed)
+        logging.info(f"⏱️ {account_name} 점검 소요 시간: {elapsed:.2f}초")
+        return account_data
+    
+    def get_organization_accounts_health(self, days_back=7):
+        """
+        Health 조직 보기 API로 조직 내 모든 계정의 Health 상태를 한 번에 조회
+        
+        관리 계정에서 조직 전체 이벤트를 일괄 조회한 뒤 계정별로 분류하므로
+        계정 수와 관계없이 API 호출 수가 거의 일정합니다.
+        
+        Args:
+            days_back: 조회할 이전 일수
+            
+        Returns:
+            계정별 Health 데이터 딕셔너리 (get_all_accounts_health와 동일한 구조, 실패 시 빈 딕셔너리)
+        """
+        org_config = self.config.get('organization_view', {})
+        management_account = org_config.get('management_account') or self.config.get('default_account')
+        
+        logging.info(f"=== 조직 보기 Health 점검 시작 (관리 계정: {management_account}) ===")
+        
+        health_service = AWSHealthService(config_file=self.config_file, account_name=management_account)
+        
+        # 계정 ID → 계정 설정 매핑 (설정 파일의 account_id 우선, 없으면 Organizations 계정 이름 사용)
+        configured_accounts = {
+            account['account_id']: account
+            for account in self.config.get('aws_accounts', [])
+            if account.get('account_id')
+        }
+        org_accounts = health_service.get_organization_accounts()
+        account_ids = list(dict.fromkeys(list(org_accounts) + list(configured_accounts)))
+        
+        events_by_account, status = health_service.get_organization_events_by_account(days_back, account_ids)
+        
+        if status != "SUCCESS":
+            logging.error(f"❌ 조직 보기 조회 실패: {status}")
+            return {}
+        
+        region = (health_service.current_account or {}).get('region', 'us-east-1')
+        all_accounts_data = {}
+        
+        for account_id, events in events_by_account.items():
+            account = configured_accounts.get(account_id) or {
+                'name': org_accounts.get(account_id, account_id),
+                'description': f"조직 계정 ({account_id})",
+                'account_id': account_id,
+                'region': region
+            }
+            
+            snapshot = HealthSnapshot(events, status, days_back=days_back, account=account)
+            all_accounts_data[account['name']] = self._build_account_data(account, snapshot)
+        
+        logging.info(f"=== 조직 보기 점검 완료: {len(all_accounts_data)}개 계정 ===")
+        return all_accounts_data
+    
+    def _build_account_data(self, account, snapshot):
+        """
+        스냅샷으로 계정별 Health 데이터 생성
+        
+        Args:
+            account: 계정 설정 정보
+            snapshot: 해당 계정의 HealthSnapshot
+            
+        Returns:
+            계정별 Health 데이터 딕셔너리
+        """
+        account_name = account['name']
+        summary = snapshot.summary
+        
+        # 오류 상태 확인
+        if summary.get('error_status'):
+            # API 호출 실패
+            logging.error(f"❌ {account_name}: {summary['error_status']}")
+            return {
+                'account_info': account,
+                'summary': summary,
+                'events': [],
+                'services': {},
+                'regions': {},
+                'account_events': [],
+                'check_time': datetime.now().isoformat(),
+                'status': 'error',
+                'error': summary['error_status']
+            }
+        
+        # 요약 정보 로깅
+        if summary['critical_events'] > 0:
+            logging.warning(f"🚨 {account_name}: 중요 이슈 {summary['critical_events']}개 감지!")
+        elif summary['active_events'] > 0:
+            logging.info(f"⚠️ {account_name}: 활성 이벤트 {summary['active_events']}개")
+        else:
+            logging.info(f"✅ {account_name}: 정상 상태")
+        
+        # 정상 처리
+        return {
+            'account_info': account,
+            'summary': summary,
+            'events': snapshot.events,
+            'services': snapshot.by_service,
+            'regions': snapshot.by_region,
+            'account_events': snapshot.account_events,
+            'check_time': datetime.now().isoformat(),
+            'status': 'success'
+        }
+    
     def generate_consolidated_report(self, all_accounts_data):
         """
         통합 보고서 생성
         
+        계정별 요약은 각 계정의 HealthSnapshot.summary를 그대로 사용하고, 모든 계정의 이벤트로
+        FleetFrame을 한 번 만들어 서비스×계정/리전×계정 매트릭스를 그룹 집계로 계산합니다.
+        
         Args:
             all_accounts_data: 모든 계정의 Health 데이터
             
         Returns:
             통합 보고서 딕셔너리
         """
+        frame = FleetFrame.from_accounts(all_accounts_data)
+        account_summaries = {
+            account_name: data['summary']
+            for account_name, data in all_accounts_data.items() if data['status'] != 'error'
+        }
+        
         total_accounts = len(all_accounts_data)
         healthy_accounts = 0
         warning_accounts = 0
         critical_accounts = 0
         error_accounts = 0
         
-        total_events = 0
-        total_critical_events = 0
-        total_active_events = 0
-        
         account_summary = []
         
         for account_name, data in all_accounts_data.items():
@@ -168,10 +334,7 @@ class AWSMultiAccountMonitor:
                 })
                 continue
             
-            summary = data['summary']
-            total_events += summary['total_events']
-            total_critical_events += summary['critical_events']
-            total_active_events += summary['active_events']
+            summary = account_summaries[account_name]
             
             # 계정 상태 분류
             if summary['critical_events'] > 0:
@@ -201,10 +364,12 @@ class AWSMultiAccountMonitor:
             'warning_accounts': warning_accounts,
             'critical_accounts': critical_accounts,
             'error_accounts': error_accounts,
-            'total_events': total_events,
-            'total_critical_events': total_critical_events,
-            'total_active_events': total_active_events,
+            'total_events': len(frame),
+            'total_critical_events': sum(summary['critical_events'] for summary in account_summaries.values()),
+            'total_active_events': sum(summary['active_events'] for summary in account_summaries.values()),
             'account_summary': account_summary,
+            'service_matrix': frame.matrix('service'),
+            'region_matrix': frame.matrix('region'),
             'overall_status': self.get_overall_status(critical_accounts, warning_accounts, error_accounts)
         }
     
@@ -227,67 +392,75 @@ class AWSMultiAccountMonitor:
         else:
             return 'HEALTHY'
     
-    def print_console_report(self, consolidated_report):
+    def build_report(self, consolidated_report):
         """
-        콘솔용 보고서 출력
+        통합 보고서로 출력용 보고서 모델 생성 (콘솔/JSON 등은 이 모델을 렌더링)
         
         Args:
             consolidated_report: 통합 보고서
+            
+        Returns:
+            HealthReport 객체
         """
-        print("\n" + "="*80)
-        print("🔍 AWS 멀티 계정 Health 점검 결과")
-        print("="*80)
-        
-        # 전체 요약
-        print(f"📊 전체 요약:")
-        print(f"   총 계정: {consolidated_report['total_accounts']}개")
-        print(f"   정상: {consolidated_report['healthy_accounts']}개")
-        print(f"   경고: {consolidated_report['warning_accounts']}개")
-        print(f"   중요: {consolidated_report['critical_accounts']}개")
-        print(f"   오류: {consolidated_report['error_accounts']}개")
-        print()
-        
-        # 전체 상태
-        status = consolidated_report['overall_status']
-        status_emoji = {"HEALTHY": "✅", "WARNING": "⚠️", "CRITICAL": "🚨"}
-        print(f"🎯 전체 상태: {status_emoji.get(status, '❓')} {status}")
-        print()
-        
-        # 계정별 상세
-        print("📋 계정별 상세:")
-        print("-"*80)
-        print(f"{'계정명':<20} {'상태':<10} {'중요':<6} {'활성':<6} {'총계':<6} {'서비스':<8} {'리전':<6}")
-        print("-"*80)
-        
+        account_rows = []
         for account in consolidated_report['account_summary']:
-            status_emoji = {
-                'HEALTHY': '✅',
-                'WARNING': '⚠️', 
-                'CRITICAL': '🚨',
-                'ERROR': '❌'
-            }
-            
-            emoji = status_emoji.get(account['status'], '❓')
-            
+            status = f"{STATUS_EMOJI.get(account['status'], '❓')} {account['status']}"
             if account['status'] == 'ERROR':
-                print(f"{account['account']:<20} {emoji} ERROR    -     -     -     -       -")
-                print(f"    오류: {account['error']}")
+                account_rows.append(([account['account'], status, '-', '-', '-', '-', '-'],
+                                     f"오류: {account['error']}"))
             else:
-                print(f"{account['account']:<20} {emoji} {account['status']:<8} "
-                      f"{account['critical_events']:<6} {account['active_events']:<6} "
-                      f"{account['total_events']:<6} {account['services_affected']:<8} "
-                      f"{account['regions_affected']:<6}")
-        
-        print("-"*80)
-        print(f"점검 시간: {consolidated_report['check_time']}")
-        print("="*80)
+                account_rows.append(([account['account'], status, account['critical_events'],
+                                      account['active_events'], account['total_events'],
+                                      account['services_affected'], account['regions_affected']], ''))
+        
+        sections = [ReportSection(
+            "📋 계정별 상세",
+            columns=[('계정명', 20), ('상태', 12), ('중요', 6), ('활성', 6), ('총계', 6), ('서비스', 8), ('리전', 6)],
+            rows=account_rows
+        )]
+        
+        # 서비스별 영향 (이벤트가 많은 서비스부터)
+        service_matrix = consolidated_report.get('service_matrix', {})
+        if service_matrix:
+            sections.append(ReportSection(
+                "🧩 서비스별 영향 (상위 10개)",
+                columns=[('서비스', 24), ('이벤트', 8), ('영향받은 계정', 12)],
+                rows=[([service, sum(account_counts.values()), f"{len(account_counts)}개"], '')
+                      for service, account_counts in list(service_matrix.items())[:10]]
+            ))
+        
+        return HealthReport(
+            kind='consolidated',
+            subject="AWS 멀티 계정 Health 점검 결과",
+            headline="🔍 AWS 멀티 계정 Health 점검 결과",
+            status=consolidated_report['overall_status'],
+            generated_at=consolidated_report['check_time'],
+            metrics=[
+                ("총 계정", f"{consolidated_report['total_accounts']}개"),
+                ("정상", f"{consolidated_report['healthy_accounts']}개"),
+                ("경고", f"{consolidated_report['warning_accounts']}개"),
+                ("중요", f"{consolidated_report['critical_accounts']}개"),
+                ("오류", f"{consolidated_report['error_accounts']}개")
+            ],
+            sections=sections,
+            data=consolidated_report
+        )
     
-    def save_report_to_file(self, consolidated_report, filename=None):
+    def print_console_report(self, report):
         """
-        보고서를 파일로 저장
+        콘솔용 보고서 출력
         
         Args:
-            consolidated_report: 통합 보고서
+            report: HealthReport 객체
+        """
+        print(report.render('console'))
+    
+    def save_report_to_file(self, report, filename=None):
+        """
+        보고서를 JSON 파일로 저장
+        
+        Args:
+            report: HealthReport 객체
             filename: 저장할 파일명 (None이면 자동 생성)
         """
         if not filename:
@@ -296,7 +469,7 @@ class AWSMultiAccountMonitor:
         
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(consolidated_report, f, indent=2, ensure_ascii=False)
+                f.write(report.render('json'))
             logging.info(f"보고서 저장 완료: {filename}")
         except Exception as e:
             logging.error(f"보고서 저장 실패: {e}")
@@ -317,12 +490,15 @@ class AWSMultiAccountMonitor:
         # 통합 보고서 생성
         consolidated_report = self.generate_consolidated_report(all_accounts_data)
         
+        # 출력용 보고서 모델은 한 번만 만들고 형식별로 렌더링
+        report = self.build_report(consolidated_report)
+        
         # 콘솔 출력
-        self.print_console_report(consolidated_report)
+        self.print_console_report(report)
         
         # 파일 저장
         if save_report:
-            self.save_report_to_file(consolidated_report)
+            self.save_report_to_file(report)
         
         return consolidated_report
 
@@ -9,7 +9,8 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timezone, timedelta
 from aws_multi_account_monitor import AWSMultiAccountMonitor
-import time
+from account_health_cache import AccountHealthCache
+from snapshot_store import get_snapshot_store, load_collector_config, fleet_accounts_data, snapshot_age
 
 # 페이지 설정
 st.set_page_config(
@@ -102,203 +103,322 @@ with st.sidebar:
     show_details = st.checkbox("상세 정보 표시", value=False)
     
     # 수동 새로고침
-    if st.button("🔄 전체 새로고침", use_container_width=True):
-        st.cache_data.clear()
-        st.rerun()
+    # 직접 조회 캐시만 만료시킴 (수집기 스냅샷은 다시 실행할 때 최신 버전을 읽음)
+    refresh_all = st.button("🔄 전체 새로고침", use_container_width=True)
     
     # 마지막 업데이트 시간
     st.markdown("### ⏰ 마지막 업데이트")
     st.text(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
-# 멀티 계정 데이터 로딩
-@st.cache_data(ttl=300)  # 5분 캐시
-def get_multi_account_data(days_back):
-    monitor = AWSMultiAccountMonitor()
-    all_accounts_data = monitor.get_all_accounts_health(days_back)
-    consolidated_report = monitor.generate_consolidated_report(all_accounts_data)
+# 자동 새로고침 확인 주기 (초)
+AUTO_REFRESH_SECONDS = 60
+
+# 백그라운드 새로고침 완료 확인 주기 (초)
+REFRESH_POLL_SECONDS = 2
+
+# 계정별 캐시 (모든 세션이 공유, 계정마다 유효 시간이 따로 만료됨)
+@st.cache_resource
+def get_account_cache():
+    return AccountHealthCache(AWSMultiAccountMonitor())
+
+account_cache = get_account_cache()
+if refresh_all:
+    account_cache.expire_all()
+
+# 수집기가 발행한 스냅샷 (health_collector.py 실행 시)
+collector_config = load_collector_config()
+snapshot_store = get_snapshot_store(collector_config['snapshot_path'])
+
+@st.cache_resource(max_entries=16)
+def get_snapshot_accounts_data(version, days_back, _published):
+    # 스냅샷 버전별로 한 번만 변환하여 모든 세션이 공유
+    return fleet_accounts_data(_published, days_back)
+
+@st.cache_resource(max_entries=16)
+def build_multi_account_data(cache_key, _all_accounts_data):
+    # 계정 데이터가 바뀐 경우에만 통합 보고서를 다시 집계하여 모든 세션이 공유
     return {
-        'all_accounts_data': all_accounts_data,
-        'consolidated_report': consolidated_report
+        'all_accounts_data': _all_accounts_data,
+        'consolidated_report': account_cache.monitor.generate_consolidated_report(_all_accounts_data)
     }
 
-# 데이터 로딩
-try:
-    with st.spinner("모든 AWS 계정의 Health 데이터를 불러오는 중..."):
-        data = get_multi_account_data(days_back)
-        all_accounts_data = data['all_accounts_data']
-        consolidated_report = data['consolidated_report']
-    
-    if not all_accounts_data:
-        st.error("설정된 AWS 계정이 없습니다. aws_config.json 파일을 확인하세요.")
-        st.stop()
-    
-    # 전체 요약 대시보드
-    st.subheader("📊 전체 요약")
-    
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        st.metric("총 계정", consolidated_report['total_accounts'])
-    
-    with col2:
-        st.metric("정상 계정", consolidated_report['healthy_accounts'], 
-                 delta=None if consolidated_report['healthy_accounts'] == consolidated_report['total_accounts'] else "")
-    
-    with col3:
-        st.metric("경고 계정", consolidated_report['warning_accounts'],
-                 delta=f"-{consolidated_report['warning_accounts']}" if consolidated_report['warning_accounts'] > 0 else None)
-    
-    with col4:
-        st.metric("중요 계정", consolidated_report['critical_accounts'],
-                 delta=f"-{consolidated_report['critical_accounts']}" if consolidated_report['critical_accounts'] > 0 else None)
-    
-    with col5:
-        st.metric("오류 계정", consolidated_report['error_accounts'],
-                 delta=f"-{consolidated_report['error_accounts']}" if consolidated_report['error_accounts'] > 0 else None)
-    
-    # 전체 상태 표시
-    overall_status = consolidated_report['overall_status']
-    if overall_status == 'HEALTHY':
-        st.success("✅ 모든 계정이 정상 상태입니다!")
-    elif overall_status == 'WARNING':
-        st.warning("⚠️ 일부 계정에 주의가 필요한 이벤트가 있습니다.")
-    else:
-        st.error("🚨 중요한 이슈가 감지되었습니다. 즉시 확인이 필요합니다!")
-    
-    # 계정별 상태 카드
-    st.subheader("🏢 계정별 상태")
-    
-    # 필터링된 계정 목록
-    filtered_accounts = []
-    for account_summary in consolidated_report['account_summary']:
-        status = account_summary['status']
-        if ((status == 'HEALTHY' and show_healthy) or 
-            (status == 'WARNING' and show_warning) or
-            (status == 'CRITICAL' and show_critical) or
-            (status == 'ERROR' and show_error)):
-            filtered_accounts.append(account_summary)
-    
-    # 계정 카드 표시
-    for account in filtered_accounts:
-        status = account['status'].lower()
-        status_colors = {
-            'healthy': 'success',
-            'warning': 'warning', 
-            'critical': 'error',
-            'error': 'secondary'
+def usable_snapshot(days_back):
+    """선택한 기간을 포함하는 발행된 스냅샷 (없으면 None)"""
+    published = snapshot_store.load()
+    if published and published['accounts'] and days_back <= published['days_back']:
+        return published
+    return None
+
+def load_multi_account_data(days_back):
+    """
+    발행된 스냅샷에서 멀티 계정 데이터 읽기 (스냅샷이 없거나 기간을 포함하지 않으면 계정별 캐시로 조회)
+    
+    스냅샷 이후 "이 계정 새로고침"으로 다시 조회한 계정은 새로 조회한 데이터를 사용합니다.
+    
+    Returns:
+        (멀티 계정 데이터, 사용한 스냅샷 또는 None) 튜플
+    """
+    # 조회 전에 읽어야 다른 세션이 캐시를 바꿔도 이전 데이터가 새 버전으로 캐시되지 않음
+    cache_version = account_cache.version
+    published = usable_snapshot(days_back)
+    
+    if published:
+        all_accounts_data = get_snapshot_accounts_data(published['version'], days_back, published)
+        refreshed = {
+            name: data for name, data in account_cache.newer_than(days_back, published['collected_at']).items()
+            if name in all_accounts_data
         }
+        if not refreshed:
+            return build_multi_account_data(('snapshot', published['version'], days_back), all_accounts_data), published
+        all_accounts_data = {**all_accounts_data, **refreshed}
+        cache_key = ('snapshot', published['version'], days_back, cache_version)
+        return build_multi_account_data(cache_key, all_accounts_data), published
+    
+    all_accounts_data = account_cache.get_all(days_back)
+    return build_multi_account_data(('cache', days_back, cache_version), all_accounts_data), None
+
+def refresh_interval(days_back):
+    """데이터 영역을 다시 그릴 주기 (백그라운드 새로고침 중이면 짧게, 자동 새로고침이면 60초, 아니면 None)"""
+    if account_cache.refreshing(days_back):
+        return REFRESH_POLL_SECONDS
+    return AUTO_REFRESH_SECONDS if auto_refresh else None
+
+def render_accounts(days_back, interval):
+    """
+    전체 요약, 계정별 카드, 통계 차트 등 데이터에 따라 바뀌는 영역 표시
+    
+    interval마다 이 영역만 다시 실행되며(사이드바와 헤더는 그대로), 스냅샷과 계정별 캐시에서
+    바뀐 데이터만 다시 읽습니다. 계정 새로고침 버튼도 이 영역만 다시 실행합니다.
+    
+    Args:
+        days_back: 조회 기간
+        interval: 이 영역을 다시 그리는 주기 (초, None이면 다시 그리지 않음)
+    """
+    try:
+        with st.spinner("모든 AWS 계정의 Health 데이터를 불러오는 중..."):
+            data, published = load_multi_account_data(days_back)
+            all_accounts_data = data['all_accounts_data']
+            consolidated_report = data['consolidated_report']
+    
+        # 데이터 출처 표시
+        if published:
+            collected_at = published['collected_at'].astimezone().strftime('%Y-%m-%d %H:%M:%S')
+            if snapshot_age(published) > collector_config['stale_after_seconds']:
+                st.warning(f"⚠️ 수집기 스냅샷이 오래되었습니다 (수집 시각: {collected_at}). health_collector.py 실행 상태를 확인하세요.")
+            else:
+                st.caption(f"📦 수집기 스냅샷 기준: {collected_at}")
+    
+        if not all_accounts_data:
+            st.error("설정된 AWS 계정이 없습니다. aws_config.json 파일을 확인하세요.")
+            return
+    
+        refreshing_accounts = account_cache.refreshing(days_back)
+    
+        # 전체 요약 대시보드
+        st.subheader("📊 전체 요약")
+    
+        col1, col2, col3, col4, col5 = st.columns(5)
+    
+        with col1:
+            st.metric("총 계정", consolidated_report['total_accounts'])
+    
+        with col2:
+            st.metric("정상 계정", consolidated_report['healthy_accounts'], 
+                     delta=None if consolidated_report['healthy_accounts'] == consolidated_report['total_accounts'] else "")
+    
+        with col3:
+            st.metric("경고 계정", consolidated_report['warning_accounts'],
+                     delta=f"-{consolidated_report['warning_accounts']}" if consolidated_report['warning_accounts'] > 0 else None)
+    
+        with col4:
+            st.metric("중요 계정", consolidated_report['critical_accounts'],
+                     delta=f"-{consolidated_report['critical_accounts']}" if consolidated_report['critical_accounts'] > 0 else None)
+    
+        with col5:
+            st.metric("오류 계정", consolidated_report['error_accounts'],
+                     delta=f"-{consolidated_report['error_accounts']}" if consolidated_report['error_accounts'] > 0 else None)
+    
+        # 전체 상태 표시
+        overall_status = consolidated_report['overall_status']
+        if overall_status == 'HEALTHY':
+            st.success("✅ 모든 계정이 정상 상태입니다!")
+        elif overall_status == 'WARNING':
+            st.warning("⚠️ 일부 계정에 주의가 필요한 이벤트가 있습니다.")
+        else:
+            st.error("🚨 중요한 이슈가 감지되었습니다. 즉시 확인이 필요합니다!")
+    
+        # 계정별 상태 카드
+        st.subheader("🏢 계정별 상태")
+    
+        # 필터링된 계정 목록
+        filtered_accounts = []
+        for account_summary in consolidated_report['account_summary']:
+            status = account_summary['status']
+            if ((status == 'HEALTHY' and show_healthy) or 
+                (status == 'WARNING' and show_warning) or
+                (status == 'CRITICAL' and show_critical) or
+                (status == 'ERROR' and show_error)):
+                filtered_accounts.append(account_summary)
+    
+        # 계정 카드 표시
+        for account in filtered_accounts:
+            status = account['status'].lower()
+            status_colors = {
+                'healthy': 'success',
+                'warning': 'warning', 
+                'critical': 'error',
+                'error': 'secondary'
+            }
         
-        with st.container():
-            st.markdown(f"""
-            <div class="account-card {status}">
-                <div class="metric-row">
-                    <h3>{account['account']}</h3>
-                    <span class="status-badge badge-{status}">{account['status']}</span>
-                </div>
-            """, unsafe_allow_html=True)
+            with st.container():
+                st.markdown(f"""
+                <div class="account-card {status}">
+                    <div class="metric-row">
+                        <h3>{account['account']}</h3>
+                        <span class="status-badge badge-{status}">{account['status']}</span>
+                    </div>
+                """, unsafe_allow_html=True)
             
-            if account['status'] != 'ERROR':
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("중요 이슈", account['critical_events'])
-                with col2:
-                    st.metric("활성 이벤트", account['active_events'])
-                with col3:
-                    st.metric("총 이벤트", account['total_events'])
-                with col4:
-                    st.metric("영향받은 서비스", account['services_affected'])
+                if account['status'] != 'ERROR':
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        st.metric("중요 이슈", account['critical_events'])
+                    with col2:
+                        st.metric("활성 이벤트", account['active_events'])
+                    with col3:
+                        st.metric("총 이벤트", account['total_events'])
+                    with col4:
+                        st.metric("영향받은 서비스", account['services_affected'])
                 
-                # 상세 정보 표시
-                if show_details and account['account'] in all_accounts_data:
-                    account_data = all_accounts_data[account['account']]
+                    # 상세 정보 표시
+                    if show_details and account['account'] in all_accounts_data:
+                        account_data = all_accounts_data[account['account']]
                     
-                    with st.expander(f"📋 {account['account']} 상세 정보"):
-                        # 최근 이벤트 목록
-                        events = account_data.get('events', [])
-                        if events:
-                            st.write("**최근 이벤트:**")
-                            events_df = pd.DataFrame(events[:5])  # 최대 5개만 표시
-                            st.dataframe(events_df[['service', 'event_type_category', 'region', 'status']], 
-                                       use_container_width=True)
-                        else:
-                            st.write("최근 이벤트가 없습니다.")
-            else:
-                st.error(f"오류: {account.get('error', 'Unknown error')}")
+                        with st.expander(f"📋 {account['account']} 상세 정보"):
+                            # 최근 이벤트 목록
+                            events = account_data.get('events', [])
+                            if events:
+                                st.write("**최근 이벤트:**")
+                                events_df = pd.DataFrame([event.to_dict() for event in events[:5]])  # 최대 5개만 표시
+                                st.dataframe(events_df[['service', 'event_type_category', 'region', 'status']], 
+                                           use_container_width=True)
+                            else:
+                                st.write("최근 이벤트가 없습니다.")
+                else:
+                    st.error(f"오류: {account.get('error', 'Unknown error')}")
             
-            st.markdown("</div>", unsafe_allow_html=True)
+                # 조회에 실패해 마지막 정상 데이터를 표시 중인 계정
+                account_data = all_accounts_data.get(account['account'], {})
+                if account_data.get('stale'):
+                    st.warning(f"⚠️ 최근 조회에 실패하여 마지막 정상 데이터({account_data['check_time']})를 표시합니다: "
+                               f"{account_data.get('stale_error')}")
+            
+                # 이 계정만 백그라운드에서 다시 조회 (다른 계정의 캐시는 그대로 유지)
+                if account['account'] in refreshing_accounts:
+                    st.caption("🔄 새로고침 중...")
+                st.button(
+                    "🔄 이 계정 새로고침",
+                    key=f"refresh_{account['account']}",
+                    on_click=account_cache.refresh,
+                    args=(account['account'], days_back)
+                )
+            
+                st.markdown("</div>", unsafe_allow_html=True)
     
-    # 통계 차트
-    if len(consolidated_report['account_summary']) > 1:
-        st.subheader("📈 통계 차트")
+        # 통계 차트
+        if len(consolidated_report['account_summary']) > 1:
+            st.subheader("📈 통계 차트")
         
-        col1, col2 = st.columns(2)
+            col1, col2 = st.columns(2)
         
-        with col1:
-            # 계정 상태 분포
-            status_counts = {
-                'HEALTHY': consolidated_report['healthy_accounts'],
-                'WARNING': consolidated_report['warning_accounts'], 
-                'CRITICAL': consolidated_report['critical_accounts'],
-                'ERROR': consolidated_report['error_accounts']
-            }
+            with col1:
+                # 계정 상태 분포
+                status_counts = {
+                    'HEALTHY': consolidated_report['healthy_accounts'],
+                    'WARNING': consolidated_report['warning_accounts'], 
+                    'CRITICAL': consolidated_report['critical_accounts'],
+                    'ERROR': consolidated_report['error_accounts']
+                }
             
-            # 0인 항목 제거
-            status_counts = {k: v for k, v in status_counts.items() if v > 0}
+                # 0인 항목 제거
+                status_counts = {k: v for k, v in status_counts.items() if v > 0}
             
-            if status_counts:
-                fig_status = px.pie(
-                    values=list(status_counts.values()),
-                    names=list(status_counts.keys()),
-                    title="계정 상태 분포",
-                    color_discrete_map={
-                        'HEALTHY': '#28a745',
-                        'WARNING': '#ffc107',
-                        'CRITICAL': '#dc3545',
-                        'ERROR': '#6c757d'
-                    }
-                )
-                st.plotly_chart(fig_status, use_container_width=True)
+                if status_counts:
+                    fig_status = px.pie(
+                        values=list(status_counts.values()),
+                        names=list(status_counts.keys()),
+                        title="계정 상태 분포",
+                        color_discrete_map={
+                            'HEALTHY': '#28a745',
+                            'WARNING': '#ffc107',
+                            'CRITICAL': '#dc3545',
+                            'ERROR': '#6c757d'
+                        }
+                    )
+                    st.plotly_chart(fig_status, use_container_width=True)
         
-        with col2:
-            # 계정별 이벤트 수
-            account_events = []
-            for account in consolidated_report['account_summary']:
-                if account['status'] != 'ERROR':
-                    account_events.append({
-                        'account': account['account'],
-                        'critical': account['critical_events'],
-                        'active': account['active_events']
-                    })
+            with col2:
+                # 계정별 이벤트 수
+                account_events = []
+                for account in consolidated_report['account_summary']:
+                    if account['status'] != 'ERROR':
+                        account_events.append({
+                            'account': account['account'],
+                            'critical': account['critical_events'],
+                            'active': account['active_events']
+                        })
             
-            if account_events:
-                events_df = pd.DataFrame(account_events)
-                fig_events = px.bar(
-                    events_df,
-                    x='account',
-                    y=['critical', 'active'],
-                    title="계정별 이벤트 수",
-                    color_discrete_map={
-                        'critical': '#dc3545',
-                        'active': '#ffc107'
-                    }
+                if account_events:
+                    events_df = pd.DataFrame(account_events)
+                    fig_events = px.bar(
+                        events_df,
+                        x='account',
+                        y=['critical', 'active'],
+                        title="계정별 이벤트 수",
+                        color_discrete_map={
+                            'critical': '#dc3545',
+                            'active': '#ffc107'
+                        }
+                    )
+                    fig_events.update_layout(xaxis_tickangle=-45)
+                    st.plotly_chart(fig_events, use_container_width=True)
+        
+            # 서비스 × 계정 이벤트 매트릭스
+            service_matrix = consolidated_report.get('service_matrix', {})
+            if service_matrix:
+                matrix_df = pd.DataFrame.from_dict(service_matrix, orient='index').fillna(0).astype(int)
+                fig_matrix = px.imshow(
+                    matrix_df,
+                    title="서비스 × 계정 이벤트 수",
+                    labels={'x': '계정', 'y': '서비스', 'color': '이벤트 수'},
+                    color_continuous_scale='Reds',
+                    text_auto=True,
+                    aspect='auto'
                 )
-                fig_events.update_layout(xaxis_tickangle=-45)
-                st.plotly_chart(fig_events, use_container_width=True)
+                st.plotly_chart(fig_matrix, use_container_width=True)
     
-    # 자동 새로고침
-    if auto_refresh:
-        time.sleep(60)
-        st.rerun()
+        if refreshing_accounts:
+            st.caption(f"🔄 {len(refreshing_accounts)}개 계정을 백그라운드에서 새로고침하는 중... (완료되면 자동으로 표시)")
+        elif auto_refresh:
+            st.caption(f"🔁 자동 새로고침 ({AUTO_REFRESH_SECONDS}초마다) - 마지막 확인: {datetime.now().strftime('%H:%M:%S')}")
+    
+        # 새로고침이 시작되거나 끝나 다시 그릴 주기가 바뀌었으면 페이지를 한 번 다시 실행해 주기를 적용
+        if refresh_interval(days_back) != interval:
+            st.rerun()
+
+    except Exception as e:
+        st.error(f"멀티 계정 데이터 로딩 중 오류가 발생했습니다: {str(e)}")
+        st.markdown("""
+        ### 🔧 문제 해결 방법:
+        1. **설정 파일 확인**: `aws_config.json` 파일이 올바르게 설정되었는지 확인
+        2. **AWS 자격 증명 확인**: 각 계정의 액세스 키가 유효한지 확인  
+        3. **권한 확인**: Health API 사용을 위한 권한이 있는지 확인
+        4. **지원 플랜 확인**: Business/Enterprise 지원 플랜이 필요
+        """)
 
-except Exception as e:
-    st.error(f"멀티 계정 데이터 로딩 중 오류가 발생했습니다: {str(e)}")
-    st.markdown("""
-    ### 🔧 문제 해결 방법:
-    1. **설정 파일 확인**: `aws_config.json` 파일이 올바르게 설정되었는지 확인
-    2. **AWS 자격 증명 확인**: 각 계정의 액세스 키가 유효한지 확인  
-    3. **권한 확인**: Health API 사용을 위한 권한이 있는지 확인
-    4. **지원 플랜 확인**: Business/Enterprise 지원 플랜이 필요
-    """)
+# 데이터 영역 (자동 새로고침이나 백그라운드 새로고침 중에는 주기마다 이 영역만 다시 그림, Streamlit 1.37 이상)
+interval = refresh_interval(days_back)
+st.fragment(run_every=interval)(render_accounts)(days_back, interval)
 
 # 푸터
 st.markdown("---")
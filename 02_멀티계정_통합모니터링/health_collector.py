@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '00_공통설정'))
+
+import argparse
+import threading
+import time
+import logging
+from aws_multi_account_monitor import AWSMultiAccountMonitor
+from account_health_cache import keep_last_good
+from snapshot_store import get_snapshot_store, load_collector_config
+
+class HealthCollector:
+    def __init__(self, config_file=None):
+        """
+        대시보드용 Health 스냅샷 수집기 초기화
+
+        정해진 주기마다 모든 계정의 Health 데이터를 한 번 조회해 스냅샷으로 발행합니다.
+        대시보드는 발행된 스냅샷만 읽으므로 AWS API 호출 수가 접속자 수와 관계없이 일정합니다.
+
+        Args:
+            config_file: AWS 설정 파일 경로 (None이면 자동 탐색)
+        """
+        self.monitor = AWSMultiAccountMonitor(config_file)
+        self.collector_config = load_collector_config(self.monitor.config_file)
+        self.interval = self.collector_config['interval_seconds']
+        self.days_back = self.collector_config['days_back']
+        self.store = get_snapshot_store(self.collector_config['snapshot_path'])
+        self._stop_event = threading.Event()
+
+    def collect_once(self):
+        """
+        모든 계정을 한 번 조회하여 스냅샷 발행
+
+        Returns:
+            발행한 스냅샷 버전 (실패 시 None)
+        """
+        started = time.monotonic()
+        try:
+            all_accounts_data = self.monitor.get_all_accounts_health(self.days_back)
+            self._keep_last_good(all_accounts_data)
+            version = self.store.publish(all_accounts_data, self.days_back)
+        except Exception as e:
+            logging.error(f"스냅샷 수집 실패: {e}")
+            return None
+
+        error_count = sum(1 for data in all_accounts_data.values() if data['status'] == 'error' or data.get('stale'))
+        logging.info(f"스냅샷 발행 완료: {len(all_accounts_data)}개 계정 (오류 {error_count}개), "
+                     f"{time.monotonic() - started:.1f}초 소요 → {self.store.path}")
+        return version
+
+    def _keep_last_good(self, all_accounts_data):
+        """
+        조회에 실패한 계정은 이전 스냅샷의 정상 데이터를 오래된 데이터로 표시하여 유지
+
+        Args:
+            all_accounts_data: 이번에 조회한 계정별 Health 데이터 (직접 수정)
+        """
+        previous = self.store.load()
+        if not previous:
+            return
+
+        for account_name, data in all_accounts_data.items():
+            last = previous['accounts'].get(account_name)
+            if data['status'] == 'error' and last and last['status'] != 'error':
+                logging.warning(f"⚠️ {account_name}: 조회 실패 - 마지막 정상 데이터를 유지합니다 ({last['check_time']})")
+                all_accounts_data[account_name] = keep_last_good(last, data.get('error'))
+
+    def run_forever(self):
+        """수집 주기마다 스냅샷 발행 (Ctrl+C 또는 stop() 호출 시 종료)"""
+        logging.info(f"Health 스냅샷 수집기 시작 (주기 {self.interval}초, 조회 기간 {self.days_back}일)")
+
+        try:
+            while not self._stop_event.is_set():
+                started = time.monotonic()
+                self.collect_once()
+                # 수집에 걸린 시간을 빼고 다음 주기까지 대기
+                self._stop_event.wait(max(0, self.interval - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            logging.info("수집기 종료 요청됨")
+
+        logging.info("Health 스냅샷 수집기 종료")
+
+    def stop(self):
+        """수집 루프 종료 요청"""
+        self._stop_event.set()
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='AWS Health 대시보드 스냅샷 수집기')
+    parser.add_argument('--config', help='AWS 설정 파일 경로')
+    parser.add_argument('--once', action='store_true', help='한 번만 수집하고 종료')
+    args = parser.parse_args()
+
+    collector = HealthCollector(args.config)
+
+    if args.once:
+        sys.exit(0 if collector.collect_once() else 1)
+
+    collector.run_forever()
+
+if __name__ == "__main__":
+    main()
@@ -45,13 +45,12 @@ python -m pip install --upgrade pip
 
 :: Install packages directly
 echo Installing required packages...
-pip install boto3>=1.34.0
-pip install streamlit>=1.28.0
-pip install plotly>=5.17.0
-pip install pandas>=2.1.0
-pip install schedule>=1.2.0
-pip install python-dateutil>=2.8.0
-pip install pytz>=2023.3
+pip install "boto3>=1.34.0"
+pip install "streamlit>=1.37.0"
+pip install "plotly>=5.17.0"
+pip install "pandas>=2.1.0"
+pip install "python-dateutil>=2.8.0"
+pip install "pytz>=2023.3"
 
 :: Verify installation
 echo.
@@ -0,0 +1,305 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+# 알림 상태
+STATE_OPEN = 'open'
+STATE_CLOSED = 'closed'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS alert_state (
+    account TEXT NOT NULL,
+    service TEXT NOT NULL,
+    event_type_code TEXT NOT NULL,
+    state TEXT NOT NULL,
+    last_notified_at REAL,
+    suppressed_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (account, service, event_type_code)
+);
+CREATE INDEX IF NOT EXISTS idx_alert_state_state ON alert_state (account, state);
+CREATE INDEX IF NOT EXISTS idx_alert_state_suppressed ON alert_state (suppressed_count)
+    WHERE suppressed_count > 0;
+
+CREATE TABLE IF NOT EXISTS digest_state (
+    name TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    sent_at REAL NOT NULL
+);
+"""
+
+
+def alert_key(account: str, event) -> Tuple[str, str, str]:
+    """
+    억제 규칙을 적용하는 키
+
+    Args:
+        account: 계정 이름
+        event: HealthEvent
+
+    Returns:
+        (계정, 서비스, 이벤트 코드) 튜플
+    """
+    return account, event.service, event.event_type_code
+
+
+def digest_fingerprint(*parts) -> str:
+    """
+    요약 내용이 바뀌었는지 비교하기 위한 지문
+
+    Args:
+        *parts: JSON으로 직렬화할 수 있는 값 (집합은 정렬한 리스트로 전달)
+
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class AlertRuleEngine:
+    def __init__(self, db_path: str, suppression_minutes: float = 180, overrides: Dict[str, float] = None):
+        """
+        알림 억제/병합 규칙 엔진
+
+        (계정, 서비스, 이벤트 코드)별로 마지막 알림 상태를 SQLite 테이블에 보관하여
+        같은 키의 이벤트가 억제 시간 안에 다시 열리면(깜빡이는 이벤트) 알림을 보내지 않고
+        억제 건수만 누적합니다. 억제 건수는 다음 일일 요약에 한 번에 모아 보고하며,
+        키가 닫혔다가 다시 열리는 등 상태가 바뀐 경우에만 억제 시간과 관계없이 바로 알립니다.
+
+        Args:
+            db_path: 상태를 저장할 SQLite 데이터베이스 파일 경로
+            suppression_minutes: 같은 키의 알림을 억제하는 기본 시간 (분)
+            overrides: 서비스("EC2") 또는 서비스/이벤트 코드("EC2/AWS_EC2_OPERATIONAL_ISSUE")별 억제 시간 (분)
+        """
+        self.db_path = db_path
+        self.suppression_seconds = suppression_minutes * 60
+        self.overrides = {key: minutes * 60 for key, minutes in (overrides or {}).items()}
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+
+    def suppression_window(self, service: str, event_type_code: str) -> float:
+        """
+        키에 적용되는 억제 시간
+
+        Args:
+            service: 서비스 이름
+            event_type_code: 이벤트 코드
+
+        Returns:
+            억제 시간 (초)
+        """
+        return self.overrides.get(f"{service}/{event_type_code}",
+                                  self.overrides.get(service, self.suppression_seconds))
+
+    def _load_states(self, keys) -> Dict[Tuple[str, str, str], sqlite3.Row]:
+        """주어진 키의 상태 행을 계정별 한 번의 조회로 읽기 (잠금 상태에서 호출)"""
+        keys_by_account = defaultdict(set)
+        for account, service, code in keys:
+            keys_by_account[account].add((service, code))
+
+        states = {}
+        for account, account_keys in keys_by_account.items():
+            rows = self._conn.execute(
+                "SELECT * FROM alert_state WHERE account = ?", (account,)
+            ).fetchall()
+            for row in rows:
+                if (row['service'], row['event_type_code']) in account_keys:
+                    states[(account, row['service'], row['event_type_code'])] = row
+        return states
+
+    def evaluate(self, events_by_account: Dict[str, List], now: float = None) -> Tuple[Dict, Dict]:
+        """
+        새 중요 이벤트 중 알림을 보낼 이벤트와 억제할 이벤트 구분
+
+        알림을 보내기로 한 키는 열림 상태와 알림 시각을 기록하고, 억제한 키는 억제 건수를 늘립니다.
+
+        Args:
+            events_by_account: 계정 이름별 새로운 중요 이벤트 목록
+            now: 기준 시각 (None이면 현재 시간)
+
+        Returns:
+            (알림 보낼 이벤트, 억제한 이벤트) 튜플 (각각 계정 이름별 이벤트 목록)
+        """
+        now = now or time.time()
+        events_by_key = defaultdict(list)
+        for account, events in events_by_account.items():
+            for event in events:
+                events_by_key[alert_key(account, event)].append(event)
+
+        notify = defaultdict(list)
+        suppressed = defaultdict(list)
+        notified_rows = []
+        suppressed_rows = []
+
+        with self._lock:
+            states = self._load_states(events_by_key)
+            for key, events in events_by_key.items():
+                account, service, code = key
+                row = states.get(key)
+                within_window = (
+                    row is not None and row['state'] == STATE_OPEN and row['last_notified_at'] is not None
+                    and now - row['last_notified_at'] < self.suppression_window(service, code)
+                )
+                if within_window:
+                    suppressed[account].extend(events)
+                    suppressed_rows.append((len(events), account, service, code))
+                else:
+                    # 처음 보는 키, 닫혔다가 다시 열린 키, 억제 시간이 지난 키는 알림
+                    notify[account].extend(events)
+                    notified_rows.append((account, service, code, STATE_OPEN, now))
+
+            self._conn.executemany(
+                "INSERT INTO alert_state (account, service, event_type_code, state, last_notified_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (account, service, event_type_code) DO UPDATE SET "
+                "state = excluded.state, last_notified_at = excluded.last_notified_at",
+                notified_rows
+            )
+            self._conn.executemany(
+                "UPDATE alert_state SET suppressed_count = suppressed_count + ? "
+                "WHERE account = ? AND service = ? AND event_type_code = ?",
+                suppressed_rows
+            )
+            self._conn.commit()
+
+        return dict(notify), dict(suppressed)
+
+    def update_states(self, account: str, events: List) -> int:
+        """
+        조회된 이벤트로 열린 키의 종료 여부 반영
+
+        키의 이벤트가 모두 닫힌 것으로 조회되면 닫힘 상태로 바꿔, 다시 열릴 때 바로 알리도록 합니다.
+        조회 기간 밖으로 사라진 키는 종료 여부를 알 수 없으므로 그대로 둡니다.
+
+        Args:
+            account: 계정 이름
+            events: 계정의 현재 이벤트 목록
+
+        Returns:
+            닫힘 상태로 바꾼 키 수
+        """
+        open_keys = set()
+        closed_keys = set()
+        for event in events:
+            if event.event_type_category != 'issue':
+                continue
+            key = (event.service, event.event_type_code)
+            if event.status == STATE_OPEN:
+                open_keys.add(key)
+            elif event.status == STATE_CLOSED:
+                closed_keys.add(key)
+
+        resolved = [(STATE_CLOSED, account, service, code) for service, code in closed_keys - open_keys]
+        if not resolved:
+            return 0
+
+        with self._lock:
+            cursor = self._conn.executemany(
+                "UPDATE alert_state SET state = ? WHERE account = ? AND service = ? "
+                "AND event_type_code = ? AND state = 'open'",
+                resolved
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def release(self, events_by_account: Dict[str, List]):
+        """
+        발송하지 못한 알림의 기록을 지워 다음 점검에서 다시 알리도록 함
+
+        Args:
+            events_by_account: 계정 이름별 이벤트 목록
+        """
+        keys = {alert_key(account, event) for account, events in events_by_account.items() for event in events}
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE alert_state SET last_notified_at = NULL "
+                "WHERE account = ? AND service = ? AND event_type_code = ?",
+                list(keys)
+            )
+            self._conn.commit()
+
+    def pending_suppressed(self) -> List[Dict]:
+        """
+        마지막 일일 요약 이후 억제된 알림 목록
+
+        Returns:
+            {'account', 'service', 'event_type_code', 'suppressed_count'} 딕셔너리 리스트 (건수 많은 순)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT account, service, event_type_code, suppressed_count FROM alert_state "
+                "WHERE suppressed_count > 0 ORDER BY suppressed_count DESC"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def clear_suppressed(self, reported: List[Dict]):
+        """
+        일일 요약에 보고한 억제 건수만큼 차감
+
+        요약을 만든 뒤 긴급 점검이 더한 건수는 다음 요약에 남도록 0으로 초기화하지 않고 보고한 건수만 뺍니다.
+
+        Args:
+            reported: 요약에 포함한 억제 목록 (pending_suppressed 결과)
+        """
+        rows = [
+            (entry['suppressed_count'], entry['account'], entry['service'], entry['event_type_code'])
+            for entry in reported
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE alert_state SET suppressed_count = MAX(suppressed_count - ?, 0) "
+                "WHERE account = ? AND service = ? AND event_type_code = ?",
+                rows
+            )
+            self._conn.commit()
+
+    def digest_changed(self, name: str, fingerprint: str) -> bool:
+        """
+        요약 내용이 마지막으로 보낸 요약과 다른지 확인
+
+        Args:
+            name: 요약 이름 (예: 'daily')
+            fingerprint: 현재 요약의 지문
+
+        Returns:
+            보낸 적이 없거나 지문이 다르면 True
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint FROM digest_state WHERE name = ?", (name,)
+            ).fetchone()
+        return row is None or row['fingerprint'] != fingerprint
+
+    def record_digest(self, name: str, fingerprint: str, now: float = None):
+        """
+        보낸 요약의 지문 기록
+
+        Args:
+            name: 요약 이름
+            fingerprint: 보낸 요약의 지문
+            now: 발송 시각 (None이면 현재 시간)
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO digest_state (name, fingerprint, sent_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET fingerprint = excluded.fingerprint, sent_at = excluded.sent_at",
+                (name, fingerprint, now or time.time())
+            )
+            self._conn.commit()
+
+    def close(self):
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            self._conn.close()
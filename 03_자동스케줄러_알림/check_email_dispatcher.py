@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+이메일 발송기(email_dispatcher.py) 동작 확인
+
+로컬에 띄운 가짜 SMTP 서버로 실제 메일 서버 없이 다음을 확인합니다.
+- 인증된 세션 하나로 여러 메일을 보내고, 수신자 전체를 한 번에 발송하는지
+- 오래 쉰 연결을 NOOP으로 확인하고, 서버가 끊었으면 다시 연결하는지
+- 4xx 응답은 재시도하고, 5xx 응답과 재시도 초과는 실패 콜백을 호출하는지
+- 발송 중 예외나 콜백 오류가 있어도 발송 스레드가 계속 동작하는지
+
+사용법:
+    python check_email_dispatcher.py [-v]
+"""
+import logging
+import socketserver
+import sys
+import threading
+import time
+
+import email_dispatcher
+from email_dispatcher import EmailDispatcher
+
+RECIPIENTS = ['ops1@example.com', 'ops2@example.com', 'ops3@example.com']
+
+# 발송 완료를 기다리는 최대 시간 (초)
+FLUSH_TIMEOUT = 10
+
+
+class FakeSMTPState:
+    """가짜 SMTP 서버가 기록하고 따르는 상태"""
+
+    def __init__(self):
+        self.connections = 0
+        self.noops = 0
+        # (RCPT 주소 리스트, 본문) 튜플 리스트
+        self.messages = []
+        # DATA 명령에 보낼 오류 응답 (남은 개수만큼 차례로 사용)
+        self.data_errors = []
+        # 메일을 받은 뒤 응답 없이 연결을 끊을지 여부 (유휴 연결이 서버에서 닫힌 상황)
+        self.drop_after_message = False
+
+
+class FakeSMTPHandler(socketserver.StreamRequestHandler):
+    """EHLO/MAIL/RCPT/DATA/NOOP/RSET/QUIT만 처리하는 SMTP 서버 (인증, TLS 없음)"""
+
+    def handle(self):
+        state = self.server.state
+        state.connections += 1
+        self._reply('220 fake smtp ready')
+        recipients = []
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode('utf-8', errors='replace').strip()
+            verb = command.split(' ', 1)[0].upper()
+
+            if verb in ('EHLO', 'HELO', 'RSET'):
+                self._reply('250 ok')
+            elif verb == 'MAIL':
+                recipients = []
+                self._reply('250 ok')
+            elif verb == 'RCPT':
+                recipients.append(command.split(':', 1)[1].strip(' <>'))
+                self._reply('250 ok')
+            elif verb == 'NOOP':
+                state.noops += 1
+                self._reply('250 ok')
+            elif verb == 'DATA':
+                if state.data_errors:
+                    self._reply(state.data_errors.pop(0))
+                    continue
+                self._reply('354 end with <CRLF>.<CRLF>')
+                body = []
+                while True:
+                    data = self.rfile.readline()
+                    if not data or data in (b'.\r\n', b'.\n'):
+                        break
+                    body.append(data)
+                state.messages.append((recipients, b''.join(body)))
+                self._reply('250 queued')
+                if state.drop_after_message:
+                    return
+            elif verb == 'QUIT':
+                self._reply('221 bye')
+                return
+            else:
+                self._reply('502 not implemented')
+
+    def _reply(self, text: str):
+        self.wfile.write(f"{text}\r\n".encode('utf-8'))
+
+
+def start_fake_smtp_server():
+    """
+    임의의 포트로 가짜 SMTP 서버 시작
+
+    Returns:
+        ThreadingTCPServer 객체 (server.state로 상태 확인)
+    """
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), FakeSMTPHandler)
+    server.daemon_threads = True
+    server.state = FakeSMTPState()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_dispatcher(server, max_retries: int = 3) -> EmailDispatcher:
+    """가짜 서버로 보내는 발송기 생성 (재시도 대기 시간은 짧게)"""
+    email_config = {
+        'smtp_server': '127.0.0.1',
+        'smtp_port': server.server_address[1],
+        'use_tls': False,
+        'sender_email': 'health@example.com',
+        'sender_password': '',
+        'recipients': RECIPIENTS,
+        'timeout_seconds': 5
+    }
+    return EmailDispatcher(email_config, max_retries=max_retries, base_backoff=0.01, max_backoff=0.05)
+
+
+def send(dispatcher: EmailDispatcher, subject: str) -> list:
+    """
+    메일 하나를 보내고 발송 결과를 기다림
+
+    Returns:
+        호출된 콜백 목록 ('success' 또는 'failure')
+    """
+    results = []
+    dispatcher.submit(subject, f"<p>{subject}</p>",
+                      on_failure=lambda: results.append('failure'),
+                      on_success=lambda: results.append('success'))
+    dispatcher.flush(FLUSH_TIMEOUT)
+    return results
+
+
+def check_session_reuse():
+    """세션 하나로 여러 메일 발송, 메일마다 수신자 전체를 한 번에 발송"""
+    server = start_fake_smtp_server()
+    dispatcher = make_dispatcher(server)
+    try:
+        results = [send(dispatcher, f"reuse {i}") for i in range(3)]
+    finally:
+        dispatcher.close()
+        server.shutdown()
+
+    state = server.state
+    ok = (results == [['success']] * 3 and len(state.messages) == 3 and state.connections == 1
+          and dispatcher.connect_count == 1
+          and all(recipients == RECIPIENTS for recipients, _ in state.messages))
+    return ok, f"메일 {len(state.messages)}개, 서버 연결 {state.connections}번, 수신자 {len(RECIPIENTS)}명 일괄 발송"
+
+
+def check_noop_reconnect():
+    """오래 쉰 연결은 NOOP으로 확인하고, 서버가 끊은 연결은 다시 연결"""
+    server = start_fake_smtp_server()
+    dispatcher = make_dispatcher(server)
+    noop_after = email_dispatcher.NOOP_CHECK_AFTER_SECONDS
+    # 모든 연결을 오래 쉰 연결로 취급
+    email_dispatcher.NOOP_CHECK_AFTER_SECONDS = -1
+    try:
+        first = send(dispatcher, 'before idle')
+        alive = send(dispatcher, 'still connected')
+        server.state.drop_after_message = True
+        dropped = send(dispatcher, 'server drops after this')
+        server.state.drop_after_message = False
+        reconnected = send(dispatcher, 'after reconnect')
+    finally:
+        email_dispatcher.NOOP_CHECK_AFTER_SECONDS = noop_after
+        dispatcher.close()
+        server.shutdown()
+
+    state = server.state
+    ok = (first == alive == dropped == reconnected == ['success'] and state.noops >= 2
+          and state.connections == 2 and len(state.messages) == 4)
+    return ok, f"NOOP {state.noops}번, 서버 연결 {state.connections}번 (끊긴 뒤 1번 재연결)"
+
+
+def check_transient_retry():
+    """4xx 응답은 재시도하여 발송"""
+    server = start_fake_smtp_server()
+    server.state.data_errors = ['451 try again later', '421 service not available']
+    dispatcher = make_dispatcher(server)
+    try:
+        results = send(dispatcher, 'retry')
+    finally:
+        dispatcher.close()
+        server.shutdown()
+
+    ok = results == ['success'] and len(server.state.messages) == 1 and dispatcher.failed_count == 0
+    return ok, f"4xx 응답 2번 후 발송, 콜백 {results}"
+
+
+def check_failure_callbacks():
+    """재시도 초과와 5xx 응답은 실패 콜백만 호출"""
+    server = start_fake_smtp_server()
+    dispatcher = make_dispatcher(server, max_retries=2)
+    try:
+        server.state.data_errors = ['451 try again later'] * 3
+        exhausted = send(dispatcher, 'retries exhausted')
+        server.state.data_errors = ['554 transaction failed']
+        permanent = send(dispatcher, 'permanent error')
+        remaining_errors = len(server.state.data_errors)
+        after = send(dispatcher, 'after failures')
+    finally:
+        dispatcher.close()
+        server.shutdown()
+
+    ok = (exhausted == ['failure'] and permanent == ['failure'] and remaining_errors == 0
+          and after == ['success'] and dispatcher.failed_count == 2)
+    return ok, f"재시도 초과 {exhausted}, 5xx {permanent} (재시도 없음), 이후 메일 {after}"
+
+
+def check_worker_survives_errors():
+    """발송 중 예외는 실패로 처리하고, 콜백 오류가 있어도 다음 메일 발송"""
+    server = start_fake_smtp_server()
+    dispatcher = make_dispatcher(server)
+    try:
+        def broken_callback():
+            raise RuntimeError('callback error')
+
+        dispatcher.submit('callback raises', '<p>x</p>', on_success=broken_callback)
+        dispatcher.flush(FLUSH_TIMEOUT)
+
+        # 발송 자체에서 예상하지 못한 예외가 나는 상황
+        send_with_retry = dispatcher._send_with_retry
+
+        def raising_send(subject, html):
+            raise RuntimeError('unexpected error')
+
+        dispatcher._send_with_retry = raising_send
+        raised = send(dispatcher, 'send raises')
+        dispatcher._send_with_retry = send_with_retry
+        after = send(dispatcher, 'after errors')
+    finally:
+        dispatcher.close()
+        server.shutdown()
+
+    ok = raised == ['failure'] and after == ['success'] and len(server.state.messages) == 2
+    return ok, f"발송 예외 {raised}, 이후 메일 {after}"
+
+
+CHECKS = [
+    ('세션 재사용', check_session_reuse),
+    ('NOOP 확인/재연결', check_noop_reconnect),
+    ('일시적 오류 재시도', check_transient_retry),
+    ('실패 콜백', check_failure_callbacks),
+    ('발송 스레드 유지', check_worker_survives_errors),
+]
+
+
+def main():
+    verbose = '-v' in sys.argv[1:]
+    logging.basicConfig(level=logging.INFO if verbose else logging.CRITICAL,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+
+    print("📧 이메일 발송기 동작 확인 (로컬 가짜 SMTP 서버)")
+    print("=" * 70)
+
+    failed = 0
+    for name, check in CHECKS:
+        started = time.monotonic()
+        try:
+            ok, detail = check()
+        except Exception as e:
+            ok, detail = False, f"오류: {e}"
+        failed += not ok
+        print(f"{'✅' if ok else '❌'} {name:<16} {detail} ({time.monotonic() - started:.2f}초)")
+
+    print("=" * 70)
+    print("모든 확인 통과" if not failed else f"{failed}개 확인 실패")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
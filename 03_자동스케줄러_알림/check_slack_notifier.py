@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Slack 발송기(slack_notifier.py) 동작 확인
+
+로컬에 띄운 가짜 웹훅 서버(http.server)로 실제 Slack 없이 다음을 확인합니다.
+- keep-alive 연결 하나로 여러 메시지를 보내고, 서버가 연결을 닫으면 다시 연결하는지
+- 묶음 대기 시간 동안 모인 메시지를 합치고, 최대 글자 수를 넘으면 나눠 보내는지
+- 429 응답의 Retry-After(초, HTTP 날짜, 해석할 수 없는 값)를 따라 다시 보내는지
+- 실패한 묶음에 들어 있던 메시지만 실패 콜백을 호출하는지
+
+사용법:
+    python check_slack_notifier.py [-v]
+"""
+import http.server
+import json
+import logging
+import sys
+import threading
+import time
+from email.utils import formatdate
+
+from slack_notifier import MAX_MESSAGE_CHARS, SlackNotifier
+
+# 발송 완료를 기다리는 최대 시간 (초)
+FLUSH_TIMEOUT = 15
+
+
+class FakeWebhookState:
+    """가짜 웹훅 서버가 기록하고 따르는 상태"""
+
+    def __init__(self):
+        self.connections = 0
+        # 받은 요청 본문 리스트 (성공 응답한 것만)
+        self.posts = []
+        # 다음 요청들에 보낼 (상태 코드, 헤더) 응답 (비어 있으면 200)
+        self.responses = []
+
+
+class FakeWebhookHandler(http.server.BaseHTTPRequestHandler):
+    """Slack Incoming Webhook처럼 JSON POST를 받아 'ok'로 응답하는 서버 (keep-alive)"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        self.server.state.connections += 1
+
+    def do_POST(self):
+        state = self.server.state
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        status, headers = state.responses.pop(0) if state.responses else (200, {})
+        if status == 200:
+            state.posts.append(json.loads(body))
+
+        reply = b'ok' if status == 200 else b'error'
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fake_webhook_server():
+    """
+    임의의 포트로 가짜 웹훅 서버 시작
+
+    Returns:
+        ThreadingHTTPServer 객체 (server.state로 상태 확인)
+    """
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), FakeWebhookHandler)
+    server.daemon_threads = True
+    server.state = FakeWebhookState()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_notifier(server, batch_window: float = 0.05, max_retries: int = 2) -> SlackNotifier:
+    """가짜 서버로 보내는 발송기 생성 (재시도 대기 시간은 짧게)"""
+    slack_config = {
+        'webhook_url': f"http://127.0.0.1:{server.server_address[1]}/services/hook",
+        'channel': '#aws-health',
+        'batch_window_seconds': batch_window,
+        'timeout_seconds': 5,
+        'max_retries': max_retries
+    }
+    return SlackNotifier(slack_config, base_backoff=0.01, max_backoff=0.05)
+
+
+def submit_all(notifier: SlackNotifier, texts: list) -> list:
+    """
+    메시지를 한꺼번에 대기열에 넣고 발송 결과를 기다림
+
+    Returns:
+        메시지별 호출된 콜백 목록 ('success' 또는 'failure')
+    """
+    results = [[] for _ in texts]
+    for text, result in zip(texts, results):
+        notifier.submit(text, on_failure=lambda r=result: r.append('failure'),
+                        on_success=lambda r=result: r.append('success'))
+    notifier.flush(FLUSH_TIMEOUT)
+    return results
+
+
+def check_keep_alive():
+    """연결 하나로 여러 번 발송하고, 서버가 연결을 닫으면 다시 연결"""
+    server = start_fake_webhook_server()
+    notifier = make_notifier(server)
+    try:
+        results = [submit_all(notifier, [f"message {i}"]) for i in range(3)]
+        reused = server.state.connections
+        server.state.responses = [(200, {'Connection': 'close'})]
+        results += [submit_all(notifier, [f"message {i}"]) for i in range(3, 5)]
+    finally:
+        notifier.close()
+        server.shutdown()
+
+    state = server.state
+    ok = (results == [[['success']]] * 5 and len(state.posts) == 5 and reused == 1
+          and state.connections == 2 and notifier.connect_count == 2
+          and all(post['channel'] == '#aws-health' for post in state.posts))
+    return ok, f"메시지 3개를 연결 {reused}번으로 발송, 서버가 닫은 뒤 연결 {state.connections}번"
+
+
+def check_batching():
+    """묶음 대기 시간 동안 모인 메시지를 하나로 합쳐 발송"""
+    server = start_fake_webhook_server()
+    notifier = make_notifier(server, batch_window=0.5)
+    texts = [f"*계정 {i}*: 새 이벤트" for i in range(5)]
+    try:
+        results = submit_all(notifier, texts)
+    finally:
+        notifier.close()
+        server.shutdown()
+
+    posts = server.state.posts
+    ok = (results == [['success']] * 5 and len(posts) == 1
+          and all(text in posts[0]['text'] for text in texts))
+    return ok, f"메시지 {len(texts)}개 → 발송 {len(posts)}번"
+
+
+def check_merge_limit():
+    """최대 글자 수를 넘는 묶음은 나눠서 발송하고 너무 긴 메시지는 잘라서 발송"""
+    server = start_fake_webhook_server()
+    notifier = make_notifier(server, batch_window=0.5)
+    texts = ['a' * 1500, 'b' * 1500, 'c' * 1500, 'd' * (MAX_MESSAGE_CHARS * 2)]
+    try:
+        results = submit_all(notifier, texts)
+    finally:
+        notifier.close()
+        server.shutdown()
+
+    posts = [post['text'] for post in server.state.posts]
+    ok = (results == [['success']] * 4 and len(posts) == 3
+          and all(len(post) <= MAX_MESSAGE_CHARS for post in posts)
+          and all(text in ''.join(posts) for text in texts[:3]) and '이하 생략' in posts[-1])
+    lengths = ', '.join(str(len(post)) for post in posts)
+    return ok, f"메시지 {len(texts)}개 → 발송 {len(posts)}번 (글자 수 {lengths}, 최대 {MAX_MESSAGE_CHARS})"
+
+
+def check_retry_after():
+    """429 응답은 Retry-After만큼 기다린 뒤 다시 발송 (해석할 수 없는 값은 백오프 사용)"""
+    server = start_fake_webhook_server()
+    notifier = make_notifier(server, max_retries=3)
+    try:
+        server.state.responses = [(429, {'Retry-After': '1'})]
+        started = time.monotonic()
+        seconds = submit_all(notifier, ['retry after seconds'])
+        waited = time.monotonic() - started
+
+        server.state.responses = [
+            (429, {'Retry-After': formatdate(time.time() - 60, usegmt=True)}),
+            (429, {'Retry-After': 'soon'}),
+            (429, {})
+        ]
+        started = time.monotonic()
+        others = submit_all(notifier, ['retry after date/garbage/missing'])
+        others_waited = time.monotonic() - started
+    finally:
+        notifier.close()
+        server.shutdown()
+
+    ok = (seconds == [['success']] and others == [['success']] and waited >= 1
+          and others_waited < 1 and len(server.state.posts) == 2)
+    return ok, f"Retry-After: 1 → {waited:.1f}초 대기, 지난 날짜/잘못된 값/없음 → {others_waited:.1f}초"
+
+
+def check_failure_callbacks():
+    """실패한 묶음의 메시지만 실패 콜백, 재시도 초과 시 실패 콜백"""
+    server = start_fake_webhook_server()
+    notifier = make_notifier(server, batch_window=0.5, max_retries=2)
+    try:
+        # 두 메시지는 글자 수 때문에 서로 다른 묶음으로 발송되고 첫 묶음만 거부됨
+        server.state.responses = [(400, {})]
+        per_chunk = submit_all(notifier, ['x' * 3000, 'y' * 3000])
+
+        server.state.responses = [(503, {})] * 3
+        exhausted = submit_all(notifier, ['server unavailable'])
+        after = submit_all(notifier, ['after failures'])
+    finally:
+        notifier.close()
+        server.shutdown()
+
+    ok = (per_chunk == [['failure'], ['success']] and exhausted == [['failure']]
+          and after == [['success']] and notifier.failed_count == 2)
+    return ok, f"묶음별 {per_chunk}, 5xx 재시도 초과 {exhausted}, 이후 메시지 {after}"
+
+
+CHECKS = [
+    ('keep-alive 재사용', check_keep_alive),
+    ('메시지 묶음', check_batching),
+    ('최대 글자 수 분할', check_merge_limit),
+    ('429 Retry-After', check_retry_after),
+    ('실패 콜백', check_failure_callbacks),
+]
+
+
+def main():
+    verbose = '-v' in sys.argv[1:]
+    logging.basicConfig(level=logging.INFO if verbose else logging.CRITICAL,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+
+    print("💬 Slack 발송기 동작 확인 (로컬 가짜 웹훅 서버)")
+    print("=" * 70)
+
+    failed = 0
+    for name, check in CHECKS:
+        started = time.monotonic()
+        try:
+            ok, detail = check()
+        except Exception as e:
+            ok, detail = False, f"오류: {e}"
+        failed += not ok
+        print(f"{'✅' if ok else '❌'} {name:<16} {detail} ({time.monotonic() - started:.2f}초)")
+
+    print("=" * 70)
+    print("모든 확인 통과" if not failed else f"{failed}개 확인 실패")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+import logging
+import queue
+import random
+import smtplib
+import threading
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import Callable, Dict
+
+# 연결을 재사용하기 전에 NOOP으로 상태를 확인하는 유휴 시간 (초)
+NOOP_CHECK_AFTER_SECONDS = 30
+
+# 이 시간 동안 보낼 메일이 없으면 연결 종료 (초)
+IDLE_DISCONNECT_SECONDS = 300
+
+# 전송 대기열 최대 크기
+MAX_QUEUE_SIZE = 100
+
+
+def is_transient_smtp_error(error: Exception) -> bool:
+    """
+    재시도하면 성공할 수 있는 SMTP 오류인지 확인
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        연결 끊김, 네트워크 오류, 4xx 응답이면 True
+    """
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return False
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    return isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, OSError))
+
+
+class EmailDispatcher:
+    def __init__(self, email_config: Dict, max_retries: int = 3, base_backoff: float = 2.0,
+                 max_backoff: float = 60.0):
+        """
+        백그라운드 스레드에서 알림 메일을 보내는 발송기
+
+        점검 스레드는 메일을 대기열에 넣기만 하고 바로 돌아가며, 발송 스레드가 인증된
+        SMTP 세션 하나를 유지하면서 순서대로 보냅니다. 오래 쉬었던 연결은 NOOP으로 확인하고
+        끊겼으면 다시 연결하며, 일시적인 오류는 지수 백오프로 재시도합니다.
+
+        Args:
+            email_config: health_config.json의 email 설정
+            max_retries: 일시적인 오류 시 최대 재시도 횟수
+            base_backoff: 재시도 대기 시간 기준 (초)
+            max_backoff: 재시도 대기 시간 상한 (초)
+        """
+        self.email_config = email_config
+        self.max_retries = email_config.get('max_retries', max_retries)
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self.sent_count = 0
+        self.failed_count = 0
+        self.connect_count = 0
+
+        self._queue = queue.Queue(maxsize=MAX_QUEUE_SIZE)
+        self._smtp = None
+        self._last_used = 0.0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='email-dispatcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, subject: str, html: str, on_failure: Callable = None, on_success: Callable = None) -> bool:
+        """
+        메일을 발송 대기열에 추가 (기다리지 않음)
+
+        Args:
+            subject: 메일 제목
+            html: HTML 본문
+            on_failure: 재시도 후에도 발송하지 못했을 때 발송 스레드에서 호출할 함수
+            on_success: 발송에 성공했을 때 발송 스레드에서 호출할 함수
+
+        Returns:
+            대기열에 추가했으면 True (대기열이 가득 찼거나 종료된 경우 False)
+        """
+        if self._closed:
+            return False
+
+        try:
+            self._queue.put_nowait((subject, html, on_failure, on_success))
+            return True
+        except queue.Full:
+            logging.error(f"메일 발송 대기열이 가득 차 메일을 버립니다: {subject}")
+            return False
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        대기열의 메일이 모두 처리될 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            모두 처리되었으면 True
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def close(self, timeout: float = 30):
+        """
+        남은 메일을 보낸 뒤 발송 스레드와 SMTP 연결 종료
+
+        Args:
+            timeout: 남은 메일을 기다리는 최대 시간 (초)
+        """
+        self.flush(timeout)
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def _run(self):
+        """발송 스레드: 대기열의 메일을 순서대로 발송"""
+        while True:
+            try:
+                item = self._queue.get(timeout=IDLE_DISCONNECT_SECONDS)
+            except queue.Empty:
+                # 오래 보낼 메일이 없으면 연결을 닫아 서버 쪽 타임아웃 방지
+                self._disconnect()
+                continue
+
+            if item is None:
+                self._queue.task_done()
+                self._disconnect()
+                return
+
+            subject, html, on_failure, on_success = item
+            try:
+                delivered = self._send_with_retry(subject, html)
+            except Exception as e:
+                # 발송 여부를 알 수 없으면 실패로 보고 다시 알릴 수 있게 함
+                self._disconnect()
+                logging.error(f"메일 발송 처리 중 오류: {e}")
+                delivered = False
+
+            try:
+                callback = on_success if delivered else on_failure
+                if callback:
+                    callback()
+            except Exception as e:
+                logging.error(f"메일 발송 결과 처리 중 오류: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _build_message(self, subject: str, html: str) -> MIMEMultipart:
+        """HTML 메일 메시지 생성"""
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = subject
+        msg['From'] = self.email_config['sender_email']
+        msg['To'] = ', '.join(self.email_config['recipients'])
+        msg.attach(MIMEText(html, 'html'))
+        return msg
+
+    def _send_with_retry(self, subject: str, html: str) -> bool:
+        """
+        일시적인 오류는 백오프 후 재시도하며 메일 발송
+
+        Args:
+            subject: 메일 제목
+            html: HTML 본문
+
+        Returns:
+            발송 성공 여부
+        """
+        msg = self._build_message(subject, html)
+        recipients = list(self.email_config['recipients'])
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                smtp = self._get_connection()
+                # 모든 수신자에게 한 세션, 한 번의 전송으로 발송
+                refused = smtp.send_message(msg, to_addrs=recipients)
+                self._last_used = time.monotonic()
+                if refused:
+                    logging.warning(f"일부 수신자에게 발송하지 못했습니다: {', '.join(refused)}")
+                self.sent_count += 1
+                logging.info(f"알림 이메일 발송 완료: {subject}")
+                return True
+
+            except Exception as e:
+                self._disconnect()
+                if not is_transient_smtp_error(e) or attempt >= self.max_retries:
+                    self.failed_count += 1
+                    logging.error(f"이메일 발송 실패 ({subject}): {e}")
+                    return False
+
+                backoff = min(self.max_backoff, self.base_backoff * (2 ** attempt))
+                backoff = random.uniform(backoff / 2, backoff)
+                logging.warning(f"이메일 발송 재시도 {attempt + 1}/{self.max_retries} ({backoff:.1f}초 후): {e}")
+                time.sleep(backoff)
+
+        return False
+
+    def _get_connection(self) -> smtplib.SMTP:
+        """
+        인증된 SMTP 연결 반환 (끊겼거나 오래 쉬었으면 확인 후 다시 연결)
+
+        Returns:
+            smtplib.SMTP 객체
+        """
+        if self._smtp is not None and time.monotonic() - self._last_used > NOOP_CHECK_AFTER_SECONDS:
+            try:
+                if self._smtp.noop()[0] != 250:
+                    self._disconnect()
+            except Exception:
+                self._disconnect()
+
+        if self._smtp is None:
+            config = self.email_config
+            smtp = smtplib.SMTP(config['smtp_server'], config['smtp_port'],
+                                timeout=config.get('timeout_seconds', 30))
+            try:
+                if config.get('use_tls', True):
+                    smtp.starttls()
+                if config.get('sender_password'):
+                    smtp.login(config['sender_email'], config['sender_password'])
+            except Exception:
+                smtp.close()
+                raise
+            self._smtp = smtp
+            self.connect_count += 1
+
+        self._last_used = time.monotonic()
+        return self._smtp
+
+    def _disconnect(self):
+        """SMTP 연결 종료 (오류 무시)"""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception:
+            try:
+                self._smtp.close()
+            except Exception:
+                pass
+        self._smtp = None
@@ -2,14 +2,19 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '00_공통설정'))
 
-import schedule
-import time
+import heapq
 import json
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from aws_health_service import AWSHealthService
+from health_snapshot import HealthSnapshot
+from timer_scheduler import TimerScheduler
+from seen_event_index import SeenEventIndex
+from email_dispatcher import EmailDispatcher
+from slack_notifier import SlackNotifier
+from health_report import HealthReport, ReportSection, ReportItem, STATUS_EMOJI
+from alert_rules import AlertRuleEngine, digest_fingerprint
 import logging
 
 # 로깅 설정
@@ -22,6 +27,15 @@ logging.basicConfig(
     ]
 )
 
+# 긴급 점검 조회 기간 (일), 확인 기록 만료 시간도 이 기간에 맞춤
+URGENT_CHECK_DAYS_BACK = 1
+
+# 일일 점검 조회 기간 (일)
+DAILY_CHECK_DAYS_BACK = 7
+
+# aws_config.json에 계정이 없을 때 기본 자격 증명을 나타내는 이름
+DEFAULT_ACCOUNT_LABEL = 'default'
+
 class HealthScheduler:
     def __init__(self, config_file='health_config.json'):
         """
@@ -31,8 +45,121 @@ class HealthScheduler:
             config_file: 설정 파일 경로
         """
         self.config = self.load_config(config_file)
-        self.health_service = AWSHealthService()
-        self.last_events = []
+        
+        # aws_config.json의 모든 계정을 점검 (계정이 없으면 기본 자격 증명 하나)
+        account_names = AWSHealthService.list_accounts()
+        if account_names:
+            self.health_services = {
+                name: AWSHealthService(account_name=name) for name in account_names
+            }
+        else:
+            self.health_services = {DEFAULT_ACCOUNT_LABEL: AWSHealthService()}
+        
+        health_settings = next(iter(self.health_services.values())).config.get('health_settings', {})
+        self.account_timeout = health_settings.get('account_timeout_seconds', 120)
+        max_workers = min(health_settings.get('max_workers', 8), len(self.health_services))
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='health-account')
+        
+        # 계정별로 이미 확인한 이벤트 ARN (재시작 후에도 유지, 긴급 점검 조회 기간이 지나면 만료)
+        dedupe_config = self.config['dedupe']
+        state_file = self._resolve_path(config_file, dedupe_config.get('state_file', 'seen_events.json'))
+        self.seen_events = {
+            account_name: SeenEventIndex(
+                self._seen_state_file(state_file, account_name),
+                ttl_seconds=URGENT_CHECK_DAYS_BACK * 86400,
+                max_entries=dedupe_config.get('max_entries', 10000)
+            )
+            for account_name in self.health_services
+        }
+        
+        # (계정, 서비스, 이벤트 코드)별 알림 억제 상태와 일일 요약 지문
+        rules_config = self.config['alert_rules']
+        self.alert_rules = AlertRuleEngine(
+            self._resolve_path(config_file, rules_config.get('state_db', 'alert_state.db')),
+            suppression_minutes=rules_config.get('suppression_minutes', 180),
+            overrides=rules_config.get('suppression_overrides')
+        )
+        
+        # 알림 메일은 발송 스레드가 SMTP 세션을 유지하며 보냄 (점검 스레드는 기다리지 않음)
+        self.email_dispatcher = EmailDispatcher(self.config['email']) if self.email_configured() else None
+        
+        # Slack 알림은 같은 주기에 발생한 메시지를 하나로 합쳐 keep-alive 연결로 보냄
+        self.slack_notifier = SlackNotifier(self.config['slack']) if self.slack_configured() else None
+    
+    @staticmethod
+    def _resolve_path(config_file, path):
+        """
+        설정 파일 기준 상대 경로를 절대 경로로 변환
+        
+        Args:
+            config_file: 설정 파일 경로
+            path: 설정에 지정된 경로
+            
+        Returns:
+            절대 경로
+        """
+        if os.path.isabs(path):
+            return path
+        return os.path.join(os.path.dirname(os.path.abspath(config_file)), path)
+    
+    @staticmethod
+    def _seen_state_file(state_file, account_name):
+        """
+        계정별 확인 기록 파일 경로
+        
+        Args:
+            state_file: 설정의 기록 파일 경로
+            account_name: 계정 이름
+            
+        Returns:
+            기본 계정은 state_file 그대로, 그 외에는 계정 이름을 붙인 경로
+        """
+        if account_name == DEFAULT_ACCOUNT_LABEL:
+            return state_file
+        base, ext = os.path.splitext(state_file)
+        safe_name = ''.join(ch if ch.isalnum() or ch in '-_' else '_' for ch in account_name)
+        return f"{base}_{safe_name}{ext or '.json'}"
+    
+    def collect_snapshots(self, days_back):
+        """
+        모든 계정의 스냅샷을 동시에 조회
+        
+        전체 소요 시간은 가장 느린 계정 하나에 가깝고, 제한 시간을 넘긴 계정은 실패로 처리합니다.
+        
+        Args:
+            days_back: 조회할 이전 일수
+            
+        Returns:
+            ({계정 이름: HealthSnapshot}, {계정 이름: 오류 메시지}) 튜플 (설정 순서 유지)
+        """
+        futures = {
+            self.executor.submit(service.get_snapshot, days_back=days_back): account_name
+            for account_name, service in self.health_services.items()
+        }
+        done, not_done = wait(futures, timeout=self.account_timeout)
+        
+        results = {}
+        for future in done:
+            account_name = futures[future]
+            try:
+                results[account_name] = future.result()
+            except Exception as e:
+                results[account_name] = str(e)
+        for future in not_done:
+            future.cancel()
+            results[futures[future]] = f"점검 시간 초과 ({self.account_timeout}초)"
+        
+        snapshots = {}
+        errors = {}
+        for account_name in self.health_services:
+            result = results[account_name]
+            if isinstance(result, HealthSnapshot) and not result.error_status:
+                snapshots[account_name] = result
+            else:
+                errors[account_name] = result.error_status if isinstance(result, HealthSnapshot) else result
+                logging.error(f"❌ {account_name} 조회 실패: {errors[account_name]}")
+        
+        return snapshots, errors
     
     def load_config(self, config_file):
         """
@@ -48,21 +175,40 @@ class HealthScheduler:
             "email": {
                 "smtp_server": "smtp.gmail.com",
                 "smtp_port": 587,
+                "use_tls": True,
                 "sender_email": "",
                 "sender_password": "",
-                "recipients": []
+                "recipients": [],
+                "timeout_seconds": 30,
+                "max_retries": 3
             },
             "slack": {
+                "enabled": True,
                 "webhook_url": "",
-                "channel": "#aws-health"
+                "channel": "#aws-health",
+                "batch_window_seconds": 2,
+                "timeout_seconds": 10,
+                "max_retries": 3
             },
             "schedule": {
                 "daily_check_time": "09:00",
-                "urgent_check_interval": 30
+                "urgent_check_interval": 30,
+                "jitter_seconds": 5,
+                "catch_up": "run_once"
             },
             "thresholds": {
                 "max_critical_events": 0,
                 "max_active_events": 5
+            },
+            "dedupe": {
+                "state_file": "seen_events.json",
+                "max_entries": 10000
+            },
+            "alert_rules": {
+                "state_db": "alert_state.db",
+                "suppression_minutes": 180,
+                "suppression_overrides": {},
+                "send_unchanged_daily": False
             }
         }
         
@@ -87,28 +233,57 @@ class HealthScheduler:
     
     def daily_health_check(self):
         """
-        일일 정기 점검 수행
+        일일 정기 점검 수행 (모든 계정)
         """
         logging.info("일일 Health 점검 시작")
         
         try:
-            # Health 데이터 수집
-            summary = self.health_service.get_health_summary()
-            events = self.health_service.get_service_health_events(days_back=1)
+            # 모든 계정의 Health 데이터를 동시에 수집
+            snapshots, account_errors = self.collect_snapshots(DAILY_CHECK_DAYS_BACK)
+            events_by_account = {name: snapshot.events for name, snapshot in snapshots.items()}
             
-            # 점검 결과 생성
-            report = self.generate_daily_report(summary, events)
+            # 전체 계정 이벤트로 요약 계산
+            all_events = [event for events in events_by_account.values() for event in events]
+            summary = HealthSnapshot(all_events, "SUCCESS", days_back=DAILY_CHECK_DAYS_BACK).summary
+            
+            for account_name, events in events_by_account.items():
+                self.alert_rules.update_states(account_name, events)
+            
+            # 마지막 요약 이후 억제된 알림은 일일 요약에 모아서 보고
+            suppressed = self.alert_rules.pending_suppressed()
+            
+            # 활성 이벤트와 조회 실패 계정이 같으면 같은 요약으로 판단
+            fingerprint = digest_fingerprint(
+                sorted((account_name, event.arn, event.status)
+                       for account_name, events in events_by_account.items()
+                       for event in events if event.is_active),
+                sorted(account_errors)
+            )
             
             # 알림 발송 여부 결정
-            if self.should_send_alert(summary):
-                self.send_alert(report, "일일 Health 점검 결과 - 주의 필요")
+            needs_attention = self.should_send_alert(summary) or bool(account_errors)
+            if (not needs_attention and not suppressed
+                    and not self.alert_rules.digest_changed('daily', fingerprint)
+                    and not self.config['alert_rules'].get('send_unchanged_daily', False)):
+                logging.info("정상 상태이고 마지막 요약 이후 변경이 없어 일일 요약을 보내지 않습니다.")
             else:
-                self.send_daily_summary(report)
+                # 보고서는 한 번만 만들고 채널별로 렌더링
+                report = self.build_daily_report(summary, events_by_account, account_errors, suppressed)
+                # 실제로 발송된 경우에만 요약 지문과 보고한 억제 건수를 반영 (실패하면 다음 요약에서 다시 보고)
+                self.send_alert(report, on_success=lambda: self.digest_delivered(fingerprint, suppressed))
             
-            # 마지막 이벤트 업데이트
-            self.last_events = events
+            # 조회한 이벤트를 계정별 확인 기록에 반영
+            # 열린 중요 이슈는 긴급 점검이 알린 뒤에만 확인 처리 (요약을 건너뛰거나 발송에 실패해도 누락되지 않음)
+            for account_name, events in events_by_account.items():
+                seen_events = self.seen_events[account_name]
+                if seen_events.initialized:
+                    seen_events.mark_seen(event.arn for event in events if not self.is_critical_event(event))
+                else:
+                    # 처음 점검하는 계정은 현재 이벤트 전체를 기준으로 삼음
+                    seen_events.mark_seen(event.arn for event in events)
+                seen_events.save()
             
-            logging.info("일일 Health 점검 완료")
+            logging.info(f"일일 Health 점검 완료 ({len(snapshots)}/{len(self.health_services)}개 계정)")
             
         except Exception as e:
             logging.error(f"일일 점검 중 오류 발생: {e}")
@@ -116,51 +291,100 @@ class HealthScheduler:
     
     def urgent_health_check(self):
         """
-        긴급 점검 수행 (새로운 중요 이벤트 감지)
+        긴급 점검 수행 (모든 계정의 새로운 중요 이벤트를 한 번의 알림으로 발송)
         """
         try:
-            current_events = self.health_service.get_service_health_events(days_back=1)
+            snapshots, _ = self.collect_snapshots(URGENT_CHECK_DAYS_BACK)
             
-            # 새로운 중요 이벤트 감지
-            new_critical_events = self.detect_new_critical_events(current_events)
+            # 계정별 새로운 중요 이벤트 감지 (조회에 실패한 계정은 확인 기록을 바꾸지 않음)
+            new_events_by_account = {}
+            for account_name, snapshot in snapshots.items():
+                new_events = self.detect_new_critical_events(account_name, snapshot.events)
+                if new_events:
+                    new_events_by_account[account_name] = new_events
             
-            if new_critical_events:
-                logging.warning(f"새로운 중요 이벤트 {len(new_critical_events)}개 감지")
-                
-                report = self.generate_urgent_report(new_critical_events)
-                self.send_alert(report, "🚨 AWS Health 긴급 알림 - 즉시 확인 필요")
+            # 조회된 이벤트를 계정별 확인 기록에 반영하고 만료 항목 정리
+            for account_name, snapshot in snapshots.items():
+                seen_events = self.seen_events[account_name]
+                seen_events.mark_seen(event.arn for event in snapshot.events)
+                seen_events.prune()
+                seen_events.save()
+                self.alert_rules.update_states(account_name, snapshot.events)
+            
+            if not new_events_by_account:
+                return
+            
+            # 억제 시간 안에 같은 (서비스, 이벤트 코드)로 이미 알린 이벤트는 일일 요약으로 미룸
+            notify_by_account, suppressed = self.alert_rules.evaluate(new_events_by_account)
+            if suppressed:
+                logging.info(f"억제 규칙으로 이벤트 {sum(len(events) for events in suppressed.values())}개의 "
+                             f"알림을 일일 요약으로 미룹니다.")
+            
+            if notify_by_account:
+                total = sum(len(events) for events in notify_by_account.values())
+                logging.warning(f"새로운 중요 이벤트 {total}개 감지 ({len(notify_by_account)}개 계정)")
                 
-                # 마지막 이벤트 업데이트
-                self.last_events = current_events
+                report = self.build_urgent_report(notify_by_account)
+                queued = self.send_alert(report, on_failure=lambda: self.forget_events(notify_by_account))
+                if not queued and (self.email_configured() or self.slack_configured()):
+                    self.forget_events(notify_by_account)
             
         except Exception as e:
             logging.error(f"긴급 점검 중 오류 발생: {e}")
     
-    def detect_new_critical_events(self, current_events):
+    def detect_new_critical_events(self, account_name, current_events):
         """
         새로운 중요 이벤트 감지
         
+        계정의 확인 기록에 없는 열린 issue 이벤트를 새 이벤트로 판단합니다.
+        확인 기록이 한 번도 저장된 적이 없는 계정은 현재 이벤트를 기준으로만 삼습니다.
+        
         Args:
+            account_name: 계정 이름
             current_events: 현재 이벤트 목록
             
         Returns:
             새로운 중요 이벤트 목록
         """
-        if not self.last_events:
+        seen_events = self.seen_events[account_name]
+        if not seen_events.initialized:
             return []
         
-        # 기존 이벤트 ARN 목록
-        last_event_arns = {event['arn'] for event in self.last_events}
+        critical_events = [event for event in current_events if self.is_critical_event(event)]
         
-        # 새로운 중요 이벤트 필터링
-        new_critical_events = []
-        for event in current_events:
-            if (event['arn'] not in last_event_arns and 
-                event['event_type_category'] == 'issue' and
-                event['status'] == 'open'):
-                new_critical_events.append(event)
+        # 확인 기록에 없는 이벤트만 선택 (ARN당 O(1) 조회)
+        unseen_arns = set(seen_events.unseen(event.arn for event in critical_events))
+        return [event for event in critical_events if event.arn in unseen_arns]
+    
+    @staticmethod
+    def is_critical_event(event):
+        """긴급 알림 대상인 열린 issue 이벤트인지 확인"""
+        return event.event_type_category == 'issue' and event.status == 'open'
+    
+    def digest_delivered(self, fingerprint, suppressed):
+        """
+        일일 요약 발송에 성공한 뒤 호출 (발송 스레드에서 실행)
         
-        return new_critical_events
+        Args:
+            fingerprint: 발송한 요약의 지문
+            suppressed: 요약에 포함한 억제 목록
+        """
+        self.alert_rules.record_digest('daily', fingerprint)
+        self.alert_rules.clear_suppressed(suppressed)
+    
+    def forget_events(self, events_by_account):
+        """
+        알림을 보내지 못한 이벤트를 확인 기록에서 제거 (다음 점검에서 다시 알림)
+        
+        Args:
+            events_by_account: 계정 이름별 이벤트 목록
+        """
+        for account_name, events in events_by_account.items():
+            seen_events = self.seen_events[account_name]
+            seen_events.forget(event.arn for event in events)
+            seen_events.save()
+        self.alert_rules.release(events_by_account)
+        logging.warning("알림을 보내지 못한 이벤트는 다음 긴급 점검에서 다시 알립니다.")
     
     def should_send_alert(self, summary):
         """
@@ -177,218 +401,256 @@ class HealthScheduler:
         return (summary['critical_events'] > thresholds['max_critical_events'] or
                 summary['active_events'] > thresholds['max_active_events'])
     
-    def generate_daily_report(self, summary, events):
+    def build_daily_report(self, summary, events_by_account, account_errors=None, suppressed=None):
         """
-        일일 점검 보고서 생성
+        일일 점검 보고서 모델 생성 (이메일/Slack은 이 모델을 렌더링)
         
         Args:
-            summary: Health 요약 정보
-            events: 이벤트 목록
+            summary: 전체 계정 Health 요약 정보
+            events_by_account: 계정 이름별 이벤트 목록
+            account_errors: 조회에 실패한 계정 이름별 오류 메시지
+            suppressed: 마지막 요약 이후 억제된 알림 목록 (AlertRuleEngine.pending_suppressed 결과)
             
         Returns:
-            HTML 형식의 보고서
-        """
-        status_emoji = "✅" if summary['critical_events'] == 0 else "🚨"
-        
-        html_report = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; }}
-                .header {{ background-color: #f8f9fa; padding: 20px; border-radius: 8px; }}
-                .metric {{ display: inline-block; margin: 10px; padding: 15px; 
-                         background-color: #e9ecef; border-radius: 8px; }}
-                .critical {{ background-color: #f8d7da; border-left: 4px solid #dc3545; }}
-                .warning {{ background-color: #fff3cd; border-left: 4px solid #ffc107; }}
-                .success {{ background-color: #d1edff; border-left: 4px solid #0084ff; }}
-                .event {{ margin: 10px 0; padding: 10px; border-radius: 4px; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>{status_emoji} AWS Health 일일 점검 결과</h1>
-                <p><strong>점검 시간:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            </div>
-            
-            <h2>📊 전체 요약</h2>
-            <div>
-                <div class="metric">
-                    <strong>총 이벤트:</strong> {summary['total_events']}
-                </div>
-                <div class="metric">
-                    <strong>활성 이벤트:</strong> {summary['active_events']}
-                </div>
-                <div class="metric">
-                    <strong>중요 이슈:</strong> {summary['critical_events']}
-                </div>
-                <div class="metric">
-                    <strong>영향받은 서비스:</strong> {summary['services_affected']}
-                </div>
-            </div>
+            HealthReport 객체
         """
+        account_errors = account_errors or {}
+        suppressed = suppressed or []
+        needs_attention = self.should_send_alert(summary) or bool(account_errors)
+        
+        if summary['critical_events'] > 0 or account_errors:
+            status = 'CRITICAL'
+        elif needs_attention:
+            status = 'WARNING'
+        else:
+            status = 'HEALTHY'
         
+        sections = []
         if summary['critical_events'] > 0:
-            html_report += """
-            <div class="critical">
-                <h3>🚨 중요 이슈</h3>
-                <p>즉시 확인이 필요한 중요한 이슈가 있습니다.</p>
-            </div>
-            """
-        
-        if events:
-            html_report += "<h2>📋 최근 이벤트</h2>"
-            for event in events[:10]:  # 최대 10개 이벤트만 표시
-                event_class = "critical" if event['event_type_category'] == 'issue' else "warning"
-                html_report += f"""
-                <div class="event {event_class}">
-                    <strong>{event['service']}</strong> - {event['region']}<br>
-                    <em>{event['event_type_code']}</em><br>
-                    <small>{event['start_time']}</small>
-                </div>
-                """
-        
-        html_report += """
-            <hr>
-            <p><small>이 보고서는 자동으로 생성되었습니다. 문제가 있을 경우 AWS 콘솔에서 직접 확인해주세요.</small></p>
-        </body>
-        </html>
-        """
-        
-        return html_report
+            sections.append(ReportSection("🚨 중요 이슈", note="즉시 확인이 필요한 중요한 이슈가 있습니다.",
+                                          style='critical'))
+        
+        if account_errors:
+            sections.append(ReportSection("❌ 조회 실패 계정", items=[
+                ReportItem(account_name, fields=[('', error)], style='critical')
+                for account_name, error in account_errors.items()
+            ]))
+        
+        if suppressed:
+            sections.append(ReportSection("🔕 억제된 알림", items=[
+                ReportItem(f"[{item['account']}] {item['service']}",
+                           fields=[('', item['event_type_code']), ('억제', f"{item['suppressed_count']}건")],
+                           style='warning')
+                for item in suppressed
+            ]))
+        
+        # 전체 계정에서 최근 갱신된 이벤트 10개만 선택 (전체 정렬 없이)
+        recent_events = heapq.nlargest(
+            10,
+            ((account_name, event) for account_name, events in events_by_account.items() for event in events),
+            key=lambda item: item[1].last_updated_time.timestamp() if isinstance(item[1].last_updated_time, datetime) else 0
+        )
+        if recent_events:
+            sections.append(ReportSection("📋 최근 이벤트", items=[
+                ReportItem(f"[{account_name}] {event.service}", subtitle=event.region,
+                           fields=[('', event.event_type_code), ('', event.start_time)],
+                           style='critical' if event.event_type_category == 'issue' else 'warning')
+                for account_name, event in recent_events
+            ]))
+        
+        return HealthReport(
+            kind='daily',
+            subject="일일 Health 점검 결과 - 주의 필요" if needs_attention else "✅ AWS Health 일일 점검 결과 - 정상",
+            headline=f"{STATUS_EMOJI[status]} AWS Health 일일 점검 결과",
+            status=status,
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            metrics=[
+                ("총 이벤트", summary['total_events']),
+                ("활성 이벤트", summary['active_events']),
+                ("중요 이슈", summary['critical_events']),
+                ("영향받은 서비스", summary['services_affected'])
+            ],
+            sections=sections,
+            footer=["이 보고서는 자동으로 생성되었습니다. 문제가 있을 경우 AWS 콘솔에서 직접 확인해주세요."],
+            data={
+                'summary': summary,
+                'account_errors': account_errors,
+                'suppressed': suppressed,
+                'recent_events': [dict(event.to_dict(), account=account_name) for account_name, event in recent_events]
+            }
+        )
     
-    def generate_urgent_report(self, critical_events):
+    def build_urgent_report(self, events_by_account):
         """
-        긴급 알림 보고서 생성
+        긴급 알림 보고서 모델 생성 (모든 계정의 새 이벤트를 하나의 보고서로)
         
         Args:
-            critical_events: 새로운 중요 이벤트 목록
+            events_by_account: 계정 이름별 새로운 중요 이벤트 목록
             
         Returns:
-            HTML 형식의 긴급 보고서
-        """
-        html_report = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; }}
-                .urgent {{ background-color: #f8d7da; padding: 20px; border-radius: 8px; 
-                          border-left: 4px solid #dc3545; }}
-                .event {{ margin: 15px 0; padding: 15px; background-color: #fff; 
-                         border-radius: 4px; border-left: 3px solid #dc3545; }}
-            </style>
-        </head>
-        <body>
-            <div class="urgent">
-                <h1>🚨 AWS Health 긴급 알림</h1>
-                <p><strong>감지 시간:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                <p><strong>새로운 중요 이벤트:</strong> {len(critical_events)}개</p>
-            </div>
-            
-            <h2>⚠️ 즉시 확인이 필요한 이벤트</h2>
-        """
-        
-        for event in critical_events:
-            html_report += f"""
-            <div class="event">
-                <h3>{event['service']} - {event['region']}</h3>
-                <p><strong>이벤트 유형:</strong> {event['event_type_code']}</p>
-                <p><strong>상태:</strong> {event['status']}</p>
-                <p><strong>시작 시간:</strong> {event['start_time']}</p>
-                <p><strong>설명:</strong> {event['description'][:200]}...</p>
-            </div>
-            """
-        
-        html_report += """
-            <hr>
-            <p><strong>권장 조치:</strong></p>
-            <ul>
-                <li>AWS 콘솔에서 상세 정보 확인</li>
-                <li>영향받은 리소스 점검</li>
-                <li>필요시 관련 팀에 알림</li>
-                <li>복구 계획 실행</li>
-            </ul>
-        </body>
-        </html>
-        """
-        
-        return html_report
+            HealthReport 객체
+        """
+        total_events = sum(len(events) for events in events_by_account.values())
+        
+        sections = [
+            ReportSection(f"🏢 {account_name}", items=[
+                ReportItem(event.service, subtitle=event.region, fields=[
+                    ("이벤트 유형", event.event_type_code),
+                    ("상태", event.status),
+                    ("시작 시간", event.start_time)
+                ], detail=f"{event.description[:200]}...", style='critical')
+                for event in events
+            ])
+            for account_name, events in events_by_account.items()
+        ]
+        sections.append(ReportSection("권장 조치", bullets=[
+            "AWS 콘솔에서 상세 정보 확인",
+            "영향받은 리소스 점검",
+            "필요시 관련 팀에 알림",
+            "복구 계획 실행"
+        ]))
+        
+        return HealthReport(
+            kind='urgent',
+            subject="🚨 AWS Health 긴급 알림 - 즉시 확인 필요",
+            headline="🚨 AWS Health 긴급 알림",
+            status='CRITICAL',
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            metrics=[("새로운 중요 이벤트", f"{total_events}개 ({len(events_by_account)}개 계정)")],
+            sections=sections,
+            data={
+                'events': {
+                    account_name: [event.to_dict() for event in events]
+                    for account_name, events in events_by_account.items()
+                }
+            }
+        )
     
-    def send_alert(self, message, subject):
+    def send_alert(self, report, on_failure=None, on_success=None):
         """
-        알림 이메일 발송
+        보고서를 이메일/Slack 발송 대기열에 추가 (발송은 백그라운드에서 진행)
         
         Args:
-            message: 메시지 내용
-            subject: 이메일 제목
+            report: HealthReport 객체 (채널별 형식으로 한 번씩만 렌더링)
+            on_failure: 모든 채널에서 재시도 후에도 발송하지 못했을 때 호출할 함수
+            on_success: 처음으로 한 채널에서 발송에 성공했을 때 한 번만 호출할 함수
+            
+        Returns:
+            하나 이상의 채널 대기열에 추가했으면 True
         """
-        email_config = self.config['email']
+        channels = []
+        if self.email_dispatcher:
+            channels.append(lambda failed, delivered: self.email_dispatcher.submit(
+                report.subject, report.render('html'), on_failure=failed, on_success=delivered))
+        if self.slack_notifier:
+            channels.append(lambda failed, delivered: self.slack_notifier.submit(
+                report.render('slack'), on_failure=failed, on_success=delivered))
         
-        if not email_config['sender_email'] or not email_config['recipients']:
-            logging.warning("이메일 설정이 없어 알림을 보낼 수 없습니다.")
-            return
+        if not channels:
+            logging.warning("이메일/Slack 설정이 없어 알림을 보낼 수 없습니다.")
+            return False
         
-        try:
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = email_config['sender_email']
-            msg['To'] = ', '.join(email_config['recipients'])
-            
-            html_part = MIMEText(message, 'html')
-            msg.attach(html_part)
-            
-            with smtplib.SMTP(email_config['smtp_server'], email_config['smtp_port']) as server:
-                server.starttls()
-                server.login(email_config['sender_email'], email_config['sender_password'])
-                server.send_message(msg)
-            
-            logging.info("알림 이메일 발송 완료")
-            
-        except Exception as e:
-            logging.error(f"이메일 발송 실패: {e}")
+        # 한 채널이라도 발송에 성공하면 실패로 보지 않음
+        lock = threading.Lock()
+        failures = []
+        successes = []
+        
+        def channel_failed():
+            with lock:
+                failures.append(True)
+                all_failed = len(failures) == queued
+            if all_failed and on_failure:
+                on_failure()
+        
+        def channel_delivered():
+            with lock:
+                successes.append(True)
+                first = len(successes) == 1
+            if first and on_success:
+                on_success()
+        
+        queued = 0
+        with lock:
+            for submit in channels:
+                if submit(channel_failed, channel_delivered):
+                    queued += 1
+        return queued > 0
     
-    def send_daily_summary(self, report):
+    def email_configured(self):
         """
-        일일 요약 발송 (정상 상태일 때)
+        이메일 발송 설정 여부
+        
+        Returns:
+            발신자와 수신자가 모두 설정되어 있으면 True
+        """
+        email_config = self.config['email']
+        return bool(email_config['sender_email'] and email_config['recipients'])
+    
+    def slack_configured(self):
+        """
+        Slack 발송 설정 여부
+        
+        Returns:
+            웹훅 주소가 있고 enabled가 false가 아니면 True
         """
-        self.send_alert(report, "✅ AWS Health 일일 점검 결과 - 정상")
+        slack_config = self.config['slack']
+        return bool(slack_config.get('webhook_url') and slack_config.get('enabled', True))
     
     def send_error_alert(self, error_message):
         """
         오류 알림 발송
         """
-        error_report = f"""
-        <html>
-        <body>
-            <h1>🔥 AWS Health 점검 오류</h1>
-            <p><strong>오류 시간:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            <p><strong>오류 내용:</strong> {error_message}</p>
-            <p>점검 시스템에 문제가 발생했습니다. 수동으로 AWS Health를 확인해주세요.</p>
-        </body>
-        </html>
-        """
-        self.send_alert(error_report, "🔥 AWS Health 점검 시스템 오류")
+        report = HealthReport(
+            kind='error',
+            subject="🔥 AWS Health 점검 시스템 오류",
+            headline="🔥 AWS Health 점검 오류",
+            status='ERROR',
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            sections=[ReportSection("오류 내용", note=error_message, style='critical')],
+            footer=["점검 시스템에 문제가 발생했습니다. 수동으로 AWS Health를 확인해주세요."],
+            data={'error': error_message}
+        )
+        self.send_alert(report)
     
     def start_scheduler(self):
         """
         스케줄러 시작
+        
+        다음 점검 시각까지 정확히 대기하는 타이머 스케줄러를 사용하며,
+        긴급 점검 간격은 urgent_check_interval(분) 또는 urgent_check_interval_seconds(초)로 지정합니다.
         """
-        # 일일 정기 점검 스케줄
-        daily_time = self.config['schedule']['daily_check_time']
-        schedule.every().day.at(daily_time).do(self.daily_health_check)
+        schedule_config = self.config['schedule']
+        jitter = schedule_config.get('jitter_seconds', 0)
+        catch_up = schedule_config.get('catch_up', 'run_once')
         
-        # 긴급 점검 스케줄 (30분마다)
-        urgent_interval = self.config['schedule']['urgent_check_interval']
-        schedule.every(urgent_interval).minutes.do(self.urgent_health_check)
+        # 긴급 점검 간격 (초 단위 설정이 있으면 우선)
+        urgent_seconds = schedule_config.get('urgent_check_interval_seconds') or \
+            schedule_config['urgent_check_interval'] * 60
         
-        logging.info(f"스케줄러 시작됨 - 일일 점검: {daily_time}, 긴급 점검: {urgent_interval}분마다")
+        self.scheduler = TimerScheduler()
         
-        # 초기 점검 실행
-        self.daily_health_check()
+        # 일일 정기 점검 (시작 시 한 번 바로 실행)
+        daily_time = schedule_config['daily_check_time']
+        self.scheduler.daily_at(daily_time, self.daily_health_check, name="일일 점검",
+                                jitter=jitter, catch_up=catch_up, run_immediately=True)
         
-        # 스케줄 실행
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # 1분마다 체크
+        # 긴급 점검
+        self.scheduler.every(urgent_seconds, self.urgent_health_check, name="긴급 점검",
+                             jitter=jitter, catch_up=catch_up)
+        
+        logging.info(f"스케줄러 시작됨 - 일일 점검: {daily_time}, 긴급 점검: {urgent_seconds:g}초마다, "
+                     f"대상 계정: {', '.join(self.health_services)}")
+        
+        try:
+            self.scheduler.run_forever()
+        finally:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            # 대기 중인 알림은 보내고 종료
+            if self.email_dispatcher:
+                self.email_dispatcher.close()
+            if self.slack_notifier:
+                self.slack_notifier.close()
+            self.alert_rules.close()
 
 if __name__ == "__main__":
     scheduler = HealthScheduler()
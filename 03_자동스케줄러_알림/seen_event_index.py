@@ -0,0 +1,143 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, List
+
+
+class SeenEventIndex:
+    def __init__(self, path: str = None, ttl_seconds: float = 86400, max_entries: int = 10000):
+        """
+        이미 확인(알림)한 이벤트 ARN을 디스크에 보관하는 색인
+
+        ARN별 마지막으로 조회된 시각을 기록하며, 조회 결과에 계속 나타나는 이벤트는
+        시각이 갱신되어 유지되고 ttl_seconds 동안 나타나지 않은 이벤트만 만료됩니다.
+        재시작 후에도 같은 이벤트로 다시 알림을 보내지 않으며, 항목 수는 max_entries로 제한됩니다.
+
+        Args:
+            path: 색인을 저장할 JSON 파일 경로 (None이면 메모리에만 유지)
+            ttl_seconds: 조회되지 않은 ARN을 보관하는 시간 (초, 조회 기간과 맞춤)
+            max_entries: 최대 항목 수 (넘으면 가장 오래전에 조회된 항목부터 제거)
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._entries = OrderedDict()  # arn -> 마지막 조회 시각 (오래된 순)
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        # 기준 상태(이전 조회 결과)가 있는지 여부 (저장 파일이 있거나 한 번 저장한 뒤 True)
+        self.initialized = False
+
+        if path:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, arn: str) -> bool:
+        return arn in self._entries
+
+    def unseen(self, arns: Iterable[str]) -> List[str]:
+        """
+        색인에 없는 ARN만 반환
+
+        Args:
+            arns: 확인할 ARN 목록
+
+        Returns:
+            처음 보는 ARN 리스트
+        """
+        with self._lock:
+            return [arn for arn in arns if arn not in self._entries]
+
+    def mark_seen(self, arns: Iterable[str], now: float = None):
+        """
+        ARN을 조회된 것으로 기록 (이미 있으면 시각 갱신)
+
+        Args:
+            arns: 기록할 ARN 목록
+            now: 기록 시각 (None이면 현재 시간)
+        """
+        now = now or time.time()
+        with self._lock:
+            for arn in arns:
+                self._entries[arn] = now
+                self._entries.move_to_end(arn)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def forget(self, arns: Iterable[str]):
+        """
+        ARN을 색인에서 제거 (다음 조회에서 다시 새 이벤트로 판단)
+
+        Args:
+            arns: 제거할 ARN 목록
+        """
+        with self._lock:
+            for arn in arns:
+                self._entries.pop(arn, None)
+
+    def prune(self, now: float = None) -> int:
+        """
+        TTL이 지난 항목 제거
+
+        Args:
+            now: 기준 시각 (None이면 현재 시간)
+
+        Returns:
+            제거한 항목 수
+        """
+        cutoff = (now or time.time()) - self.ttl_seconds
+        removed = 0
+        with self._lock:
+            # 오래된 순으로 정렬되어 있으므로 만료되지 않은 항목을 만나면 중단
+            while self._entries:
+                arn, seen_at = next(iter(self._entries.items()))
+                if seen_at >= cutoff:
+                    break
+                self._entries.popitem(last=False)
+                removed += 1
+        return removed
+
+    def load(self):
+        """디스크에 저장된 색인 불러오기 (만료된 항목 제외)"""
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except Exception as e:
+            logging.warning(f"이벤트 확인 기록 로드 실패: {e}")
+            return
+
+        with self._lock:
+            self._entries = OrderedDict(sorted(entries.items(), key=lambda item: item[1]))
+        self.initialized = True
+        self.prune()
+        logging.info(f"이벤트 확인 기록 {len(self._entries)}개 로드: {self.path}")
+
+    def save(self):
+        """
+        디스크에 저장 (임시 파일 작성 후 교체)
+        """
+        if not self.path:
+            self.initialized = True
+            return
+
+        with self._lock:
+            entries = dict(self._entries)
+
+        temp_path = f"{self.path}.tmp"
+        with self._save_lock:
+            try:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f)
+                os.replace(temp_path, self.path)
+                self.initialized = True
+            except Exception as e:
+                logging.error(f"이벤트 확인 기록 저장 실패: {e}")
@@ -0,0 +1,354 @@
+import http.client
+import json
+import logging
+import queue
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# 이 시간 동안 보낼 메시지가 없으면 연결 종료 (초)
+IDLE_DISCONNECT_SECONDS = 60
+
+# Retry-After 응답을 따를 때 최대 대기 시간 (초)
+MAX_RETRY_AFTER_SECONDS = 60
+
+# 메시지 하나의 최대 글자 수 (넘으면 항목 경계에서 나눠 발송)
+MAX_MESSAGE_CHARS = 3500
+
+# 전송 대기열 최대 크기
+MAX_QUEUE_SIZE = 100
+
+
+def merge_messages(texts: List[str], max_chars: int = MAX_MESSAGE_CHARS) -> List[Tuple[str, List[int]]]:
+    """
+    여러 메시지를 구분선으로 합쳐 최대 글자 수 이하의 메시지로 묶음
+
+    Args:
+        texts: 합칠 메시지 목록
+        max_chars: 메시지 하나의 최대 글자 수
+
+    Returns:
+        (발송할 메시지, 포함된 원래 메시지 인덱스 리스트) 튜플 리스트
+        (한 항목이 max_chars보다 길면 잘라서 포함)
+    """
+    separator = '\n\n'
+    messages = []
+    current = ''
+    indices = []
+    for index, text in enumerate(texts):
+        if len(text) > max_chars:
+            text = text[:max_chars - 20] + '\n…(이하 생략)'
+        if current and len(current) + len(separator) + len(text) > max_chars:
+            messages.append((current, indices))
+            current = ''
+            indices = []
+        current = f"{current}{separator}{text}" if current else text
+        indices.append(index)
+    if current:
+        messages.append((current, indices))
+    return messages
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더를 대기 시간으로 변환
+
+    Args:
+        value: 헤더 값 (초 단위 숫자 또는 HTTP 날짜)
+
+    Returns:
+        대기 시간 (초, 해석할 수 없으면 None)
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class SlackNotifier:
+    def __init__(self, slack_config: Dict, max_retries: int = 3, base_backoff: float = 1.0,
+                 max_backoff: float = 30.0):
+        """
+        Slack Incoming Webhook으로 알림을 보내는 발송기
+
+        점검 스레드는 메시지를 대기열에 넣기만 하고, 발송 스레드가 batch_window_seconds 동안
+        모인 메시지를 하나로 합쳐 keep-alive HTTP 연결 하나로 보냅니다.
+        429 응답은 Retry-After만큼 기다린 뒤 다시 보내고, 연결 오류와 5xx 응답은 백오프로 재시도합니다.
+
+        Args:
+            slack_config: health_config.json의 slack 설정
+            max_retries: 일시적인 오류 시 최대 재시도 횟수
+            base_backoff: 재시도 대기 시간 기준 (초)
+            max_backoff: 재시도 대기 시간 상한 (초)
+        """
+        self.slack_config = slack_config
+        self.max_retries = slack_config.get('max_retries', max_retries)
+        self.batch_window = slack_config.get('batch_window_seconds', 2)
+        self.timeout = slack_config.get('timeout_seconds', 10)
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        url = urlsplit(slack_config['webhook_url'])
+        self._scheme = url.scheme
+        self._host = url.hostname
+        self._port = url.port
+        self._path = url.path + (f"?{url.query}" if url.query else '')
+
+        self.sent_count = 0
+        self.failed_count = 0
+        self.connect_count = 0
+
+        self._queue = queue.Queue(maxsize=MAX_QUEUE_SIZE)
+        self._connection = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='slack-notifier', daemon=True)
+        self._thread.start()
+
+    def submit(self, text: str, on_failure: Callable = None, on_success: Callable = None) -> bool:
+        """
+        메시지를 발송 대기열에 추가 (기다리지 않음)
+
+        Args:
+            text: Slack mrkdwn 형식 메시지
+            on_failure: 재시도 후에도 발송하지 못했을 때 발송 스레드에서 호출할 함수
+            on_success: 발송에 성공했을 때 발송 스레드에서 호출할 함수
+
+        Returns:
+            대기열에 추가했으면 True (대기열이 가득 찼거나 종료된 경우 False)
+        """
+        if self._closed:
+            return False
+
+        try:
+            self._queue.put_nowait((text, on_failure, on_success))
+            return True
+        except queue.Full:
+            logging.error("Slack 발송 대기열이 가득 차 메시지를 버립니다.")
+            return False
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        대기열의 메시지가 모두 처리될 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            모두 처리되었으면 True
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def close(self, timeout: float = 30):
+        """
+        남은 메시지를 보낸 뒤 발송 스레드와 HTTP 연결 종료
+
+        Args:
+            timeout: 남은 메시지를 기다리는 최대 시간 (초)
+        """
+        self.flush(timeout)
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def _run(self):
+        """발송 스레드: 묶음 대기 시간 동안 모인 메시지를 합쳐 발송"""
+        while True:
+            try:
+                item = self._queue.get(timeout=IDLE_DISCONNECT_SECONDS)
+            except queue.Empty:
+                self._disconnect()
+                continue
+
+            batch = [item]
+            deadline = time.monotonic() + self.batch_window
+            while item is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+
+            stop = batch[-1] is None
+            messages = [entry for entry in batch if entry is not None]
+            try:
+                if messages:
+                    self._send_batch(messages)
+            except Exception as e:
+                # 발송 여부를 알 수 없으면 실패로 보고 다시 알릴 수 있게 함
+                logging.error(f"Slack 발송 처리 중 오류: {e}")
+                for _, on_failure, _ in messages:
+                    self._run_callback(on_failure)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if stop:
+                self._disconnect()
+                return
+
+    def _send_batch(self, batch: List):
+        """
+        모인 메시지를 합쳐 발송하고, 메시지가 들어 있던 묶음의 발송 결과에 따라 성공/실패 콜백 호출
+
+        Args:
+            batch: (메시지, 실패 콜백, 성공 콜백) 튜플 리스트
+        """
+        texts = [text for text, _, _ in batch]
+        failed = []
+        for message, indices in merge_messages(texts):
+            try:
+                delivered = self._post_with_retry(message)
+            except Exception as e:
+                self._disconnect()
+                self.failed_count += 1
+                logging.error(f"Slack 발송 실패: {e}")
+                delivered = False
+            if not delivered:
+                failed.extend(indices)
+
+        if len(batch) > 1:
+            logging.info(f"Slack 메시지 {len(batch)}개를 합쳐 발송했습니다 (실패 {len(failed)}개).")
+
+        failed = set(failed)
+        for index, (_, on_failure, on_success) in enumerate(batch):
+            self._run_callback(on_failure if index in failed else on_success)
+
+    @staticmethod
+    def _run_callback(callback: Optional[Callable]):
+        """발송 결과 콜백 호출 (콜백 오류는 기록만 하고 다음 메시지 처리에 영향 없음)"""
+        if callback is None:
+            return
+        try:
+            callback()
+        except Exception as e:
+            logging.error(f"Slack 발송 결과 처리 중 오류: {e}")
+
+    def _post_with_retry(self, text: str) -> bool:
+        """
+        메시지 하나를 웹훅으로 발송 (429는 Retry-After 대기, 연결 오류와 5xx는 백오프 재시도)
+
+        Args:
+            text: 발송할 메시지
+
+        Returns:
+            발송 성공 여부
+        """
+        payload = {'text': text}
+        if self.slack_config.get('channel'):
+            payload['channel'] = self.slack_config['channel']
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                status, headers, response = self._post(body)
+                if status == 200:
+                    self.sent_count += 1
+                    logging.info("Slack 알림 발송 완료")
+                    return True
+                if status == 429:
+                    # 숫자가 아니거나 해석할 수 없는 Retry-After는 백오프 기준 시간 사용
+                    retry_after = parse_retry_after(headers.get('Retry-After'))
+                    if retry_after is None:
+                        retry_after = self.base_backoff
+                    error = f"요청 한도 초과 (Retry-After {retry_after:g}초)"
+                elif status >= 500:
+                    error = f"HTTP {status} {response}"
+                else:
+                    # 잘못된 웹훅 주소나 메시지 형식은 재시도해도 실패
+                    self.failed_count += 1
+                    logging.error(f"Slack 발송 실패: HTTP {status} {response}")
+                    return False
+            except (OSError, http.client.HTTPException) as e:
+                self._disconnect()
+                error = str(e) or type(e).__name__
+
+            if attempt >= self.max_retries:
+                break
+
+            if retry_after is not None:
+                delay = min(retry_after, MAX_RETRY_AFTER_SECONDS)
+            else:
+                delay = min(self.max_backoff, self.base_backoff * (2 ** attempt))
+                delay = random.uniform(delay / 2, delay)
+            logging.warning(f"Slack 발송 재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}초 후): {error}")
+            time.sleep(delay)
+
+        self.failed_count += 1
+        logging.error(f"Slack 발송 실패: {error}")
+        return False
+
+    def _post(self, body: bytes):
+        """
+        keep-alive 연결로 POST 요청 (서버가 닫은 연결이면 한 번 다시 연결)
+
+        Args:
+            body: JSON 본문
+
+        Returns:
+            (상태 코드, 응답 헤더, 응답 본문) 튜플
+        """
+        headers = {'Content-Type': 'application/json; charset=utf-8'}
+        for reconnect in (False, True):
+            connection = self._get_connection()
+            try:
+                connection.request('POST', self._path, body=body, headers=headers)
+                response = connection.getresponse()
+                # 연결을 재사용하려면 응답 본문을 끝까지 읽어야 함
+                data = response.read().decode('utf-8', errors='replace')
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                # 유휴 상태에서 서버가 닫은 연결은 바로 다시 연결해 한 번 더 시도
+                self._disconnect()
+                if reconnect:
+                    raise
+                continue
+
+            if response.will_close:
+                self._disconnect()
+            return response.status, response.headers, data
+
+    def _get_connection(self) -> http.client.HTTPConnection:
+        """
+        웹훅 서버와의 keep-alive 연결 반환 (없으면 새로 연결)
+
+        Returns:
+            HTTPConnection 또는 HTTPSConnection 객체
+        """
+        if self._connection is None:
+            connection_class = http.client.HTTPConnection if self._scheme == 'http' else http.client.HTTPSConnection
+            self._connection = connection_class(self._host, self._port, timeout=self.timeout)
+            self.connect_count += 1
+        return self._connection
+
+    def _disconnect(self):
+        """HTTP 연결 종료 (오류 무시)"""
+        if self._connection is None:
+            return
+        try:
+            self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
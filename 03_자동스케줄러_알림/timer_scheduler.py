@@ -0,0 +1,252 @@
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+# 놓친 실행 처리 방식
+CATCH_UP_RUN_ONCE = 'run_once'  # 놓친 실행은 한 번으로 합쳐 즉시 실행
+CATCH_UP_SKIP = 'skip'  # 놓친 실행은 건너뛰고 다음 예정 시각을 기다림
+CATCH_UP_POLICIES = (CATCH_UP_RUN_ONCE, CATCH_UP_SKIP)
+
+# 예정 시각보다 이만큼(초) 넘게 늦으면 놓친 실행으로 판단
+DEFAULT_MISFIRE_GRACE = 30
+
+# 시스템 시계 변경에 대비해 한 번에 대기하는 최대 시간 (초)
+MAX_WAIT_SECONDS = 300
+
+
+class ScheduledJob:
+    def __init__(self, name: str, func: Callable, interval: float = None, daily_at: str = None,
+                 jitter: float = 0, catch_up: str = CATCH_UP_RUN_ONCE,
+                 misfire_grace: float = DEFAULT_MISFIRE_GRACE):
+        """
+        타이머 스케줄러에 등록된 작업
+
+        Args:
+            name: 작업 이름 (로그용)
+            func: 실행할 함수 (인자 없음)
+            interval: 실행 간격 (초), daily_at과 둘 중 하나만 지정
+            daily_at: 매일 실행할 시각 ("HH:MM", 로컬 시간)
+            jitter: 예정 시각에 더할 0~jitter초 사이의 무작위 지연
+            catch_up: 놓친 실행 처리 방식 ('run_once' 또는 'skip')
+            misfire_grace: 놓친 실행으로 판단하는 지연 기준 (초)
+        """
+        if (interval is None) == (daily_at is None):
+            raise ValueError("interval과 daily_at 중 하나만 지정해야 합니다.")
+        if interval is not None and interval <= 0:
+            raise ValueError(f"실행 간격은 0보다 커야 합니다: {interval}")
+        if catch_up not in CATCH_UP_POLICIES:
+            raise ValueError(f"지원하지 않는 catch_up 방식: {catch_up}")
+
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.daily_time = datetime.strptime(daily_at, "%H:%M").time() if daily_at else None
+        self.jitter = jitter
+        self.catch_up = catch_up
+        self.misfire_grace = misfire_grace
+
+        self.scheduled_at = None  # 지터를 더하기 전 예정 시각 (epoch 초)
+        self.running = False
+        self.run_count = 0
+        self.skipped_count = 0
+        self.last_duration = None
+
+    def next_after(self, after: float) -> float:
+        """
+        주어진 시각 이후의 다음 예정 시각 계산 (지터 제외)
+
+        Args:
+            after: 기준 시각 (epoch 초)
+
+        Returns:
+            다음 예정 시각 (epoch 초)
+        """
+        if self.interval is not None:
+            if self.scheduled_at is None:
+                return after + self.interval
+            # 예정 시각 격자를 유지하며 지나간 실행은 건너뜀
+            missed = max(0, int((after - self.scheduled_at) // self.interval))
+            return self.scheduled_at + (missed + 1) * self.interval
+
+        candidate = datetime.combine(datetime.fromtimestamp(after).date(), self.daily_time)
+        if candidate.timestamp() <= after:
+            candidate = datetime.combine(candidate.date() + timedelta(days=1), self.daily_time)
+        return candidate.timestamp()
+
+    def describe(self) -> str:
+        """작업 주기 설명"""
+        if self.interval is not None:
+            return f"{self.interval:g}초마다"
+        return f"매일 {self.daily_time.strftime('%H:%M')}"
+
+
+class TimerScheduler:
+    def __init__(self, max_workers: int = 4):
+        """
+        타이머 힙 기반 작업 스케줄러
+
+        다음 예정 작업 시각까지 정확히 대기한 뒤 작업을 작업 스레드에서 실행하므로
+        1분 단위 폴링 없이 초 단위 간격으로 작업을 실행할 수 있습니다.
+        같은 작업의 이전 실행이 끝나지 않았으면 새 실행은 건너뛰어 겹쳐 실행되지 않습니다.
+
+        Args:
+            max_workers: 동시에 실행할 수 있는 최대 작업 수
+        """
+        self.max_workers = max_workers
+        self.jobs: List[ScheduledJob] = []
+
+        self._heap = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._executor = None
+
+    def every(self, seconds: float, func: Callable, name: str = None, jitter: float = 0,
+              catch_up: str = CATCH_UP_RUN_ONCE, run_immediately: bool = False) -> ScheduledJob:
+        """
+        일정 간격으로 실행할 작업 등록
+
+        Args:
+            seconds: 실행 간격 (초)
+            func: 실행할 함수
+            name: 작업 이름 (None이면 함수 이름)
+            jitter: 예정 시각에 더할 최대 무작위 지연 (초)
+            catch_up: 놓친 실행 처리 방식 ('run_once' 또는 'skip')
+            run_immediately: 시작 즉시 한 번 실행할지 여부
+
+        Returns:
+            등록된 ScheduledJob
+        """
+        job = ScheduledJob(name or func.__name__, func, interval=seconds, jitter=jitter, catch_up=catch_up)
+        return self._add(job, run_immediately)
+
+    def daily_at(self, at: str, func: Callable, name: str = None, jitter: float = 0,
+                 catch_up: str = CATCH_UP_RUN_ONCE, run_immediately: bool = False) -> ScheduledJob:
+        """
+        매일 지정 시각에 실행할 작업 등록
+
+        Args:
+            at: 실행 시각 ("HH:MM", 로컬 시간)
+            func: 실행할 함수
+            name: 작업 이름 (None이면 함수 이름)
+            jitter: 예정 시각에 더할 최대 무작위 지연 (초)
+            catch_up: 놓친 실행 처리 방식 ('run_once' 또는 'skip')
+            run_immediately: 시작 즉시 한 번 실행할지 여부
+
+        Returns:
+            등록된 ScheduledJob
+        """
+        job = ScheduledJob(name or func.__name__, func, daily_at=at, jitter=jitter, catch_up=catch_up)
+        return self._add(job, run_immediately)
+
+    def _add(self, job: ScheduledJob, run_immediately: bool) -> ScheduledJob:
+        """작업 등록 후 첫 예정 시각을 힙에 추가"""
+        now = time.time()
+        with self._condition:
+            self.jobs.append(job)
+            if run_immediately:
+                job.scheduled_at = now
+                self._push(job, now)
+            else:
+                self._schedule_next(job, now)
+            self._condition.notify()
+        return job
+
+    def _push(self, job: ScheduledJob, run_at: float):
+        """힙에 실행 시각 추가 (잠금 상태에서 호출)"""
+        heapq.heappush(self._heap, (run_at, next(self._sequence), job))
+
+    def _schedule_next(self, job: ScheduledJob, after: float):
+        """다음 예정 시각 계산 후 지터를 더해 힙에 추가 (잠금 상태에서 호출)"""
+        job.scheduled_at = job.next_after(after)
+        run_at = job.scheduled_at + (random.uniform(0, job.jitter) if job.jitter else 0)
+        self._push(job, run_at)
+
+    def run_forever(self):
+        """
+        stop()이 호출되거나 Ctrl+C를 누를 때까지 작업 실행
+        """
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='health-job')
+        for job in self.jobs:
+            logging.info(f"⏰ 작업 등록: {job.name} ({job.describe()}, 다음 실행 "
+                         f"{datetime.fromtimestamp(job.scheduled_at).strftime('%Y-%m-%d %H:%M:%S')})")
+
+        try:
+            while True:
+                with self._condition:
+                    if self._stopped:
+                        break
+                    if not self._heap:
+                        self._condition.wait(MAX_WAIT_SECONDS)
+                        continue
+
+                    run_at, _, job = self._heap[0]
+                    delay = run_at - time.time()
+                    if delay > 0:
+                        # 다음 작업 시각까지 대기 (작업 추가/중지 시 즉시 깨어남)
+                        self._condition.wait(min(delay, MAX_WAIT_SECONDS))
+                        continue
+
+                    heapq.heappop(self._heap)
+                    self._dispatch(job, run_at)
+        except KeyboardInterrupt:
+            logging.info("스케줄러 중지 요청 (Ctrl+C)")
+        finally:
+            self._executor.shutdown(wait=False)
+            logging.info("스케줄러 종료")
+
+    def _dispatch(self, job: ScheduledJob, run_at: float):
+        """
+        예정 시각이 된 작업 실행 및 다음 실행 예약 (잠금 상태에서 호출)
+
+        Args:
+            job: 실행할 작업
+            run_at: 힙에 기록된 실행 시각
+        """
+        now = time.time()
+        late = now - run_at
+        self._schedule_next(job, now)
+
+        if late > job.misfire_grace:
+            if job.catch_up == CATCH_UP_SKIP:
+                job.skipped_count += 1
+                logging.warning(f"⏭️ {job.name}: 예정 시각보다 {late:.0f}초 늦어 이번 실행을 건너뜁니다.")
+                return
+            logging.warning(f"⏩ {job.name}: 예정 시각보다 {late:.0f}초 늦어 한 번만 바로 실행합니다.")
+
+        if job.running:
+            job.skipped_count += 1
+            logging.warning(f"⏭️ {job.name}: 이전 실행이 아직 진행 중이라 이번 실행을 건너뜁니다.")
+            return
+
+        job.running = True
+        self._executor.submit(self._run_job, job)
+
+    def _run_job(self, job: ScheduledJob):
+        """작업 스레드에서 작업 실행"""
+        started = time.monotonic()
+        try:
+            job.func()
+        except Exception as e:
+            logging.error(f"작업 실행 중 오류 ({job.name}): {e}")
+        finally:
+            job.last_duration = time.monotonic() - started
+            job.run_count += 1
+            job.running = False
+
+        if job.interval is not None and job.last_duration > job.interval:
+            logging.warning(f"⚠️ {job.name}: 실행 시간({job.last_duration:.1f}초)이 간격({job.interval:g}초)보다 깁니다.")
+
+    def stop(self):
+        """
+        스케줄러 중지 (실행 중인 작업은 끝날 때까지 계속 실행)
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()